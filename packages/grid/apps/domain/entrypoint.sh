@@ -1,3 +1,4 @@
 #!/bin/bash
-exec poetry run gunicorn --chdir ./src -k flask_sockets.worker --bind 0.0.0.0:$PORT  wsgi:app \
+# a single worker process, the FL cycle admission state is kept in its memory
+exec poetry run gunicorn --chdir ./src -k flask_sockets.worker --workers 1 --bind 0.0.0.0:$PORT  wsgi:app \
 "$@"
@@ -0,0 +1,180 @@
+"""
+Local load generator for the model-centric FL socket API.
+
+Simulates many concurrent FL workers, each of them authenticating, requesting
+a cycle and, once accepted, downloading the model and reporting a random diff
+of `--diff_size` bytes. Prints the throughput and the latency percentiles of
+every event.
+
+Run it against a domain started with the asyncio events server, e.g.
+
+    poetry run python src/__main__.py --start_local_db --events_port=5001
+    poetry run python scripts/fl_load_generator.py --url=ws://localhost:5001 \\
+        --workers=2000 --model=mnist --version=1.0
+
+or against the gevent route with --url=ws://localhost:5000 and --json.
+"""
+
+# stdlib
+import argparse
+import asyncio
+import base64
+import os
+import sys
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+
+# third party
+import websockets
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../src"))
+
+# third party
+from main.core.codes import CYCLE  # noqa: E402
+from main.core.codes import MODEL_CENTRIC_FL_EVENTS  # noqa: E402
+from main.core.codes import MSG_FIELD  # noqa: E402
+from main.events.frames import dump_message  # noqa: E402
+from main.events.frames import load_message  # noqa: E402
+
+parser = argparse.ArgumentParser(description="Load test PyGrid's FL socket API.")
+parser.add_argument("--url", type=str, default="ws://localhost:5001")
+parser.add_argument(
+    "--workers", type=int, default=1000, help="Number of simulated FL workers."
+)
+parser.add_argument(
+    "--connect_rate",
+    type=float,
+    default=500,
+    help="New connections per second, so the server isn't hit by a SYN flood.",
+)
+parser.add_argument("--model", type=str, default="mnist")
+parser.add_argument("--version", type=str, default=None)
+parser.add_argument("--auth_token", type=str, default=None)
+parser.add_argument("--diff_size", type=int, default=2 ** 20)
+parser.add_argument(
+    "--json",
+    action="store_true",
+    help="Send base64 diffs in text frames instead of binary frames.",
+)
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, event: str, latency: float, error: bool) -> None:
+        self.latencies.setdefault(event, []).append(latency)
+        if error:
+            self.errors[event] = self.errors.get(event, 0) + 1
+
+    def report(self, elapsed: float) -> None:
+        total = sum(len(latencies) for latencies in self.latencies.values())
+        print(f"{total} events in {elapsed:.1f}s, {total / elapsed:.0f} events/s")
+        for event, latencies in self.latencies.items():
+            latencies = sorted(latencies)
+            p50, p99 = (
+                latencies[int(q * (len(latencies) - 1))] * 1000 for q in (0.5, 0.99)
+            )
+            print(
+                f"  {event}: n={len(latencies)} errors={self.errors.get(event, 0)} "
+                f"p50={p50:.1f}ms p99={p99:.1f}ms max={latencies[-1] * 1000:.1f}ms"
+            )
+
+
+async def request(
+    websocket: Any, stats: Stats, event: str, data: Dict[str, Any]
+) -> Dict[str, Any]:
+    # bytes values go out in a binary frame, anything else as JSON
+    message = {MSG_FIELD.TYPE: event, MSG_FIELD.DATA: data}
+    start = time.perf_counter()
+    await websocket.send(dump_message(message))
+    response = load_message(await websocket.recv())
+    data = response.get(MSG_FIELD.DATA, response)
+    stats.add(event, time.perf_counter() - start, "error" in data)
+    return data
+
+
+async def simulate_worker(args: argparse.Namespace, stats: Stats, diff: Any) -> None:
+    async with websockets.connect(args.url, max_size=None, compression=None) as ws:
+        auth = await request(
+            ws,
+            stats,
+            MODEL_CENTRIC_FL_EVENTS.AUTHENTICATE,
+            {
+                "auth_token": args.auth_token,
+                "model_name": args.model,
+                "model_version": args.version,
+            },
+        )
+        worker_id = auth.get(MSG_FIELD.WORKER_ID)
+        if worker_id is None:
+            return
+
+        cycle = await request(
+            ws,
+            stats,
+            MODEL_CENTRIC_FL_EVENTS.CYCLE_REQUEST,
+            {
+                MSG_FIELD.WORKER_ID: worker_id,
+                MSG_FIELD.MODEL: args.model,
+                CYCLE.VERSION: args.version,
+                CYCLE.PING: 10,
+                CYCLE.DOWNLOAD: 100,
+                CYCLE.UPLOAD: 100,
+            },
+        )
+        if cycle.get(CYCLE.STATUS) != CYCLE.ACCEPTED:
+            return
+
+        if not args.json:
+            await request(
+                ws,
+                stats,
+                MODEL_CENTRIC_FL_EVENTS.GET_MODEL,
+                {
+                    MSG_FIELD.WORKER_ID: worker_id,
+                    CYCLE.KEY: cycle[CYCLE.KEY],
+                    MSG_FIELD.MODEL_ID: cycle[MSG_FIELD.MODEL_ID],
+                },
+            )
+
+        await request(
+            ws,
+            stats,
+            MODEL_CENTRIC_FL_EVENTS.REPORT,
+            {
+                MSG_FIELD.WORKER_ID: worker_id,
+                CYCLE.KEY: cycle[CYCLE.KEY],
+                CYCLE.DIFF: diff,
+            },
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    diff = os.urandom(args.diff_size)
+    if args.json:
+        diff = base64.b64encode(diff).decode()
+
+    stats = Stats()
+    failures: Dict[str, int] = {}
+    start = time.perf_counter()
+    tasks = []
+    for _ in range(args.workers):
+        tasks.append(asyncio.ensure_future(simulate_worker(args, stats, diff)))
+        await asyncio.sleep(1 / args.connect_rate)
+
+    for result in await asyncio.gather(*tasks, return_exceptions=True):
+        if isinstance(result, Exception):
+            failures[repr(result)] = failures.get(repr(result), 0) + 1
+
+    stats.report(time.perf_counter() - start)
+    print(f"{sum(failures.values())}/{args.workers} workers failed")
+    for failure, count in failures.items():
+        print(f"  {count}x {failure}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parser.parse_args()))
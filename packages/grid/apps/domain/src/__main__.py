@@ -42,6 +42,13 @@ parser.add_argument(
     default=os.environ.get("GRID_NODE_NAME", "OpenMined"),
 )
 
+parser.add_argument(
+    "--events_port",
+    type=int,
+    help="Port of the asyncio server of the model-centric FL socket API, e.g. --events_port=5001. Default is os.environ.get('GRID_NODE_EVENTS_PORT', None), i.e. disabled.",
+    default=os.environ.get("GRID_NODE_EVENTS_PORT", None),
+)
+
 parser.add_argument(
     "--start_local_db",
     dest="start_local_db",
@@ -57,6 +64,12 @@ if __name__ == "__main__":
     app = create_app(args)
     _address = "http://{}:{}".format(args.host, args.port)
 
+    if args.events_port:
+        # third party
+        from main.events.async_server import run_in_thread
+
+        run_in_thread(app, args.host, int(args.events_port))
+
     server = pywsgi.WSGIServer(
         (args.host, args.port), app, handler_class=WebSocketHandler
     )
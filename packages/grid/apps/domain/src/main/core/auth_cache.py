@@ -0,0 +1,124 @@
+"""Short lived caches of the authentication state of the domain users.
+
+Every authenticated REST call decodes its JWT and loads the user, and the
+services then resolve the user's role once per permission check. Instead of
+hitting the database each time we keep detached copies of those rows for
+`AUTH_CACHE_TTL` seconds, and a decoded token no longer than until it
+expires. The user and role managers invalidate the entries
+whenever they modify users or roles, the TTL bounds how long the other worker
+processes can serve a stale entry.
+"""
+
+# stdlib
+import os
+from threading import Lock
+import time
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+# third party
+from cachetools import TTLCache
+import jwt
+
+# grid relative
+from .database import BaseModel
+from .database import User
+
+AUTH_CACHE_TTL = float(os.environ.get("AUTH_CACHE_TTL", 30))
+AUTH_CACHE_SIZE = 4096
+
+token_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL)
+user_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL)
+role_cache: TTLCache = TTLCache(maxsize=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL)
+
+_lock = Lock()
+# bumped by every invalidation so a row loaded before an invalidation is not
+# stored after it
+_generation = 0
+
+
+def _detach(obj: Optional[BaseModel]) -> Optional[BaseModel]:
+    # a transient copy never triggers a lazy reload once its session commits
+    if not obj:
+        return obj
+    schema = type(obj)
+    return schema(**{c.name: getattr(obj, c.name) for c in schema.__table__.columns})
+
+
+def _cached(cache: TTLCache, key: Hashable, load: Callable[[], Any]) -> Any:
+    with _lock:
+        try:
+            return cache[key]
+        except KeyError:
+            generation = _generation
+
+    value = load()
+    if value is not None and value is not False:
+        with _lock:
+            if generation == _generation:
+                cache[key] = value
+    return value
+
+
+def _decode(token: str, secret: str) -> Tuple[Any, Optional[float]]:
+    payload = jwt.decode(token, secret, algorithms="HS256")
+    return payload["id"], payload.get("exp")
+
+
+def decode_token(token: str, secret: str) -> Any:
+    """Return the user id carried by a JWT, decoding each token only once
+    until it expires."""
+    key = (token, secret)
+    user_id, expires = _cached(token_cache, key, lambda: _decode(token, secret))
+    if expires is not None and time.time() >= expires:
+        with _lock:
+            token_cache.pop(key, None)
+        # raises jwt.ExpiredSignatureError
+        user_id, _ = _decode(token, secret)
+    return user_id
+
+
+def get_user(user_id: Any, load: Callable[[], Optional[User]]) -> Optional[User]:
+    """Return a detached copy of the user, calling `load` on a cache miss."""
+    return _cached(user_cache, str(user_id), lambda: _detach(load()))
+
+
+def get_role(user_id: Any, load: Callable[[], Any]) -> Any:
+    """Return a detached copy of the user's role, calling `load` on a cache
+    miss."""
+    return _cached(role_cache, str(user_id), lambda: _detach(load()))
+
+
+def invalidate_user(user_id: Any) -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        user_cache.pop(str(user_id), None)
+        role_cache.pop(str(user_id), None)
+
+
+def invalidate_users() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        user_cache.clear()
+        role_cache.clear()
+
+
+def invalidate_roles() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        role_cache.clear()
+
+
+def clear_auth_cache() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        token_cache.clear()
+        user_cache.clear()
+        role_cache.clear()
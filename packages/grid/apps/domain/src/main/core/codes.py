@@ -22,6 +22,7 @@ class MODEL_CENTRIC_FL_EVENTS(object):
     REPORT = "model-centric/report"
     AUTHENTICATE = "model-centric/authenticate"
     CYCLE_REQUEST = "model-centric/cycle-request"
+    GET_MODEL = "model-centric/get-model"
 
 
 class USER_EVENTS(object):
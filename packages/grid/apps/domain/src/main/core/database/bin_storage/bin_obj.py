@@ -39,7 +39,10 @@ class ObjectMetadata(BaseModel):
     __tablename__ = "obj_metadata"
 
     id = db.Column(db.Integer(), primary_key=True, autoincrement=True)
-    obj = db.Column(db.Integer, db.ForeignKey("bin_object.id"))
+    obj = db.Column(db.Integer, db.ForeignKey("bin_object.id"), index=True)
+    # fully qualified name of the type of the stored object, so listings can
+    # filter by type without loading any binary
+    obj_type = db.Column(db.String(256), index=True)
     tags = db.Column(db.JSON())
     description = db.Column(db.String())
     read_permissions = db.Column(db.JSON())
@@ -1,18 +1,26 @@
 # stdlib
+from typing import Any
 from typing import Iterable
 from typing import KeysView
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 from typing import ValuesView
 
 # third party
 from flask import current_app as app
 from nacl.encoding import HexEncoder
 from nacl.signing import VerifyKey
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import text
 import syft
 from syft.core.common.group import VERIFYALL
 from syft.core.common.uid import UID
 from syft.core.store import ObjectStore
 from syft.core.store.storeable_object import StorableObject
+from syft.util import get_subclasses
 from torch import Tensor
 
 # grid relative
@@ -30,6 +38,35 @@ def create_storable(
     return obj
 
 
+def type_name(obj_type: type) -> str:
+    return f"{obj_type.__module__}.{obj_type.__qualname__}"
+
+
+def type_names(obj_type: type) -> Set[str]:
+    """Names of `obj_type` and of all its subclasses, to match isinstance."""
+    return {type_name(t) for t in [obj_type] + get_subclasses(obj_type)}
+
+
+def migrate_obj_types(db) -> None:
+    """Add the obj_type column to an obj_metadata table created before it, and
+    fill it in for the rows which don't have it yet."""
+    columns = {c["name"] for c in inspect(db.engine).get_columns("obj_metadata")}
+    with db.engine.begin() as connection:
+        if "obj_type" not in columns:
+            connection.execute(
+                text("ALTER TABLE obj_metadata ADD COLUMN obj_type VARCHAR(256)")
+            )
+        # create_all doesn't add indexes to the tables which already exist
+        for column in ("obj", "obj_type"):
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_obj_metadata_{column} "
+                    f"ON obj_metadata ({column})"
+                )
+            )
+    DiskObjectStore(db)._untyped_objects()
+
+
 def storable_to_dict(storable_obj: StorableObject) -> dict:
     _dict = {}
     _dict["tags"] = storable_obj.tags
@@ -44,6 +81,7 @@ def storable_to_dict(storable_obj: StorableObject) -> dict:
 
 class DiskObjectStore(ObjectStore):
     def __init__(self, db):
+        super().__init__()
         self.db = db
 
     def get_object(self, key: UID) -> Optional[StorableObject]:
@@ -53,13 +91,46 @@ class DiskObjectStore(ObjectStore):
             return None
 
     def get_objects_of_type(self, obj_type: type) -> Iterable[StorableObject]:
-        return [obj for obj in self.values() if isinstance(obj.data, obj_type)]
+        query = self._query_objects(obj_type)
+        objects = [
+            self._to_storable(bin_obj, metadata)
+            for bin_obj, metadata in query
+            if metadata.obj_type is not None
+        ]
+        for bin_obj, metadata, data in self._untyped_objects():
+            if isinstance(data, obj_type):
+                objects.append(self._to_storable(bin_obj, metadata, data=data))
+        return objects
+
+    def get_metadata_of_type(self, obj_type: type) -> List[ObjectMetadata]:
+        """Metadata rows of the objects of a type, without reading any binary.
+
+        Args:
+            obj_type: type of the objects, subclasses match too.
+        Returns:
+            metadata: the ObjectMetadata rows, `obj` holds the object id.
+        """
+        query = self.db.session.query(ObjectMetadata)
+        if obj_type is object:
+            return query.all()
+        query = query.filter(ObjectMetadata.obj_type.in_(type_names(obj_type)))
+        return query.all() + [
+            metadata
+            for _, metadata, data in self._untyped_objects()
+            if isinstance(data, obj_type)
+        ]
 
     def __sizeof__(self) -> int:
-        return self.values().__sizeof__()
+        size = self.db.session.query(func.sum(func.length(BinObject.binary))).scalar()
+        return size or 0
 
     def __str__(self) -> str:
-        return str(self.values())
+        return str(
+            {
+                metadata.obj: metadata.obj_type
+                for metadata in self.get_metadata_of_type(object)
+            }
+        )
 
     def __len__(self) -> int:
         return self.db.session.query(ObjectMetadata).count()
@@ -70,11 +141,7 @@ class DiskObjectStore(ObjectStore):
         return keys
 
     def values(self) -> ValuesView[StorableObject]:
-        obj_keys = self.keys()
-        values = []
-        for key in obj_keys:
-            values.append(self.__getitem__(key))
-        return values
+        return self.get_objects_of_type(object)
 
     def __contains__(self, key: UID) -> bool:
         return (
@@ -91,6 +158,37 @@ class DiskObjectStore(ObjectStore):
         if not bin_obj or not obj_metadata:
             raise Exception("Object not found!")
 
+        return self._to_storable(bin_obj, obj_metadata)
+
+    def _query_objects(self, obj_type: type):
+        # one query for the objects and their metadata instead of two per object
+        query = self.db.session.query(BinObject, ObjectMetadata).join(
+            ObjectMetadata, ObjectMetadata.obj == BinObject.id
+        )
+        if obj_type is not object:
+            query = query.filter(ObjectMetadata.obj_type.in_(type_names(obj_type)))
+        return query
+
+    def _untyped_objects(self) -> List[Tuple[BinObject, ObjectMetadata, Any]]:
+        """The objects stored before obj_type existed, deserialized to find
+        their type, which is then saved so it's only done once."""
+        query = (
+            self.db.session.query(BinObject, ObjectMetadata)
+            .join(ObjectMetadata, ObjectMetadata.obj == BinObject.id)
+            .filter(ObjectMetadata.obj_type.is_(None))
+        )
+        untyped = []
+        for bin_obj, metadata in query.all():
+            data = bin_obj.object
+            metadata.obj_type = type_name(type(data))
+            untyped.append((bin_obj, metadata, data))
+        if untyped:
+            self.db.session.commit()
+        return untyped
+
+    def _to_storable(
+        self, bin_obj: BinObject, obj_metadata: ObjectMetadata, data: Any = None
+    ) -> StorableObject:
         read_permissions = {
             VerifyKey(key.encode("utf-8"), encoder=HexEncoder): value
             for key, value in obj_metadata.read_permissions.items()
@@ -98,7 +196,7 @@ class DiskObjectStore(ObjectStore):
 
         obj = StorableObject(
             id=UID.from_string(bin_obj.id),
-            data=bin_obj.object,
+            data=bin_obj.object if data is None else data,
             description=obj_metadata.description,
             tags=obj_metadata.tags,
             read_permissions=read_permissions,
@@ -112,6 +210,7 @@ class DiskObjectStore(ObjectStore):
         metadata_dict = storable_to_dict(value)
         metadata_obj = ObjectMetadata(
             obj=bin_obj.id,
+            obj_type=type_name(type(value.data)),
             tags=metadata_dict["tags"],
             description=metadata_dict["description"],
             read_permissions=metadata_dict["read_permissions"],
@@ -1,21 +1,32 @@
 # stdlib
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-import csv
+from io import BytesIO
 from io import StringIO
+import multiprocessing
+import os
 import tarfile
+from typing import BinaryIO
+from typing import Deque
 from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Union
 
 # third party
 from nacl.encoding import HexEncoder
-from nacl.signing import SigningKey
+from nacl.signing import VerifyKey
 import numpy as np
 import pandas as pd
 from pandas import DataFrame
+from syft import deserialize
+from syft import serialize
 from syft.core.common.group import VERIFYALL
 from syft.core.common.group import VerifyAll
 from syft.core.common.uid import UID
-from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.pki.key_cache import get_signing_key
 from syft.core.store.storeable_object import StorableObject
 import torch as th
 
@@ -23,18 +34,38 @@ import torch as th
 from ..database import db
 from ..database.bin_storage.bin_obj import BinObject
 from ..database.bin_storage.bin_obj import ObjectMetadata
+from ..database.bin_storage.bin_obj import bin_to_proto
 from ..database.bin_storage.json_obj import JsonObject
 from ..database.bin_storage.metadata import get_metadata
 from ..database.dataset.datasetgroup import BinObjDataset
 from ..database.dataset.datasetgroup import Dataset
 from ..database.dataset.datasetgroup import DatasetGroup
 from ..database.store_disk import DiskObjectStore
+from ..database.store_disk import type_name
 from ..database.utils import model_to_json
 
+try:
+    # third party
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+# rows parsed at once by the pandas fallback and bytes per pyarrow CSV block
+CSV_CHUNK_ROWS = 65536
+CSV_BLOCK_SIZE = 1 << 24
+# worker processes used to parse the members of an uploaded archive, the
+# members are parsed in the request's own process by default
+INGEST_WORKERS = int(os.environ.get("DATASET_INGEST_WORKERS", 1))
+# the largest member copied to a worker, larger ones are streamed in place
+INGEST_MEMBER_BYTES = int(os.environ.get("DATASET_INGEST_MEMBER_BYTES", 64 << 20))
+
 
 def decompress(file_obj):
-    tar_obj = tarfile.open(fileobj=file_obj)
-    tar_obj.extractall()
+    # members are read straight from the archive, nothing is written to disk
+    tar_obj = tarfile.open(fileobj=file_obj, mode="r:*")
+    # an opened archive only knows its first member until the index is read
+    tar_obj.getmembers()
     return tar_obj
 
 
@@ -43,7 +74,7 @@ def extract_metadata_info(tar_obj):
     manifest = ""
     description = ""
     skip_files = []
-    for file_obj in tar_obj.members:
+    for file_obj in tar_obj.getmembers():
         if "tags" in file_obj.name:
             tags = tar_obj.extractfile(file_obj.name).read().decode().split("\n")[:-1]
             skip_files.append(file_obj.name)
@@ -57,66 +88,195 @@ def extract_metadata_info(tar_obj):
     return tags, manifest, description, skip_files
 
 
-def process_items(node, tar_obj, user_key):
-    # Optional fields
-    tags, manifest, description, skip_files = extract_metadata_info(tar_obj)
-
-    dataset_db = Dataset(
-        id=str(UID().value), manifest=manifest, description=description, tags=tags
-    )
-    db.session.add(dataset_db)
-    data = list()
-    for item in tar_obj.members:
-        if not item.isdir() and (not item.name in skip_files):
-            reader = csv.reader(
-                tar_obj.extractfile(item.name).read().decode().split("\n"),
-                delimiter=",",
+def read_csv_array(stream: BinaryIO) -> np.ndarray:
+    """Parse a header-less numeric CSV stream into a float32 array.
+
+    The stream is parsed block by block (with pyarrow's CSV reader when it is
+    available), so the decoded text of the file is never held in memory.
+    """
+    chunks = []
+    if pacsv is not None:
+        n_columns = len(stream.readline().split(b","))
+        stream.seek(0)
+        names = [f"f{i}" for i in range(n_columns)]
+        reader = pacsv.open_csv(
+            stream,
+            read_options=pacsv.ReadOptions(
+                column_names=names, block_size=CSV_BLOCK_SIZE
+            ),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.float32() for name in names}
+            ),
+        )
+        for batch in reader:
+            chunks.append(
+                np.column_stack([column.to_numpy() for column in batch.columns])
             )
+    else:
+        for chunk in pd.read_csv(
+            stream, header=None, dtype=np.float32, chunksize=CSV_CHUNK_ROWS
+        ):
+            chunks.append(chunk.to_numpy())
+
+    if not chunks:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def ingest_member(name: str, stream: Union[bytes, BinaryIO]) -> dict:
+    """Parse a CSV member and serialize it into a `bin_object` row.
+
+    Runs in the ingestion worker processes, only the serialized tensor goes
+    back to the parent process.
+    """
+    if isinstance(stream, bytes):
+        stream = BytesIO(stream)
+
+    tensor = th.from_numpy(read_csv_array(stream))
+    proto = serialize(tensor)
+    return {
+        "name": name,
+        "binary": proto.SerializeToString(),
+        "protobuf_name": proto.__class__.__name__,
+        "dtype": tensor.__class__.__name__,
+        "shape": str(tuple(tensor.shape)),
+    }
+
+
+def ingest_members(tar_obj, members: List[tarfile.TarInfo], workers: int):
+    """Yield the ingested members of the archive in order.
+
+    With more than one worker the members are parsed by a pool of spawned
+    worker processes (a fork would copy the whole server into each). The
+    archive is read sequentially and at most two members per worker are in
+    flight at any time. Members larger than INGEST_MEMBER_BYTES aren't read
+    into memory to be sent to a worker, they are streamed from the archive
+    and parsed here, so the memory held by the members in flight is bounded.
+    """
+    if workers <= 1 or len(members) <= 1:
+        for item in members:
+            yield ingest_member(item.name, tar_obj.extractfile(item))
+        return
 
-            dataset = []
-
-            for row in reader:
-                if len(row) != 0:
-                    dataset.append(row)
-            dataset = np.array(dataset, dtype=np.float)
-            df = th.tensor(dataset, dtype=th.float32)
-            id_at_location = UID()
-
-            # Step 2: create message which contains object to send
-            storable = StorableObject(
-                id=id_at_location,
-                data=df,
-                tags=tags + ["#" + item.name.split("/")[-1]],
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending: Deque[Union[Future, dict]] = deque()
+        for item in members:
+            if len(pending) >= 2 * workers:
+                yield _ingested(pending.popleft())
+            stream = tar_obj.extractfile(item)
+            if item.size > INGEST_MEMBER_BYTES:
+                pending.append(ingest_member(item.name, stream))
+            else:
+                pending.append(pool.submit(ingest_member, item.name, stream.read()))
+
+        while pending:
+            yield _ingested(pending.popleft())
+
+
+def _ingested(pending: Union[Future, dict]) -> dict:
+    return pending.result() if isinstance(pending, Future) else pending
+
+
+def store_ingested(node, rows: List[dict], user_key: str) -> None:
+    """Add the ingested objects to the node store as one batch, the caller
+    commits."""
+    read_permissions = {
+        node.verify_key.encode(encoder=HexEncoder).decode("utf-8"): None,
+        get_signing_key(user_key)
+        .verify_key.encode(encoder=HexEncoder)
+        .decode("utf-8"): None,
+    }
+
+    if not isinstance(node.store, DiskObjectStore):
+        for row in rows:
+            proto = bin_to_proto[row["protobuf_name"]]()
+            proto.ParseFromString(row["binary"])
+            node.store[UID.from_string(row["id"])] = StorableObject(
+                id=UID.from_string(row["id"]),
+                data=deserialize(blob=proto),
+                tags=row["tags"],
+                read_permissions={
+                    VerifyKey(key.encode("utf-8"), encoder=HexEncoder): None
+                    for key in read_permissions
+                },
                 search_permissions={VERIFYALL: None},
             )
+        return
 
-            obj_msg = SaveObjectAction(obj=storable, address=node.address)
+    db.session.bulk_insert_mappings(
+        BinObject,
+        [
+            {
+                "id": row["id"],
+                "binary": row["binary"],
+                "protobuf_name": row["protobuf_name"],
+            }
+            for row in rows
+        ],
+    )
+    db.session.bulk_insert_mappings(
+        ObjectMetadata,
+        [
+            {
+                "obj": row["id"],
+                "obj_type": type_name(th.Tensor),
+                "tags": row["tags"],
+                "description": "",
+                "read_permissions": read_permissions,
+                "search_permissions": {},
+            }
+            for row in rows
+        ],
+    )
 
-            signed_message = obj_msg.sign(
-                signing_key=SigningKey(user_key.encode("utf-8"), encoder=HexEncoder)
-            )
 
-            node.recv_immediate_msg_without_reply(msg=signed_message)
+def process_items(node, tar_obj, user_key, workers: int = INGEST_WORKERS):
+    # Optional fields
+    tags, manifest, description, skip_files = extract_metadata_info(tar_obj)
 
-            obj_dataset_relation = BinObjDataset(
-                name=item.name,
-                dataset=dataset_db.id,
-                obj=str(id_at_location.value),
-                dtype=df.__class__.__name__,
-                shape=str(tuple(df.shape)),
-            )
-            db.session.add(obj_dataset_relation)
-            data.append(
-                {
-                    "name": obj_dataset_relation.name,
-                    "id": str(id_at_location.value),
-                    "tags": tags + ["#" + item.name.split("/")[-1]],
-                    "dtype": obj_dataset_relation.dtype,
-                    "shape": obj_dataset_relation.shape,
-                }
-            )
+    dataset_db = Dataset(
+        id=str(UID().value), manifest=manifest, description=description, tags=tags
+    )
+    db.session.add(dataset_db)
 
+    members = [
+        item
+        for item in tar_obj.getmembers()
+        if item.isfile() and item.name not in skip_files
+    ]
+    rows = []
+    for row in ingest_members(tar_obj, members, workers):
+        row["id"] = str(UID().value)
+        row["tags"] = tags + ["#" + row["name"].split("/")[-1]]
+        rows.append(row)
+
+    store_ingested(node, rows, user_key)
+    db.session.bulk_insert_mappings(
+        BinObjDataset,
+        [
+            {
+                "name": row["name"],
+                "dataset": dataset_db.id,
+                "obj": row["id"],
+                "dtype": row["dtype"],
+                "shape": row["shape"],
+            }
+            for row in rows
+        ],
+    )
     db.session.commit()
+
+    data = [
+        {
+            "name": row["name"],
+            "id": row["id"],
+            "tags": row["tags"],
+            "dtype": row["dtype"],
+            "shape": row["shape"],
+        }
+        for row in rows
+    ]
     ds = model_to_json(dataset_db)
     ds["data"] = data
     return ds
@@ -191,8 +351,7 @@ def get_specific_dataset_and_relations(key):
 
 
 def get_all_datasets_metadata():
-    ids = db.session.query(JsonObject.id).all()
-    return [get_dataset_metadata(key) for key in ids]
+    return [binary for (binary,) in db.session.query(JsonObject.binary).all()]
 
 
 def update_dataset_metadata(key: str, **kwargs) -> None:
@@ -172,3 +172,16 @@ class AppInSleepyMode(PyGridError):
                 "This app is in sleep mode. Please undergo the initial setup first"
             )
         super().__init__(message)
+
+
+class TensorNotFoundError(PyGridError):
+    def __init__(self):
+        message = "Tensor ID not found!"
+        super().__init__(message)
+
+
+class InvalidTensorError(PyGridError):
+    def __init__(self, message=""):
+        if not message:
+            message = "Invalid binary tensor!"
+        super().__init__(message)
@@ -3,6 +3,7 @@ from typing import List
 from typing import Union
 
 # grid relative
+from .. import auth_cache
 from ..database.roles.roles import Role
 from ..exceptions import RoleNotFoundError
 from .database_manager import DatabaseManager
@@ -60,6 +61,14 @@ class RoleManager(DatabaseManager):
             raise RoleNotFoundError
         return results
 
+    def modify(self, query, values):
+        super().modify(query, values)
+        auth_cache.invalidate_roles()
+
+    def delete(self, **kwargs):
+        super().delete(**kwargs)
+        auth_cache.invalidate_roles()
+
     def set(self, role_id, params):
         if self.contain(id=role_id):
             self.modify({"id": role_id}, params)
@@ -9,6 +9,7 @@ from bcrypt import gensalt
 from bcrypt import hashpw
 
 # grid relative
+from .. import auth_cache
 from ..database.users.user import User
 from ..exceptions import AuthorizationError
 from ..exceptions import InvalidCredentialsError
@@ -94,6 +95,17 @@ class UserManager(DatabaseManager):
 
         self.modify({"id": user_id}, {key: value})
 
+    def modify(self, query, values):
+        super().modify(query, values)
+        if "id" in query:
+            auth_cache.invalidate_user(query["id"])
+        else:
+            auth_cache.invalidate_users()
+
+    def delete(self, **kwargs):
+        super().delete(**kwargs)
+        auth_cache.invalidate_users()
+
     def can_create_users(self, user_id: str) -> bool:
         role = self.role(user_id=user_id)
         if role:
@@ -121,6 +133,9 @@ class UserManager(DatabaseManager):
         return self.role(user_id=user_id).can_create_groups
 
     def role(self, user_id: int):
+        return auth_cache.get_role(user_id, lambda: self.__load_role(user_id))
+
+    def __load_role(self, user_id: int):
         try:
             user = self.first(id=user_id)
             return self.roles.first(id=user.role)
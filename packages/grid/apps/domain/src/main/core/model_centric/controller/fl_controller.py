@@ -1,17 +1,15 @@
 # stdlib
 from datetime import datetime
 import hashlib
-import logging
 import uuid
 
 # grid relative
 from ...codes import CYCLE
 from ...codes import MSG_FIELD
-from ...exceptions import ProtocolNotFoundError
+from ..cycles import cycle_admission
 from ..cycles import cycle_manager
 from ..models import model_manager
 from ..processes import process_manager
-from ..workers import worker_manager
 
 
 class FLController:
@@ -77,101 +75,43 @@ class FLController:
         Return:
             last_participation: Index of the last cycle assigned to this worker.
         """
-        process = process_manager.first(name=name, version=version)
-        return cycle_manager.last_participation(process, worker_id)
+        return cycle_admission.last_participation(name, version, worker_id)
 
-    def assign(self, name: str, version: str, worker, last_participation: int):
+    def assign(self, name: str, version: str, worker_id: str, last_participation: int):
         """Assign a new worker the specified federated training worker cycle
         Args:
             name: Federated learning process name.
             version: Federated learning process version.
-            worker: Worker Object.
+            worker_id: Worker's ID.
             last_participation: The last time that this worker worked on this fl process.
         Return:
             last_participation: Index of the last cycle assigned to this worker.
         """
-        _accepted = False
-
-        if version:
-            _fl_process = process_manager.first(name=name, version=version)
-        else:
-            _fl_process = process_manager.last(name=name)
-
-        server_config, client_config = process_manager.get_configs(
-            name=name, version=version
-        )
-
-        # Retrieve the last cycle used by this fl process/ version
-        _cycle = cycle_manager.last(_fl_process.id, None)
-
-        # Check if already exists a relation between the worker and the cycle.
-        _assigned = cycle_manager.is_assigned(worker.id, _cycle.id)
-        logging.info(
-            f"Worker {worker.id} is already assigned to cycle {_cycle.id}: {_assigned}"
-        )
-
-        # Check bandwidth
-        _comp_bandwidth = worker_manager.is_eligible(worker.id, server_config)
-
-        # Check if the current worker is allowed to join into this cycle
-        _allowed = True
-
         # TODO wire intelligence
         # (
         #     last_participation + server.config["do_not_reuse_workers_until_cycle"]
         #     >= _cycle.sequence
         # )
-        n_completed_cycles = cycle_manager.count(
-            fl_process_id=_fl_process.id, is_completed=True
-        )
-
-        _max_cycles = server_config["num_cycles"]
-
-        _accepted = (
-            (not _assigned)
-            and _comp_bandwidth
-            and _allowed
-            and n_completed_cycles < _max_cycles
-        )
-        logging.info(f"Worker is accepted: {_accepted}")
+        key = self._generate_hash_key(uuid.uuid4().hex)
+        _accepted, _cycle = cycle_admission.admit(name, version, worker_id, key)
 
         if _accepted:
-            # Assign
-            # 1 - Generate new request key
-            # 2 - Assign the worker with the cycle.
-            key = self._generate_hash_key(uuid.uuid4().hex)
-            _worker_cycle = cycle_manager.assign(worker, _cycle, key)
-
-            # Create a plan dictionary
-            _plans = process_manager.get_plans(
-                fl_process_id=_fl_process.id, is_avg_plan=False
-            )
-
-            # Create a protocol dictionary
-            try:
-                _protocols = process_manager.get_protocols(fl_process_id=_fl_process.id)
-            except ProtocolNotFoundError:
-                # Protocols are optional
-                _protocols = {}
-
-            # Get model ID
-            _model = model_manager.get(fl_process_id=_fl_process.id)
             return {
                 CYCLE.STATUS: "accepted",
-                CYCLE.KEY: _worker_cycle.request_key,
+                CYCLE.KEY: key,
                 CYCLE.VERSION: _cycle.version,
                 MSG_FIELD.MODEL: name,
-                CYCLE.PLANS: _plans,
-                CYCLE.PROTOCOLS: _protocols,
-                CYCLE.CLIENT_CONFIG: client_config,
-                MSG_FIELD.MODEL_ID: _model.id,
+                CYCLE.PLANS: _cycle.plans,
+                CYCLE.PROTOCOLS: _cycle.protocols,
+                CYCLE.CLIENT_CONFIG: _cycle.client_config,
+                MSG_FIELD.MODEL_ID: _cycle.model_id,
             }
         else:
 
             response = {CYCLE.STATUS: "rejected"}
 
             # If it's not the last cycle, add the remaining time to the next cycle.
-            if n_completed_cycles < _max_cycles:
+            if _cycle.n_completed_cycles < _cycle.server_config["num_cycles"]:
                 remaining = _cycle.end - datetime.now()
                 response[CYCLE.TIMEOUT] = str(remaining)
 
@@ -197,4 +137,6 @@ class FLController:
         Raises:
             ProcessLookupError : If Not found any relation between the worker/cycle.
         """
+        # The worker cycle may still be buffered by the admission layer
+        cycle_admission.persist(request_key)
         return cycle_manager.submit_worker_diff(worker_id, request_key, diff)
@@ -1,5 +1,7 @@
 # grid relative
 from ...database import db
+from .admission import CycleAdmission
 from .cycle_manager import CycleManager
 
 cycle_manager = CycleManager(db)
+cycle_admission = CycleAdmission(cycle_manager)
@@ -0,0 +1,400 @@
+# stdlib
+from datetime import datetime
+import logging
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# grid relative
+from ...exceptions import CycleNotFoundError
+from ...exceptions import ProtocolNotFoundError
+from ...exceptions import WorkerNotFoundError
+from ..models import model_manager
+from ..processes import process_manager
+from ..tasks.cycle import run_task_once
+from ..workers.worker import Worker
+from .worker_cycle import WorkerCycle
+
+WORKER_SPEED_FIELDS = ("ping", "avg_download", "avg_upload")
+
+
+class ActiveCycle:
+    """In-memory snapshot of the open cycle of a FL process.
+
+    Holds everything that is needed to answer a cycle request (configs,
+    plans, protocols, model id) plus the workers already assigned to the
+    cycle, so that admission never has to go back to the database.
+    """
+
+    def __init__(
+        self,
+        fl_process_id: int,
+        cycle: Any,
+        server_config: dict,
+        client_config: dict,
+        plans: dict,
+        protocols: dict,
+        model_id: int,
+        n_completed_cycles: int,
+        assigned: Dict[str, str],
+    ):
+        self.fl_process_id = fl_process_id
+        self.cycle_id = cycle.id
+        self.sequence = cycle.sequence
+        self.version = cycle.version
+        self.end = cycle.end
+        self.server_config = server_config
+        self.client_config = client_config
+        self.plans = plans
+        self.protocols = protocols
+        self.model_id = model_id
+        self.n_completed_cycles = n_completed_cycles
+
+        # worker_id -> request_key
+        self.assigned = assigned
+
+    def __str__(self):
+        return (
+            f"<ActiveCycle id: {self.cycle_id}, fl_process_id: {self.fl_process_id}, "
+            f"assigned: {len(self.assigned)}>"
+        )
+
+
+class CycleAdmission:
+    """Admission layer for `/cycle-request` and `/report` calls.
+
+    Active cycles, assignments, request keys, worker participation and
+    worker bandwidth stats are indexed in memory. New worker cycles and
+    worker stats are buffered and written to the database in batches,
+    either when `max_pending` rows are queued or every `flush_interval`
+    seconds, so a cycle request is answered without any DB round trip
+    once the process it targets has been loaded.
+
+    All of this state lives in the memory of one process, so the domain must
+    be served by a single worker process (see entrypoint.sh): another one
+    would admit workers against its own, stale, snapshot of the cycles.
+    Concurrency comes from the threads of that worker instead.
+    """
+
+    def __init__(self, cycle_manager, flush_interval: float = 1.0, max_pending=256):
+        self.cycle_manager = cycle_manager
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._lock = threading.RLock()
+
+        # (name, version) -> fl_process_id
+        self._processes: Dict[Tuple[str, Optional[str]], int] = {}
+        # fl_process_id -> open cycle
+        self._cycles: Dict[int, ActiveCycle] = {}
+        # request_key -> (worker_id, cycle_id)
+        self._keys: Dict[str, Tuple[str, int]] = {}
+        # fl_process_id -> {worker_id: last cycle sequence}
+        self._participation: Dict[int, Dict[str, int]] = {}
+        # worker_id -> {field: value}
+        self._workers: Dict[str, Dict[str, Optional[float]]] = {}
+
+        self._pending_cycles: List[dict] = []
+        self._pending_workers: Dict[str, Dict[str, float]] = {}
+        self._pending_keys: set = set()
+        self._last_flush = time.monotonic()
+
+        cycle_manager.subscribe(self.invalidate)
+        process_manager.subscribe(self.forget_process)
+
+    def register_worker(self, worker_id: str) -> None:
+        """Index a freshly created worker.
+
+        Args:
+            worker_id: Worker's ID.
+        """
+        with self._lock:
+            self._workers[worker_id] = {field: None for field in WORKER_SPEED_FIELDS}
+
+    def update_worker(self, worker_id: str, **stats: float) -> None:
+        """Record the connection speed reported by a worker.
+
+        Args:
+            worker_id: Worker's ID.
+            stats: Values for any of `ping`, `avg_download` and `avg_upload`.
+        Raises:
+            WorkerNotFoundError (PyGridError) : If the worker is not registered.
+        """
+        with self._lock:
+            worker = self._get_worker(worker_id)
+            if stats:
+                worker.update(stats)
+                self._pending_workers.setdefault(worker_id, {}).update(stats)
+        self._maybe_flush()
+
+    def server_config(self, name: str, version: Optional[str]) -> dict:
+        """Retrieve the server config of a FL process with an open cycle.
+
+        Args:
+            name: Federated Learning Process Name.
+            version: Model's version.
+        Returns:
+            server_config: FL Process Server Config.
+        """
+        with self._lock:
+            return self._active_cycle(name, version).server_config
+
+    def last_participation(
+        self, name: str, version: Optional[str], worker_id: str
+    ) -> int:
+        """Retrieve the sequence of the last cycle this worker took part in.
+
+        Args:
+            name: Federated Learning Process Name.
+            version: Model's version.
+            worker_id: Worker's ID.
+        Returns:
+            last_participation: last cycle sequence, 0 if never assigned.
+        """
+        with self._lock:
+            active = self._active_cycle(name, version)
+            return self._participation[active.fl_process_id].get(worker_id, 0)
+
+    def admit(
+        self, name: str, version: Optional[str], worker_id: str, request_key: str
+    ) -> Tuple[bool, ActiveCycle]:
+        """Try to assign a worker to the open cycle of a FL process.
+
+        Args:
+            name: Federated learning process name.
+            version: Federated learning process version.
+            worker_id: Worker's ID.
+            request_key: Key handed to the worker if it gets accepted.
+        Returns:
+            (accepted, cycle): Admission flag and the open cycle snapshot.
+        Raises:
+            CycleNotFoundError (PyGridError) : If the process has no open cycle.
+            WorkerNotFoundError (PyGridError) : If the worker is not registered.
+        """
+        with self._lock:
+            active = self._active_cycle(name, version)
+            worker = self._get_worker(worker_id)
+
+            server_config = active.server_config
+            _assigned = worker_id in active.assigned
+            _comp_bandwidth = (
+                "minimum_upload_speed" not in server_config
+                or (worker["avg_upload"] or 0) >= server_config["minimum_upload_speed"]
+            ) and (
+                "minimum_download_speed" not in server_config
+                or (worker["avg_download"] or 0)
+                >= server_config["minimum_download_speed"]
+            )
+            _accepted = (
+                (not _assigned)
+                and _comp_bandwidth
+                and active.n_completed_cycles < server_config["num_cycles"]
+            )
+            logging.info(
+                f"Worker {worker_id} admission to cycle {active.cycle_id}: "
+                f"assigned={_assigned}, bandwidth={_comp_bandwidth}, accepted={_accepted}"
+            )
+
+            if _accepted:
+                active.assigned[worker_id] = request_key
+                self._keys[request_key] = (worker_id, active.cycle_id)
+                self._participation[active.fl_process_id][worker_id] = active.sequence
+                self._pending_cycles.append(
+                    {
+                        "worker_id": worker_id,
+                        "cycle_id": active.cycle_id,
+                        "request_key": request_key,
+                        "started_at": datetime.utcnow(),
+                        "is_completed": False,
+                    }
+                )
+                self._pending_keys.add(request_key)
+
+        self._maybe_flush()
+        return _accepted, active
+
+    def validate(self, worker_id: str, fl_process_id: int, request_key: str) -> bool:
+        """Validate a worker's request key against the open cycle of a process.
+
+        Args:
+            worker_id: Worker's ID.
+            fl_process_id: FL Process's ID.
+            request_key: Worker's request key.
+        Returns:
+            result: Boolean flag
+        Raises:
+            CycleNotFoundError (PyGridError) : If the worker is not assigned to the open cycle.
+        """
+        with self._lock:
+            active = self._cycles.get(fl_process_id)
+            if active is None:
+                active = self._load(fl_process_id)
+
+            if worker_id not in active.assigned:
+                raise CycleNotFoundError
+
+            return self._keys.get(request_key) == (worker_id, active.cycle_id)
+
+    def persist(self, request_key: str) -> None:
+        """Make sure the worker cycle behind `request_key` has been written.
+
+        Args:
+            request_key: Worker's request key.
+        """
+        with self._lock:
+            pending = request_key in self._pending_keys
+        if pending:
+            self.flush()
+
+    def invalidate(self, fl_process_id: int) -> None:
+        """Drop the snapshot of a process whose cycle was closed or created.
+
+        Args:
+            fl_process_id: FL Process's ID.
+        """
+        with self._lock:
+            active = self._cycles.pop(fl_process_id, None)
+            if active is not None:
+                for key in active.assigned.values():
+                    self._keys.pop(key, None)
+
+    def forget_process(self, name: Optional[str]) -> None:
+        """Drop the cached ids of a process a new version was registered for,
+        e.g. so requests without a version go to the latest one.
+
+        Args:
+            name: Federated Learning Process Name, None to drop them all.
+        """
+        with self._lock:
+            if name is None:
+                self._processes.clear()
+                return
+            for key in [key for key in self._processes if key[0] == name]:
+                del self._processes[key]
+
+    def flush(self) -> None:
+        """Write all the buffered worker cycles and worker stats in one
+        transaction."""
+        with self._lock:
+            pending_cycles, self._pending_cycles = self._pending_cycles, []
+            pending_workers, self._pending_workers = self._pending_workers, {}
+            self._last_flush = time.monotonic()
+
+        if not pending_cycles and not pending_workers:
+            return
+
+        session = self.cycle_manager.db.session
+        try:
+            if pending_workers:
+                session.bulk_update_mappings(
+                    Worker,
+                    [{"id": _id, **stats} for _id, stats in pending_workers.items()],
+                )
+            if pending_cycles:
+                session.bulk_insert_mappings(WorkerCycle, pending_cycles)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logging.error(f"Failed to flush cycle admissions: {e}")
+            with self._lock:
+                self._pending_cycles = pending_cycles + self._pending_cycles
+                for _id, stats in pending_workers.items():
+                    stats.update(self._pending_workers.get(_id, {}))
+                    self._pending_workers[_id] = stats
+            raise
+
+        with self._lock:
+            self._pending_keys.difference_update(
+                row["request_key"] for row in pending_cycles
+            )
+        logging.info(
+            f"Flushed {len(pending_cycles)} worker cycles and {len(pending_workers)} workers"
+        )
+
+    def _maybe_flush(self) -> None:
+        with self._lock:
+            n_pending = len(self._pending_cycles) + len(self._pending_workers)
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if n_pending >= self.max_pending or (n_pending and due):
+            run_task_once("flush_cycle_admissions", self.flush)
+
+    def _get_worker(self, worker_id: str) -> Dict[str, Optional[float]]:
+        worker = self._workers.get(worker_id)
+        if worker is None:
+            _worker = self.cycle_manager.db.session.query(Worker).get(worker_id)
+            if _worker is None:
+                raise WorkerNotFoundError
+            worker = {field: getattr(_worker, field) for field in WORKER_SPEED_FIELDS}
+            self._workers[worker_id] = worker
+        return worker
+
+    def _active_cycle(self, name: str, version: Optional[str]) -> ActiveCycle:
+        fl_process_id = self._processes.get((name, version))
+        if fl_process_id is None:
+            if version:
+                _fl_process = process_manager.first(name=name, version=version)
+            else:
+                _fl_process = process_manager.last(name=name)
+            fl_process_id = _fl_process.id
+            self._processes[(name, version)] = fl_process_id
+
+        active = self._cycles.get(fl_process_id)
+        if active is None:
+            active = self._load(fl_process_id)
+        return active
+
+    def _load(self, fl_process_id: int) -> ActiveCycle:
+        """Build the snapshot of a process' open cycle from the database."""
+        _cycle = self.cycle_manager.last(fl_process_id, None)
+
+        server_config, client_config = process_manager.get_configs(id=fl_process_id)
+        _plans = process_manager.get_plans(
+            fl_process_id=fl_process_id, is_avg_plan=False
+        )
+        try:
+            _protocols = process_manager.get_protocols(fl_process_id=fl_process_id)
+        except ProtocolNotFoundError:
+            # Protocols are optional
+            _protocols = {}
+        _model = model_manager.get(fl_process_id=fl_process_id)
+
+        participation: Dict[str, int] = {}
+        assigned: Dict[str, str] = {}
+        n_completed_cycles = 0
+        for cycle in self.cycle_manager.cycles(fl_process_id=fl_process_id):
+            n_completed_cycles += int(bool(cycle.is_completed))
+            for worker_cycle in cycle.worker_cycles:
+                worker_id = worker_cycle.worker_id
+                if cycle.sequence > participation.get(worker_id, 0):
+                    participation[worker_id] = cycle.sequence
+                if cycle.id == _cycle.id:
+                    assigned[worker_id] = worker_cycle.request_key
+
+        # keep assignments that are admitted but not flushed yet
+        for row in self._pending_cycles:
+            if row["cycle_id"] == _cycle.id:
+                assigned[row["worker_id"]] = row["request_key"]
+                participation[row["worker_id"]] = _cycle.sequence
+
+        active = ActiveCycle(
+            fl_process_id=fl_process_id,
+            cycle=_cycle,
+            server_config=server_config,
+            client_config=client_config,
+            plans=_plans,
+            protocols=_protocols,
+            model_id=_model.id,
+            n_completed_cycles=n_completed_cycles,
+            assigned=assigned,
+        )
+        for worker_id, key in assigned.items():
+            self._keys[key] = (worker_id, _cycle.id)
+
+        self._cycles[fl_process_id] = active
+        self._participation[fl_process_id] = participation
+        logging.info(f"Loaded {active}")
+        return active
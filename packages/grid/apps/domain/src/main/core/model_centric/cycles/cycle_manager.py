@@ -42,6 +42,20 @@ class CycleManager(DatabaseManager):
 
         self._cycles = _CycleManager(database)
         self._worker_cycles = WorkerCycleManager(database)
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """Register a callback to be called with the FL process ID whenever
+        a cycle of that process is created or completed.
+
+        Args:
+            callback: Callable receiving the FL Process's ID.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, fl_process_id: int):
+        for callback in self._listeners:
+            callback(fl_process_id)
 
     def create(self, fl_process_id: int, version: str, cycle_time: int):
         """Create a new federated learning cycle.
@@ -68,6 +82,7 @@ class CycleManager(DatabaseManager):
             version=version,
             fl_process_id=fl_process_id,
         )
+        self._notify(fl_process_id)
 
         return _new_cycle
 
@@ -163,8 +178,18 @@ class CycleManager(DatabaseManager):
 
         return _worker_cycle.request_key == request_key
 
+    def cycles(self, **kwargs):
+        """Retrieve the registered cycles filtering by parameters.
+
+        Args:
+            parameters : List of parameters used to filter.
+        Returns:
+            cycles: List of Cycle Instances.
+        """
+        return self._cycles.query(**kwargs)
+
     def count(self, **kwargs):
-        return len(self._cycles)
+        return len(self._cycles.query(**kwargs))
 
     def submit_worker_diff(self, worker_id: str, request_key: str, diff: bytes):
         """Submit reported diff
@@ -330,6 +355,7 @@ class CycleManager(DatabaseManager):
         # mark current cycle completed
         cycle.is_completed = True
         self._cycles.db.session.commit()
+        self._notify(cycle.fl_process_id)
 
         completed_cycles_num = len(
             self._cycles.query(fl_process_id=cycle.fl_process_id, is_completed=True)
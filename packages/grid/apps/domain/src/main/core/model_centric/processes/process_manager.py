@@ -36,6 +36,21 @@ class ProcessManager(DatabaseManager):
 
         self._configs = ConfigManager(database)
         self._processes = FLProcessManager(database)
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """Register a callback to be called with the process name whenever a
+        version of that process is created, or with None when processes are
+        deleted.
+
+        Args:
+            callback: Callable receiving the FL Process's name.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, name):
+        for callback in self._listeners:
+            callback(name)
 
     def create(
         self,
@@ -88,6 +103,7 @@ class ProcessManager(DatabaseManager):
             client_flprocess_config=fl_process,
         )
 
+        self._notify(name)
         return fl_process
 
     def get_configs(self, **kwargs):
@@ -214,3 +230,4 @@ class ProcessManager(DatabaseManager):
             model_id: Model's ID.
         """
         self._processes.delete(**kwargs)
+        self._notify(None)
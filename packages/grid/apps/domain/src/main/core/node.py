@@ -134,6 +134,7 @@ def create_domain_app(app, args, testing=False):
     from .database import db
     from .database import seed_db
     from .database import set_database_config
+    from .database.store_disk import migrate_obj_types
 
     global node
     node = GridDomain(name=args.name)
@@ -142,6 +143,7 @@ def create_domain_app(app, args, testing=False):
     set_database_config(app, test_config=test_config)
     app.app_context().push()
     db.create_all()
+    migrate_obj_types(db)
 
     if not testing:
         if len(db.session.query(Role).all()) == 0:
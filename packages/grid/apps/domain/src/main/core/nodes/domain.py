@@ -21,6 +21,7 @@ from syft.core.io.location import Location
 from syft.core.io.location import SpecificLocation
 from syft.core.node.common.action.exception_action import ExceptionMessage
 from syft.core.node.common.action.exception_action import UnknownPrivateException
+from syft.core.node.common.router import ServiceRouter
 from syft.core.node.common.service.auth import AuthorizationException
 from syft.core.node.common.service.child_node_lifecycle_service import (
     ChildNodeLifecycleService,
@@ -116,8 +117,8 @@ class GridDomain(Domain):
         self.setup_configs = {}
 
         # Reset Node Services
-        self.immediate_msg_with_reply_router = {}
-        self.immediate_msg_without_reply_router = {}
+        self.immediate_msg_with_reply_router = ServiceRouter()
+        self.immediate_msg_without_reply_router = ServiceRouter()
         self.immediate_services_with_reply: List[Any] = []
         self.immediate_services_without_reply: List[Any] = []
 
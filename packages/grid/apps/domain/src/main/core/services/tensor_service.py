@@ -1,12 +1,11 @@
 # stdlib
 import secrets
 from typing import List
+from typing import Optional
 from typing import Type
 from typing import Union
 
 # third party
-from nacl.encoding import HexEncoder
-from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
 
 # syft relative
@@ -14,10 +13,10 @@ from syft.core.common.group import VerifyAll
 from syft.core.common.message import ImmediateSyftMessageWithReply
 from syft.core.common.uid import UID
 from syft.core.node.abstract.node import AbstractNode
-from syft.core.node.common.action.save_object_action import SaveObjectAction
 from syft.core.node.common.service.auth import service_auth
 from syft.core.node.common.service.node_service import ImmediateNodeServiceWithReply
 from syft.core.node.common.service.node_service import ImmediateNodeServiceWithoutReply
+from syft.core.node.pki.key_cache import get_signing_key
 from syft.core.store.storeable_object import StorableObject
 from syft.grid.messages.tensor_messages import CreateTensorMessage
 from syft.grid.messages.tensor_messages import CreateTensorResponse
@@ -31,6 +30,46 @@ from syft.grid.messages.tensor_messages import UpdateTensorMessage
 from syft.grid.messages.tensor_messages import UpdateTensorResponse
 import torch as th
 
+# grid relative
+from ..database.store_disk import DiskObjectStore
+from ..exceptions import AuthorizationError
+from ..exceptions import TensorNotFoundError
+
+
+def save_tensor(
+    node: AbstractNode,
+    key: UID,
+    tensor: th.Tensor,
+    verify_key: VerifyKey,
+    tags: Optional[List[str]] = None,
+    description: str = "",
+    searchable: bool = False,
+) -> None:
+    """Write a tensor straight into the node store, owned by `verify_key`."""
+    tensor.tag(*(tags or []))
+    tensor.describe(description)
+
+    storable = StorableObject(
+        id=key,
+        data=tensor,
+        tags=tensor.tags,
+        description=tensor.description,
+        search_permissions={VerifyAll(): None} if searchable else {},
+        # same permissions SaveObjectAction gives to the objects it stores
+        read_permissions={node.verify_key: node.id, verify_key: None},
+    )
+    node.store[key] = storable
+
+
+def load_tensor(node: AbstractNode, key: UID, verify_key: VerifyKey) -> th.Tensor:
+    """Read a tensor from the node store if `verify_key` can read it."""
+    if key not in node.store:
+        raise TensorNotFoundError
+    storable = node.store[key]
+    if verify_key not in storable.read_permissions:
+        raise AuthorizationError()
+    return storable.data
+
 
 def create_tensor_msg(
     msg: CreateTensorMessage,
@@ -39,33 +78,17 @@ def create_tensor_msg(
     try:
         payload = msg.content
 
-        new_tensor = th.tensor(payload["tensor"])
-        new_tensor.tag(*payload.get("tags", []))
-        new_tensor.describe(payload.get("description", ""))
-
         id_at_location = UID()
-
-        # Step 2: create message which contains object to send
-        storable = StorableObject(
-            id=id_at_location,
-            data=new_tensor,
-            tags=new_tensor.tags,
-            description=new_tensor.description,
-            search_permissions={VerifyAll(): None}
-            if payload.get("searchable", False)
-            else {},
+        save_tensor(
+            node=node,
+            key=id_at_location,
+            tensor=th.tensor(payload["tensor"]),
+            verify_key=get_signing_key(payload["internal_key"]).verify_key,
+            tags=payload.get("tags", []),
+            description=payload.get("description", ""),
+            searchable=payload.get("searchable", False),
         )
 
-        obj_msg = SaveObjectAction(obj=storable, address=node.address)
-
-        signed_message = obj_msg.sign(
-            signing_key=SigningKey(
-                payload["internal_key"].encode("utf-8"), encoder=HexEncoder
-            )
-        )
-
-        node.recv_immediate_msg_without_reply(msg=signed_message)
-
         return CreateTensorResponse(
             address=msg.reply_to,
             status_code=200,
@@ -89,33 +112,16 @@ def update_tensor_msg(
     try:
         payload = msg.content
 
-        new_tensor = th.tensor(payload["tensor"])
-        new_tensor.tag(*payload.get("tags", []))
-        new_tensor.describe(payload.get("description", ""))
-
-        key = UID.from_string(value=payload["tensor_id"])
-
-        # Step 2: create message which contains object to send
-        storable = StorableObject(
-            id=key,
-            data=new_tensor,
-            tags=new_tensor.tags,
-            description=new_tensor.description,
-            search_permissions={VerifyAll(): None}
-            if payload.get("searchable", False)
-            else {},
-        )
-
-        obj_msg = SaveObjectAction(obj=storable, address=node.address)
-
-        signed_message = obj_msg.sign(
-            signing_key=SigningKey(
-                payload["internal_key"].encode("utf-8"), encoder=HexEncoder
-            )
+        save_tensor(
+            node=node,
+            key=UID.from_string(value=payload["tensor_id"]),
+            tensor=th.tensor(payload["tensor"]),
+            verify_key=get_signing_key(payload["internal_key"]).verify_key,
+            tags=payload.get("tags", []),
+            description=payload.get("description", ""),
+            searchable=payload.get("searchable", False),
         )
 
-        node.recv_immediate_msg_without_reply(msg=signed_message)
-
         return UpdateTensorResponse(
             address=msg.reply_to,
             status_code=200,
@@ -147,6 +153,8 @@ def get_tensor_msg(
                     "id": payload["tensor_id"],
                     "tags": tensor.tags,
                     "description": tensor.description,
+                    "dtype": str(tensor.data.dtype),
+                    "shape": list(tensor.data.shape),
                 }
             },
         )
@@ -163,18 +171,27 @@ def get_tensors_msg(
     node: AbstractNode,
 ) -> GetTensorsResponse:
     try:
-        tensors = node.store.get_objects_of_type(obj_type=th.Tensor)
-
         result = []
 
-        for tensor in tensors:
-            result.append(
-                {
-                    "id": str(tensor.id.value),
-                    "tags": tensor.tags,
-                    "description": tensor.description,
-                }
-            )
+        if isinstance(node.store, DiskObjectStore):
+            # list from the metadata table, no tensor is read or deserialized
+            for metadata in node.store.get_metadata_of_type(obj_type=th.Tensor):
+                result.append(
+                    {
+                        "id": metadata.obj,
+                        "tags": metadata.tags,
+                        "description": metadata.description,
+                    }
+                )
+        else:
+            for tensor in node.store.get_objects_of_type(obj_type=th.Tensor):
+                result.append(
+                    {
+                        "id": str(tensor.id.value),
+                        "tags": tensor.tags,
+                        "description": tensor.description,
+                    }
+                )
         return GetTensorsResponse(
             address=msg.reply_to,
             status_code=200,
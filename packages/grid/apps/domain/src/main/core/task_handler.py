@@ -1,32 +1,32 @@
+# stdlib
+import os
+
 # third party
-from nacl.encoding import HexEncoder
-from nacl.signing import SigningKey
-from syft.core.common.message import SignedImmediateSyftMessageWithReply
-from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from nacl.signing import VerifyKey
+from syft.core.common.message import ImmediateSyftMessageWithReply
+from syft.core.node.pki.key_cache import get_signing_key
 
 # grid relative
 from .exceptions import MissingRequestKeyError
 
 
-def process_as_syft_message(message_class, message_content, sign_key):
+def anonymous_verify_key():
+    # a random key nobody holds the signing key of, so it owns nothing on the node
+    return VerifyKey(os.urandom(32))
+
+
+def process_as_syft_message(message_class, message_content, verify_key):
     # grid relative
     from .node import get_node  # TODO: fix circular import
 
+    # the caller already authenticated the user, so the message is dispatched
+    # in-process instead of being signed, serialized and verified again
     message = message_class(**message_content)
-    signed_message = message.sign(signing_key=sign_key)
-
-    response = {}
-    if isinstance(signed_message, SignedImmediateSyftMessageWithReply):
-        response = get_node().recv_immediate_msg_with_reply(
-            msg=signed_message, raise_exception=True
-        )
-        response = response.message
-    elif isinstance(signed_message, SignedImmediateSyftMessageWithoutReply):
-        get_node().recv_immediate_msg_without_reply(msg=signed_message)
-    else:
-        get_node().recv_eventual_msg_without_reply(msg=signed_message)
+    response = get_node().dispatch(msg=message, verify_key=verify_key)
 
-    return response
+    if isinstance(message, ImmediateSyftMessageWithReply):
+        return response
+    return {}
 
 
 def task_handler(route_function, data, mandatory, optional=[]):
@@ -64,13 +64,11 @@ def route_logic(message_class, current_user, msg_content):
     from .node import get_node  # TODO: fix circular import
 
     if current_user:
-        user_key = SigningKey(
-            current_user.private_key.encode("utf-8"), encoder=HexEncoder
-        )
+        user_key = get_signing_key(current_user.private_key).verify_key
         msg_content["internal_key"] = current_user.private_key
         msg_content["current_user"] = current_user.id
     else:
-        user_key = SigningKey.generate()
+        user_key = anonymous_verify_key()
 
     content = {
         "address": get_node().address,
@@ -81,7 +79,7 @@ def route_logic(message_class, current_user, msg_content):
     syft_message = {}
     syft_message["message_class"] = message_class
     syft_message["message_content"] = content
-    syft_message["sign_key"] = user_key
+    syft_message["verify_key"] = user_key
 
     # Execute task
     response_msg = task_handler(
@@ -90,7 +88,7 @@ def route_logic(message_class, current_user, msg_content):
         mandatory={
             "message_class": MissingRequestKeyError,
             "message_content": MissingRequestKeyError,
-            "sign_key": MissingRequestKeyError,
+            "verify_key": MissingRequestKeyError,
         },
     )
     return response_msg
@@ -0,0 +1,157 @@
+"""Binary wire format of the `/data-centric/tensors/.../binary` endpoints.
+
+A tensor travels as
+
+    uint32 (little endian) header size | JSON header | raw buffer
+
+where the header is `{"dtype": "<numpy dtype name>", "shape": [...]}` and the
+buffer holds the elements in C order and little endian byte order, e.g. the
+bytes of `np.require(array, dtype=array.dtype.newbyteorder("<"), requirements="C")`.
+
+A tensor is only allocated once its size is known to fit within
+MAX_TENSOR_SIZE bytes (the MAX_TENSOR_SIZE environment variable, 1 GiB by
+default) and within the length of the request body.
+"""
+
+# stdlib
+import json
+from math import prod
+import os
+import struct
+from typing import BinaryIO
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+# third party
+import numpy as np
+import torch as th
+
+# grid relative
+from .exceptions import InvalidTensorError
+
+MIMETYPE = "application/octet-stream"
+CHUNK_SIZE = 1 << 20
+MAX_HEADER_SIZE = 4096
+MAX_TENSOR_SIZE = int(os.environ.get("MAX_TENSOR_SIZE", 1 << 30))
+
+HEADER_SIZE = struct.Struct("<I")
+SUPPORTED_DTYPES = {
+    "bool",
+    "uint8",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "float16",
+    "float32",
+    "float64",
+}
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise InvalidTensorError("Binary tensor is truncated!")
+    return data
+
+
+def _read_header(stream: BinaryIO) -> Tuple[int, np.dtype, Tuple[int, ...]]:
+    (header_size,) = HEADER_SIZE.unpack(_read_exactly(stream, HEADER_SIZE.size))
+    if header_size > MAX_HEADER_SIZE:
+        raise InvalidTensorError("Binary tensor header is too large!")
+
+    try:
+        header = json.loads(_read_exactly(stream, header_size))
+        dtype = np.dtype(header["dtype"])
+        shape = tuple(int(dim) for dim in header["shape"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidTensorError(f"Invalid binary tensor header: {e}")
+
+    if dtype.name not in SUPPORTED_DTYPES:
+        raise InvalidTensorError(f"dtype {dtype.name} is not supported!")
+    if any(dim < 0 for dim in shape):
+        raise InvalidTensorError(f"Invalid binary tensor shape {shape}!")
+    return header_size, dtype, shape
+
+
+def _check_size(
+    header_size: int, size: int, content_length: Optional[int], max_size: int
+) -> None:
+    if size > max_size:
+        raise InvalidTensorError(
+            f"Binary tensor of {size} bytes is larger than the {max_size} allowed!"
+        )
+    if content_length is not None:
+        expected = HEADER_SIZE.size + header_size + size
+        if content_length < expected:
+            raise InvalidTensorError("Binary tensor is truncated!")
+        if content_length > expected:
+            raise InvalidTensorError("Binary tensor is larger than its header!")
+
+
+def _read_buffer(stream: BinaryIO, array: np.ndarray) -> None:
+    buffer = memoryview(array.reshape(-1).view(np.uint8))
+    offset = 0
+    while offset < len(buffer):
+        chunk = stream.read(min(CHUNK_SIZE, len(buffer) - offset))
+        if not chunk:
+            raise InvalidTensorError("Binary tensor is truncated!")
+        end = offset + len(chunk)
+        buffer[offset:end] = chunk
+        offset = end
+
+    if stream.read(1):
+        raise InvalidTensorError("Binary tensor is larger than its header!")
+
+
+def read_tensor(
+    stream: BinaryIO,
+    content_length: Optional[int] = None,
+    max_size: int = MAX_TENSOR_SIZE,
+) -> th.Tensor:
+    """Read a tensor from a binary stream, chunk by chunk.
+
+    The elements are copied from the stream straight into the memory of the
+    returned tensor. `content_length`, the size of the whole payload when
+    known, is checked against the header before anything is allocated.
+    """
+    header_size, dtype, shape = _read_header(stream)
+    _check_size(header_size, prod(shape) * dtype.itemsize, content_length, max_size)
+
+    array = np.empty(shape, dtype=dtype.newbyteorder("<"))
+    _read_buffer(stream, array)
+
+    if not array.dtype.isnative:
+        array = array.astype(dtype.newbyteorder("="))
+    return th.from_numpy(array)
+
+
+def tensor_size(tensor: th.Tensor) -> int:
+    """Size in bytes of the encoded tensor."""
+    header = _header(tensor.detach().cpu().numpy())
+    return HEADER_SIZE.size + len(header) + tensor.element_size() * tensor.nelement()
+
+
+def iter_tensor(tensor: th.Tensor) -> Iterator[bytes]:
+    """Encode a tensor, yielding the header and then the buffer in chunks so
+    it can be streamed without building the whole payload."""
+    array = tensor.detach().cpu().numpy()
+    # unlike np.ascontiguousarray, keeps 0-d arrays 0-d
+    array = np.require(array, dtype=array.dtype.newbyteorder("<"), requirements="C")
+
+    header = _header(array)
+    yield HEADER_SIZE.pack(len(header)) + header
+
+    buffer = memoryview(array.reshape(-1).view(np.uint8))
+    for offset in range(0, len(buffer), CHUNK_SIZE):
+        end = offset + CHUNK_SIZE
+        yield bytes(buffer[offset:end])
+
+
+def _header(array: np.ndarray) -> bytes:
+    if array.dtype.name not in SUPPORTED_DTYPES:
+        raise InvalidTensorError(f"dtype {array.dtype.name} is not supported!")
+    return json.dumps({"dtype": array.dtype.name, "shape": list(array.shape)}).encode(
+        "utf-8"
+    )
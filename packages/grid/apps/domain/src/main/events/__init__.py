@@ -1,13 +1,12 @@
 """This file exists to provide a route to websocket events."""
-# stdlib
-import json
-
 # grid relative
 from .. import ws
 from ..core.codes import *
 from ..core.codes import GROUP_EVENTS
 from ..core.codes import ROLE_EVENTS
 from ..core.codes import USER_EVENTS
+from .frames import dump_message
+from .frames import load_message
 from .model_centric.fl_events import *
 from .model_centric.socket_handler import SocketHandler
 
@@ -31,6 +30,7 @@ routes = {
     MODEL_CENTRIC_FL_EVENTS.AUTHENTICATE: authenticate,
     MODEL_CENTRIC_FL_EVENTS.CYCLE_REQUEST: cycle_request,
     MODEL_CENTRIC_FL_EVENTS.REPORT: report,
+    MODEL_CENTRIC_FL_EVENTS.GET_MODEL: get_model,
 }
 
 handler = SocketHandler()
@@ -41,27 +41,25 @@ def route_requests(message, socket):
     method.
 
     Args:
-        message : message received.
+        message : message received, a JSON string or a binary frame.
+        socket : socket the message was received from.
     Returns:
-        message_response : message response.
+        message_response : message response, a binary frame if it holds bytes.
     """
     global routes
 
-    if isinstance(message, bytearray):
-        return forward_binary_message(message)
-
     request_id = None
     try:
-        message = json.loads(message)
+        message = load_message(message)
         request_id = message.get(MSG_FIELD.REQUEST_ID)
-        response = routes[message[REQUEST_MSG.TYPE_FIELD]](message)
+        response = routes[message[REQUEST_MSG.TYPE_FIELD]](message, socket)
     except Exception as e:
         response = {"error": str(e)}
 
     if request_id:
         response[MSG_FIELD.REQUEST_ID] = request_id
 
-    return json.dumps(response)
+    return dump_message(response)
 
 
 @ws.route("/")
@@ -78,7 +76,7 @@ def socket_api(socket):
         else:
             # Process received message
             response = route_requests(message, socket)
-            if isinstance(response, bytearray):
+            if isinstance(response, bytes):
                 socket.send(response, binary=True)
             else:
                 socket.send(response)
@@ -0,0 +1,159 @@
+"""asyncio server mode of the model-centric FL socket API.
+
+The gevent route in `events/__init__.py` holds a worker for the whole life of
+every connection. This server multiplexes all the connections on a single
+event loop instead and only borrows a thread from a bounded pool while an
+event handler runs (they all hit the database), so one process can keep
+thousands of mostly idle FL workers connected.
+
+Back-pressure: a connection stops reading new frames while it has
+`max_events_per_connection` events in flight, events beyond
+`max_concurrent_events` wait on the loop instead of piling up in the thread
+pool, and replies wait for the socket's write buffer to drain. Connections
+beyond `max_connections` are closed with code 1013 (try again later).
+"""
+
+# stdlib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import threading
+from typing import Any
+from typing import Optional
+from typing import Set
+from typing import Union
+
+# third party
+import websockets
+
+# grid relative
+from . import route_requests
+from .model_centric.socket_handler import SocketHandler
+
+MAX_CONNECTIONS = int(os.environ.get("EVENTS_MAX_CONNECTIONS", 10000))
+MAX_CONCURRENT_EVENTS = int(os.environ.get("EVENTS_MAX_CONCURRENT", 32))
+# 1 keeps the replies of a connection in the order of its requests
+MAX_EVENTS_PER_CONNECTION = int(os.environ.get("EVENTS_MAX_PER_CONNECTION", 1))
+MAX_FRAME_SIZE = 512 * 2 ** 20
+TRY_AGAIN_LATER = 1013
+
+handler = SocketHandler()
+
+
+class AsyncSocket:
+    """Thread safe facade of an asyncio websocket, handed to the event
+    handlers (which run in the thread pool) in place of the gevent socket."""
+
+    def __init__(self, websocket: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self.websocket = websocket
+        self.loop = loop
+
+    @property
+    def closed(self) -> bool:
+        return self.websocket.closed
+
+    def send(self, message: Union[str, bytes], binary: bool = False) -> Any:
+        """Schedule a message on the event loop, returns a
+        `concurrent.futures.Future` of the send."""
+        return asyncio.run_coroutine_threadsafe(self.websocket.send(message), self.loop)
+
+
+class AsyncEventServer:
+    def __init__(
+        self,
+        app: Any,
+        max_connections: int = MAX_CONNECTIONS,
+        max_concurrent_events: int = MAX_CONCURRENT_EVENTS,
+        max_events_per_connection: int = MAX_EVENTS_PER_CONNECTION,
+    ) -> None:
+        self.app = app
+        self.max_connections = max_connections
+        self.max_concurrent_events = max_concurrent_events
+        self.max_events_per_connection = max_events_per_connection
+        self.connections = 0
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_events, thread_name_prefix="fl-events"
+        )
+        self._events: Optional[asyncio.Semaphore] = None
+
+    def start(self, host: str, port: int) -> Any:
+        """Start listening, must be awaited (or entered with `async with`) on
+        the event loop that will serve the connections."""
+        self._events = asyncio.Semaphore(self.max_concurrent_events)
+        return websockets.serve(
+            self._serve_connection,
+            host,
+            port,
+            max_size=MAX_FRAME_SIZE,
+            max_queue=self.max_events_per_connection,
+            compression=None,
+        )
+
+    async def serve(self, host: str, port: int) -> None:
+        async with self.start(host, port):
+            logging.info(f"Serving model-centric FL events on {host}:{port}")
+            await asyncio.Future()
+
+    async def _serve_connection(self, websocket: Any, path: str = "/") -> None:
+        if self.connections >= self.max_connections:
+            await websocket.close(TRY_AGAIN_LATER, "Too many connections")
+            return
+
+        self.connections += 1
+        socket = AsyncSocket(websocket, asyncio.get_running_loop())
+        in_flight = asyncio.Semaphore(self.max_events_per_connection)
+        tasks: Set[asyncio.Future] = set()
+        try:
+            async for message in websocket:
+                # don't read any further until an event of this connection
+                # finishes, the client then blocks on its TCP window
+                await in_flight.acquire()
+                task = asyncio.ensure_future(
+                    self._handle(websocket, socket, message, in_flight)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            if tasks:
+                await asyncio.wait(tasks)
+            self.connections -= 1
+            handler.remove(socket)
+
+    async def _handle(
+        self,
+        websocket: Any,
+        socket: AsyncSocket,
+        message: Union[str, bytes],
+        in_flight: asyncio.Semaphore,
+    ) -> None:
+        try:
+            async with self._events:
+                response = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self._route, message, socket
+                )
+            # waits for the write buffer to drain
+            await websocket.send(response)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            in_flight.release()
+
+    def _route(self, message: Union[str, bytes], socket: AsyncSocket) -> Any:
+        with self.app.app_context():
+            return route_requests(message, socket)
+
+
+def run_in_thread(app: Any, host: str, port: int, **kwargs: Any) -> threading.Thread:
+    """Serve the FL events on their own event loop, next to the WSGI server."""
+    server = AsyncEventServer(app, **kwargs)
+    thread = threading.Thread(
+        target=asyncio.run,
+        args=(server.serve(host, port),),
+        name="fl-events-loop",
+        daemon=True,
+    )
+    thread.start()
+    return thread
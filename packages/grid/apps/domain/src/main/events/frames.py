@@ -0,0 +1,93 @@
+"""Binary frames of the model-centric socket API.
+
+Text frames carry plain JSON messages. Messages holding raw bytes (model
+diffs, models, plans) travel as a binary frame instead, so they don't have to
+be hex/base64 encoded into a JSON string:
+
+    uint32 (little endian) header size | JSON header | blob | blob | ...
+
+The header is the message itself without its bytes values, plus a `blobs`
+list of `[path, size]` pairs. `path` is the "/" separated location of the
+value inside the message's `data` field, e.g. `["plans/training_plan", 1024]`,
+and the blobs follow the header in the same order.
+"""
+
+# stdlib
+import json
+import struct
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# grid relative
+from ..core.codes import MSG_FIELD
+from ..core.exceptions import PyGridError
+
+HEADER_SIZE = struct.Struct("<I")
+BLOBS_FIELD = "blobs"
+PATH_SEPARATOR = "/"
+
+
+def load_message(frame: Union[str, bytes, bytearray]) -> Dict[str, Any]:
+    """Decode a text or a binary socket frame."""
+    if isinstance(frame, str):
+        return json.loads(frame)
+
+    frame = memoryview(frame)
+    try:
+        (header_size,) = HEADER_SIZE.unpack_from(frame)
+        header_end = HEADER_SIZE.size + header_size
+        message = json.loads(bytes(frame[HEADER_SIZE.size : header_end]))
+        blobs = message.pop(BLOBS_FIELD, [])
+    except (struct.error, ValueError) as e:
+        raise PyGridError(f"Invalid binary frame: {e}")
+
+    offset = header_end
+    for path, size in blobs:
+        if offset + size > len(frame):
+            raise PyGridError("Binary frame is truncated!")
+        *parents, key = path.split(PATH_SEPARATOR)
+        data = message.setdefault(MSG_FIELD.DATA, {})
+        for parent in parents:
+            data = data.setdefault(parent, {})
+        data[key] = bytes(frame[offset : offset + size])
+        offset += size
+
+    return message
+
+
+def dump_message(message: Dict[str, Any]) -> Union[str, bytes]:
+    """Encode a message as a binary frame if it holds bytes values, as JSON
+    otherwise."""
+    blobs: List[Tuple[str, bytes]] = []
+    data = message.get(MSG_FIELD.DATA)
+    if isinstance(data, dict):
+        data = _extract_blobs(data, "", blobs)
+
+    if not blobs:
+        return json.dumps(message)
+
+    header = dict(message)
+    header[MSG_FIELD.DATA] = data
+    header[BLOBS_FIELD] = [[path, len(blob)] for path, blob in blobs]
+    header_bytes = json.dumps(header).encode("utf-8")
+    return b"".join(
+        [HEADER_SIZE.pack(len(header_bytes)), header_bytes]
+        + [blob for _, blob in blobs]
+    )
+
+
+def _extract_blobs(
+    data: Dict[str, Any], prefix: str, blobs: List[Tuple[str, bytes]]
+) -> Dict[str, Any]:
+    result = {}
+    for key, value in data.items():
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            blobs.append((prefix + key, value))
+        elif isinstance(value, dict):
+            result[key] = _extract_blobs(value, prefix + key + PATH_SEPARATOR, blobs)
+        else:
+            result[key] = value
+    return result
@@ -11,10 +11,13 @@ from ...core.codes import MODEL_CENTRIC_FL_EVENTS
 from ...core.codes import MSG_FIELD
 from ...core.codes import RESPONSE_MSG
 from ...core.exceptions import CycleNotFoundError
+from ...core.exceptions import InvalidRequestKeyError
 from ...core.exceptions import MaxCycleLimitExceededError
 from ...core.exceptions import PyGridError
 from ...core.model_centric.auth.federated import verify_token
 from ...core.model_centric.controller import processes
+from ...core.model_centric.cycles import cycle_admission
+from ...core.model_centric.models import model_manager
 from ...core.model_centric.processes import process_manager
 from ...core.model_centric.workers import worker_manager
 from .socket_handler import SocketHandler
@@ -23,6 +26,13 @@ from .socket_handler import SocketHandler
 handler = SocketHandler()
 
 
+def _unhexlify(value):
+    # binary frames carry the raw bytes, JSON messages hex strings
+    if isinstance(value, bytes):
+        return value
+    return unhexlify(value.encode())
+
+
 def host_federated_training(message: dict, socket=None) -> dict:
     """This will allow for training cycles to begin on end-user devices.
 
@@ -37,18 +47,14 @@ def host_federated_training(message: dict, socket=None) -> dict:
 
     try:
         # Retrieve JSON values
-        serialized_model = unhexlify(
-            data.get(MSG_FIELD.MODEL, None).encode()
-        )  # Only one
+        serialized_model = _unhexlify(data.get(MSG_FIELD.MODEL, None))  # Only one
         serialized_client_plans = {
-            k: unhexlify(v.encode()) for k, v in data.get(CYCLE.PLANS, {}).items()
+            k: _unhexlify(v) for k, v in data.get(CYCLE.PLANS, {}).items()
         }  # 1 or *
         serialized_client_protocols = {
-            k: unhexlify(v.encode()) for k, v in data.get(CYCLE.PROTOCOLS, {}).items()
+            k: _unhexlify(v) for k, v in data.get(CYCLE.PROTOCOLS, {}).items()
         }  # 0 or *
-        serialized_avg_plan = unhexlify(
-            data.get(CYCLE.AVG_PLAN, None).encode()
-        )  # Only one
+        serialized_avg_plan = _unhexlify(data.get(CYCLE.AVG_PLAN, None))  # Only one
         client_config = data.get(CYCLE.CLIENT_CONFIG, None)  # Only one
         server_config = data.get(CYCLE.SERVER_CONFIG, None)  # Only one
 
@@ -95,6 +101,7 @@ def assign_worker_id(message: dict, socket=None) -> dict:
 
         # Create worker instance
         worker_manager.create(worker_id)
+        cycle_admission.register_worker(worker_id)
 
         response[CYCLE.STATUS] = RESPONSE_MSG.SUCCESS
         response[MSG_FIELD.WORKER_ID] = worker_id
@@ -106,13 +113,14 @@ def assign_worker_id(message: dict, socket=None) -> dict:
     return response
 
 
-def requires_speed_test(model_name, model_version):
+def requires_speed_test(model_name, model_version, server_config=None):
 
-    kwargs = {"name": model_name}
-    if model_version is not None:
-        kwargs["version"] = model_version
+    if server_config is None:
+        kwargs = {"name": model_name}
+        if model_version is not None:
+            kwargs["version"] = model_version
 
-    server_config, _ = process_manager.get_configs(**kwargs)
+        server_config, _ = process_manager.get_configs(**kwargs)
 
     return (
         True
@@ -181,18 +189,18 @@ def cycle_request(message: dict, socket=None) -> dict:
         name = data.get(MSG_FIELD.MODEL, None)
         version = data.get(CYCLE.VERSION, None)
 
-        # Retrieve the worker
-        worker = worker_manager.get(id=worker_id)
-
         # Request fields to worker's DB fields mapping
         fields_map = {
             CYCLE.PING: "ping",
             CYCLE.DOWNLOAD: "avg_download",
             CYCLE.UPLOAD: "avg_upload",
         }
-        requires_speed_fields = requires_speed_test(name, version)
+        requires_speed_fields = requires_speed_test(
+            name, version, cycle_admission.server_config(name, version)
+        )
 
-        # Check and save connection speed to DB
+        # Check connection speed, it's saved to DB with the next admission flush
+        speed = {}
         for request_field, db_field in fields_map.items():
             if request_field in data:
                 value = data.get(request_field)
@@ -200,19 +208,18 @@ def cycle_request(message: dict, socket=None) -> dict:
                     raise PyGridError(
                         f"'{request_field}' needs to be a positive number"
                     )
-                setattr(worker, db_field, float(value))
+                speed[db_field] = float(value)
             elif requires_speed_fields:
                 # Require fields to present when FL model has speed req's
                 raise PyGridError(f"'{request_field}' is required")
 
-        # worker_manager.modify(worker)  # Update database worker attributes
-        worker_manager.db.session.commit()  # Update database worker attributes
+        cycle_admission.update_worker(worker_id, **speed)
 
         # The last time this worker was assigned for this model/version.
         last_participation = processes.last_cycle(worker_id, name, version)
 
         # Assign
-        response = processes.assign(name, version, worker, last_participation)
+        response = processes.assign(name, version, worker_id, last_participation)
     except CycleNotFoundError:
         # Nothing to do
         response[CYCLE.STATUS] = CYCLE.REJECTED
@@ -248,8 +255,11 @@ def report(message: dict, socket=None) -> dict:
         worker_id = data.get(MSG_FIELD.WORKER_ID, None)
         request_key = data.get(CYCLE.KEY, None)
 
-        # It's simpler for client (and more efficient for bandwidth) to use base64
-        diff = base64.b64decode(data.get(CYCLE.DIFF, None).encode())
+        # Binary frames carry the raw diff. Otherwise it's simpler for client
+        # (and more efficient for bandwidth) to use base64
+        diff = data.get(CYCLE.DIFF, None)
+        if not isinstance(diff, bytes):
+            diff = base64.b64decode(diff.encode())
 
         # Submit model diff and run cycle and task async to avoid block report request
         # (for prod we probably should be replace this with Redis queue + separate worker)
@@ -264,3 +274,44 @@ def report(message: dict, socket=None) -> dict:
         MSG_FIELD.DATA: response,
     }
     return response
+
+
+def get_model(message: dict, socket=None) -> dict:
+    """Download the model of the cycle a worker has been accepted into. The
+    checkpoint is sent back as raw bytes, i.e. in a binary frame.
+
+    Args:
+        message : Message body sent by some client.
+        socket: Socket descriptor.
+    Returns:
+        response : String response to the client
+    """
+    data = message[MSG_FIELD.DATA]
+    response = {}
+
+    try:
+        worker_id = data.get(MSG_FIELD.WORKER_ID, None)
+        request_key = data.get(CYCLE.KEY, None)
+        model_id = data.get(MSG_FIELD.MODEL_ID, None)
+
+        # Retrieve Process Entities
+        _model = model_manager.get(id=model_id)
+        _accepted = cycle_admission.validate(
+            worker_id, _model.fl_process_id, request_key
+        )
+
+        if not _accepted:
+            raise InvalidRequestKeyError
+
+        _last_checkpoint = model_manager.load(model_id=model_id)
+
+        response[MSG_FIELD.MODEL_ID] = model_id
+        response[MSG_FIELD.MODEL] = _last_checkpoint.value
+    except Exception as e:  # Retrieve exception messages such as missing JSON fields.
+        response[RESPONSE_MSG.ERROR] = str(e)
+
+    response = {
+        MSG_FIELD.TYPE: MODEL_CENTRIC_FL_EVENTS.GET_MODEL,
+        MSG_FIELD.DATA: response,
+    }
+    return response
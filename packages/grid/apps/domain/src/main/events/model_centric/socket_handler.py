@@ -50,10 +50,10 @@ class SocketHandler(metaclass=Singleton):
         Returns:
             workerId: Worker id linked to that connection.
         """
-        for worker_id, skt in self.connections.items():
+        for worker_id, skt in list(self.connections.items()):
             if skt == socket:
                 del self.connections[worker_id]
-            return worker_id
+                return worker_id
 
     def __len__(self) -> int:
         """Number of connections handled by this server.
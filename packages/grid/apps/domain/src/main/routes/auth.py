@@ -7,10 +7,10 @@ from json.decoder import JSONDecodeError
 from flask import Response
 from flask import current_app as app
 from flask import request
-import jwt
 from syft.core.node.common.node import DuplicateRequestException
 
 # grid relative
+from ..core import auth_cache
 from ..core.codes import RESPONSE_MSG
 from ..core.database import User
 from ..core.database import db
@@ -21,6 +21,7 @@ from ..core.exceptions import MissingRequestKeyError
 from ..core.exceptions import OwnerAlreadyExistsError
 from ..core.exceptions import PyGridError
 from ..core.exceptions import RoleNotFoundError
+from ..core.exceptions import TensorNotFoundError
 from ..core.exceptions import UserNotFoundError
 
 
@@ -40,10 +41,10 @@ def token_required_factory(get_token, format_result, optional=False):
             try:
                 current_user = None
                 if token:
-                    data = jwt.decode(
-                        token, app.config["SECRET_KEY"], algorithms="HS256"
+                    user_id = auth_cache.decode_token(token, app.config["SECRET_KEY"])
+                    current_user = auth_cache.get_user(
+                        user_id, lambda: User.query.get(user_id)
                     )
-                    current_user = User.query.get(data["id"])
                 if current_user is None and not optional:
                     raise UserNotFoundError
             except Exception as e:
@@ -87,7 +88,12 @@ def error_handler(f, success_code, *args, **kwargs):
     ) as e:
         status_code = 403  # Unathorized
         response_body[RESPONSE_MSG.ERROR] = str(e)
-    except (GroupNotFoundError, RoleNotFoundError, UserNotFoundError) as e:
+    except (
+        GroupNotFoundError,
+        RoleNotFoundError,
+        TensorNotFoundError,
+        UserNotFoundError,
+    ) as e:
         status_code = 404  # Resource not found
         response_body[RESPONSE_MSG.ERROR] = str(e)
     except (OwnerAlreadyExistsError) as e:
@@ -1,5 +1,4 @@
 # stdlib
-import io
 from json import dumps
 from json import loads
 
@@ -55,7 +54,9 @@ def create_dataset(current_user):
         }
         status_code = 400
 
-    file_like_object = io.BytesIO(file_obj.stream.read())
+    # werkzeug already spools large uploads to a temporary file, read it from
+    # there instead of copying the whole archive into memory
+    file_like_object = file_obj.stream
 
     users = get_node().users
 
@@ -4,6 +4,8 @@ import json
 # third party
 from flask import Response
 from flask import request
+from syft.core.common.uid import UID
+from syft.core.node.pki.key_cache import get_signing_key
 from syft.grid.messages.tensor_messages import CreateTensorMessage
 from syft.grid.messages.tensor_messages import DeleteTensorMessage
 from syft.grid.messages.tensor_messages import GetTensorMessage
@@ -11,7 +13,13 @@ from syft.grid.messages.tensor_messages import GetTensorsMessage
 from syft.grid.messages.tensor_messages import UpdateTensorMessage
 
 # grid relative
+from ....core.services.tensor_service import load_tensor
+from ....core.services.tensor_service import save_tensor
 from ....core.task_handler import route_logic
+from ....core.tensor_codec import MIMETYPE
+from ....core.tensor_codec import iter_tensor
+from ....core.tensor_codec import read_tensor
+from ....core.tensor_codec import tensor_size
 from ...auth import error_handler
 from ...auth import token_required
 from ..blueprint import dcfl_blueprint as dcfl_route
@@ -125,3 +133,82 @@ def delete_tensor(current_user, tensor_id):
         status=status_code,
         mimetype="application/json",
     )
+
+
+def save_binary_tensor(current_user, tensor_id=None):
+    # grid relative
+    from ....core.node import get_node  # TODO: fix circular import
+
+    key = UID() if tensor_id is None else UID.from_string(value=tensor_id)
+    save_tensor(
+        node=get_node(),
+        key=key,
+        tensor=read_tensor(request.stream, content_length=request.content_length),
+        verify_key=get_signing_key(current_user.private_key).verify_key,
+        tags=request.args.getlist("tags"),
+        description=request.args.get("description", ""),
+        searchable=request.args.get("searchable", "false").lower() == "true",
+    )
+    return {"msg": "Tensor saved succesfully!", "tensor_id": str(key.value)}
+
+
+def load_binary_tensor(current_user, tensor_id):
+    # grid relative
+    from ....core.node import get_node  # TODO: fix circular import
+
+    return load_tensor(
+        node=get_node(),
+        key=UID.from_string(value=tensor_id),
+        verify_key=get_signing_key(current_user.private_key).verify_key,
+    )
+
+
+@dcfl_route.route("/tensors/binary", methods=["POST"])
+@token_required
+def upload_tensor(current_user):
+    """Create a tensor from an `application/octet-stream` body (see
+    core.tensor_codec), the body is streamed into the tensor memory."""
+    status_code, response = error_handler(save_binary_tensor, 201, current_user)
+
+    return Response(
+        json.dumps(response),
+        status=status_code,
+        mimetype="application/json",
+    )
+
+
+@dcfl_route.route("/tensors/<tensor_id>/binary", methods=["PUT"])
+@token_required
+def replace_tensor(current_user, tensor_id):
+    status_code, response = error_handler(
+        save_binary_tensor, 200, current_user, tensor_id
+    )
+
+    return Response(
+        json.dumps(response),
+        status=status_code,
+        mimetype="application/json",
+    )
+
+
+@dcfl_route.route("/tensors/<tensor_id>/binary", methods=["GET"])
+@token_required
+def download_tensor(current_user, tensor_id):
+    status_code, response = error_handler(
+        load_binary_tensor, 200, current_user, tensor_id
+    )
+
+    if status_code != 200:
+        return Response(
+            json.dumps(response),
+            status=status_code,
+            mimetype="application/json",
+        )
+
+    # the tensor is streamed in chunks instead of being encoded at once
+    return Response(
+        iter_tensor(response),
+        status=status_code,
+        mimetype=MIMETYPE,
+        headers={"Content-Length": str(tensor_size(response))},
+    )
@@ -26,12 +26,12 @@ from ...core.exceptions import ModelNotFoundError
 from ...core.exceptions import PyGridError
 from ...core.model_centric.auth.federated import verify_token
 from ...core.model_centric.controller import processes
+from ...core.model_centric.cycles import cycle_admission
 from ...core.model_centric.cycles import cycle_manager
 from ...core.model_centric.models import model_manager
 from ...core.model_centric.processes import process_manager
 from ...core.model_centric.syft_assets import plans
 from ...core.model_centric.syft_assets import protocols
-from ...core.model_centric.workers import worker_manager
 from ...events.model_centric.fl_events import assign_worker_id
 from ...events.model_centric.fl_events import cycle_request
 from ...events.model_centric.fl_events import report
@@ -135,9 +135,9 @@ def download_protocol():
 
         # Retrieve Process Entities
         _protocol = protocols.get(id=protocol_id)
-        _cycle = cycle_manager.last(_protocol.fl_process_id)
-        _worker = worker_manager.get(id=worker_id)
-        _accepted = cycle_manager.validate(_worker.id, _cycle.id, request_key)
+        _accepted = cycle_admission.validate(
+            worker_id, _protocol.fl_process_id, request_key
+        )
 
         if not _accepted:
             raise InvalidRequestKeyError
@@ -172,9 +172,9 @@ def download_model():
 
         # Retrieve Process Entities
         _model = model_manager.get(id=model_id)
-        _cycle = cycle_manager.last(_model.fl_process_id)
-        _worker = worker_manager.get(id=worker_id)
-        _accepted = cycle_manager.validate(_worker.id, _cycle.id, request_key)
+        _accepted = cycle_admission.validate(
+            worker_id, _model.fl_process_id, request_key
+        )
 
         if not _accepted:
             raise InvalidRequestKeyError
@@ -215,9 +215,9 @@ def download_plan():
 
         # Retrieve Process Entities
         _plan = process_manager.get_plan(id=plan_id, is_avg_plan=False)
-        _cycle = cycle_manager.last(fl_process_id=_plan.fl_process_id)
-        _worker = worker_manager.get(id=worker_id)
-        _accepted = cycle_manager.validate(_worker.id, _cycle.id, request_key)
+        _accepted = cycle_admission.validate(
+            worker_id, _plan.fl_process_id, request_key
+        )
 
         if not _accepted:
             raise InvalidRequestKeyError
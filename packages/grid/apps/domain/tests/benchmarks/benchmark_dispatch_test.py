@@ -0,0 +1,102 @@
+"""
+Benchmark of the REST routes dispatching their messages in-process against
+signing, serializing and verifying them, run with `pytest --runbenchmarks`
+"""
+
+# stdlib
+import time
+
+# third party
+from nacl.signing import SigningKey
+import pytest
+from src.main.core.database import *
+from src.main.core.node import get_node
+from src.main.core.task_handler import route_logic
+from syft.core.node.pki.key_cache import get_signing_key
+from syft.grid.messages.role_messages import GetRolesMessage
+from syft.grid.messages.tensor_messages import GetTensorsMessage
+from syft.grid.messages.user_messages import GetUsersMessage
+
+N_CALLS = 200
+
+pytestmark = pytest.mark.benchmark
+
+owner_role = ("Owner", True, True, True, True, True, True, True)
+user1 = (
+    "tech@gibberish.com",
+    "BDEB6E8EE39B6C70835993486C9E65DC",
+    "]GBF[R>GX[9Cmk@DthFT!mhloUc%[f",
+    "fd062d885b24bda173f6aa534a3418bcafadccecfefe2f8c6f5a8db563549ced",
+    1,
+)
+
+
+@pytest.fixture
+def cleanup(database):
+    yield
+    try:
+        database.session.query(User).delete()
+        database.session.query(Role).delete()
+        database.session.commit()
+    except:
+        database.session.rollback()
+
+
+def signed_loopback(message_class, current_user, msg_content):
+    """What route_logic used to do: sign, serialize and verify in-process."""
+    if current_user:
+        user_key = get_signing_key(current_user.private_key)
+        msg_content["internal_key"] = current_user.private_key
+        msg_content["current_user"] = current_user.id
+    else:
+        user_key = SigningKey.generate()
+
+    node = get_node()
+    message = message_class(
+        address=node.address, content=msg_content, reply_to=node.address
+    )
+    signed_message = message.sign(signing_key=user_key)
+    response = node.recv_immediate_msg_with_reply(
+        msg=signed_message, raise_exception=True
+    )
+    return response.message
+
+
+def _time(handler, message_class, current_user):
+    start = time.perf_counter()
+    for _ in range(N_CALLS):
+        response = handler(message_class, current_user, {})
+    return time.perf_counter() - start, response
+
+
+@pytest.mark.parametrize(
+    "message_class,authenticated",
+    [
+        (GetUsersMessage, True),
+        (GetRolesMessage, True),
+        (GetTensorsMessage, False),
+    ],
+)
+def test_dispatch_speedup(database, cleanup, message_class, authenticated):
+    database.session.add(create_role(*owner_role))
+    user = create_user(*user1)
+    database.session.add(user)
+    database.session.commit()
+    current_user = user if authenticated else None
+
+    # warm up caches on both paths
+    signed_loopback(message_class, current_user, {})
+    route_logic(message_class, current_user, {})
+
+    loopback_time, loopback_response = _time(
+        signed_loopback, message_class, current_user
+    )
+    dispatch_time, dispatch_response = _time(route_logic, message_class, current_user)
+    print(
+        f"{message_class.__name__}: signed loopback {N_CALLS / loopback_time:.0f} req/s, "
+        f"dispatch {N_CALLS / dispatch_time:.0f} req/s, "
+        f"speedup {loopback_time / dispatch_time:.2f}x"
+    )
+
+    assert type(dispatch_response) == type(loopback_response)
+    assert dispatch_response.content == loopback_response.content
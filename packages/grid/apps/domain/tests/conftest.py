@@ -7,14 +7,38 @@ sys.path.append(myPath + "/../src/")
 
 # third party
 from app import create_app
+from main.core import auth_cache
 from main.core.database import db
 import main.core.node
 from main.core.node import GridDomain
 import pytest
+from src.main.core import auth_cache as src_auth_cache
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runbenchmarks", action="store_true", default=False, help="run benchmarks"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: mark test as a benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runbenchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --runbenchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(scope="function", autouse=True)
 def app():
+    # the app and the tests import the domain package under different names
+    auth_cache.clear_auth_cache()
+    src_auth_cache.clear_auth_cache()
     args = {"start_local_db": True, "name": "OM Domain App"}
     args_obj = type("args", (object,), args)()
     return create_app(args_obj, testing=True)
@@ -0,0 +1,90 @@
+# stdlib
+from io import BytesIO
+import tarfile
+
+# third party
+from nacl.encoding import HexEncoder
+from nacl.signing import SigningKey
+import numpy as np
+import pytest
+from src.main.core.database import db
+from src.main.core.database.bin_storage.bin_obj import BinObject
+from src.main.core.database.bin_storage.bin_obj import ObjectMetadata
+from src.main.core.database.dataset.datasetgroup import BinObjDataset
+from src.main.core.database.dataset.datasetgroup import Dataset
+from src.main.core.database.store_disk import DiskObjectStore
+from src.main.core.datasets import dataset_ops
+from src.main.core.datasets.dataset_ops import decompress
+from src.main.core.datasets.dataset_ops import process_items
+from src.main.core.datasets.dataset_ops import read_csv_array
+from syft.core.common.uid import UID
+
+USER_KEY = SigningKey.generate().encode(encoder=HexEncoder).decode("utf-8")
+
+
+def _csv(array):
+    return "\n".join(",".join(str(v) for v in row) for row in array).encode() + b"\n"
+
+
+def _archive(members):
+    buf = BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tar.addfile(info, BytesIO(content))
+    buf.seek(0)
+    return buf
+
+
+@pytest.fixture
+def cleanup(database):
+    yield
+    try:
+        database.session.query(BinObjDataset).delete()
+        database.session.query(Dataset).delete()
+        database.session.query(ObjectMetadata).delete()
+        database.session.query(BinObject).delete()
+        database.session.commit()
+    except:
+        database.session.rollback()
+
+
+def test_read_csv_array():
+    array = np.random.rand(1000, 7).astype(np.float32)
+    result = read_csv_array(BytesIO(_csv(array)))
+
+    assert result.dtype == np.float32
+    assert result.shape == (1000, 7)
+    assert np.allclose(result, array)
+
+
+# with a member size of 0 no member is sent to the workers
+@pytest.mark.parametrize("workers, member_bytes", [(1, 1 << 20), (2, 1 << 20), (2, 0)])
+def test_process_items(domain, workers, member_bytes, monkeypatch, cleanup):
+    monkeypatch.setattr(dataset_ops, "INGEST_MEMBER_BYTES", member_bytes)
+    arrays = {
+        f"data/part_{i}.csv": np.arange(i * 30, dtype=np.float32).reshape(-1, 3)
+        for i in range(1, 5)
+    }
+    members = {name: _csv(array) for name, array in arrays.items()}
+    members["data/tags"] = b"#mtcars\n#test\n"
+    members["data/description"] = b"car data"
+    members["data/manifest"] = b"four csv files"
+
+    ds = process_items(domain, decompress(_archive(members)), USER_KEY, workers)
+
+    assert ds["tags"] == ["#mtcars", "#test"]
+    assert ds["description"] == "car data"
+    assert [obj["name"] for obj in ds["data"]] == list(arrays)
+
+    store = DiskObjectStore(db)
+    for obj in ds["data"]:
+        array = arrays[obj["name"]]
+        assert obj["shape"] == str(array.shape)
+        assert "#" + obj["name"].split("/")[-1] in obj["tags"]
+
+        storable = store[UID.from_string(obj["id"])]
+        assert np.array_equal(storable.data.numpy(), array)
+
+    assert db.session.query(BinObjDataset).filter_by(dataset=ds["id"]).count() == 4
@@ -1,9 +1,11 @@
 # third party
 from bcrypt import checkpw
 import pytest
+from sqlalchemy import event
 from src.main.core.database import *
 from src.main.core.exceptions import InvalidCredentialsError
 from src.main.core.manager import UserManager
+from src.main.core.manager.role_manager import RoleManager
 
 user_role = ("User", False, False, False, False, False, False, False)
 admin_role = ("Administrator", True, True, True, True, False, False, True)
@@ -205,3 +207,45 @@ def test_login(database, cleanup):
     # Wrong password
     with pytest.raises(InvalidCredentialsError) as exc:
         users.login(email="testing@email.com", password="qrjhsiofja")
+
+
+def test_cached_role(database, cleanup):
+    users = UserManager(database)
+    roles = RoleManager(database)
+
+    user_role_obj = create_role(*user_role)
+    admin_role_obj = create_role(*admin_role)
+    database.session.add(user_role_obj)
+    database.session.add(admin_role_obj)
+    database.session.commit()
+
+    db_user1 = users.register(
+        email="user1@email.com",
+        hashed_password="afhuefhaare",
+        salt="diwriqjroqds",
+        private_key="rweqoasnfa",
+        role=user_role_obj.id,
+    )
+    assert not users.can_create_users(user_id=db_user1.id)
+
+    queries = []
+    engine = database.get_engine()
+
+    def listener(*args):
+        queries.append(args)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        for _ in range(10):
+            assert not users.can_create_users(user_id=db_user1.id)
+            assert users.role(user_id=db_user1.id).name == "User"
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert queries == []
+
+    # modifications through the managers invalidate the cached role
+    users.set(user_id=db_user1.id, role=admin_role_obj.id)
+    assert users.can_create_users(user_id=db_user1.id)
+
+    roles.set(role_id=admin_role_obj.id, params={"can_create_users": False})
+    assert not users.can_create_users(user_id=db_user1.id)
@@ -0,0 +1,114 @@
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+import time
+import uuid
+
+# third party
+import pytest
+from src.main.core.codes import CYCLE
+from src.main.core.codes import MSG_FIELD
+from src.main.core.database import db
+from src.main.core.model_centric.controller import processes
+from src.main.core.model_centric.cycles import cycle_admission
+from src.main.core.model_centric.cycles import cycle_manager
+from src.main.core.model_centric.cycles.worker_cycle import WorkerCycle
+from src.main.events.model_centric.fl_events import assign_worker_id
+from src.main.events.model_centric.fl_events import cycle_request
+
+N_WORKERS = 2000
+
+
+@pytest.fixture
+def fl_process(app):
+    name = f"admission-{uuid.uuid4().hex}"
+    processes.create_process(
+        model=b"model",
+        client_plans={"training_plan": b"plan"},
+        client_config={"name": name, "version": "1.0"},
+        server_config={"cycle_length": 60, "num_cycles": 2, "max_workers": 500},
+        server_averaging_plan=b"avg",
+        client_protocols={},
+    )
+    flush_interval, max_pending = (
+        cycle_admission.flush_interval,
+        cycle_admission.max_pending,
+    )
+    # flush manually so the test can count what reached the database
+    cycle_admission.flush_interval = cycle_admission.max_pending = float("inf")
+    yield name
+    cycle_admission.flush_interval = flush_interval
+    cycle_admission.max_pending = max_pending
+
+
+def _request(app, name, worker_id):
+    with app.app_context():
+        message = {
+            MSG_FIELD.DATA: {
+                MSG_FIELD.WORKER_ID: worker_id,
+                MSG_FIELD.MODEL: name,
+                CYCLE.VERSION: "1.0",
+            }
+        }
+        return cycle_request(message)[MSG_FIELD.DATA]
+
+
+def test_cycle_request_is_accepted_once(app, fl_process):
+    worker_id = assign_worker_id({})[MSG_FIELD.WORKER_ID]
+
+    first = _request(app, fl_process, worker_id)
+    second = _request(app, fl_process, worker_id)
+
+    assert first[CYCLE.STATUS] == "accepted"
+    assert second[CYCLE.STATUS] == "rejected"
+    assert processes.last_cycle(worker_id, fl_process, "1.0") == 1
+
+    # nothing is written until the admission layer flushes
+    cycle_id = cycle_manager.last(cycle_admission._processes[(fl_process, "1.0")]).id
+    assert not cycle_manager.is_assigned(worker_id, cycle_id)
+    cycle_admission.flush()
+    assert cycle_manager.validate(worker_id, cycle_id, first[CYCLE.KEY])
+
+
+def test_new_process_version_is_admitted(app, fl_process):
+    # requests without a version go to the latest one
+    cycle_admission.server_config(fl_process, None)
+    first_id = cycle_admission._processes[(fl_process, None)]
+
+    processes.create_process(
+        model=b"model",
+        client_plans={"training_plan": b"plan"},
+        client_config={"name": fl_process, "version": "2.0"},
+        server_config={"cycle_length": 60, "num_cycles": 1, "max_workers": 500},
+        server_averaging_plan=b"avg",
+        client_protocols={},
+    )
+
+    assert (fl_process, None) not in cycle_admission._processes
+    assert cycle_admission.server_config(fl_process, None)["num_cycles"] == 1
+    assert cycle_admission._processes[(fl_process, None)] != first_id
+    assert cycle_admission.server_config(fl_process, "1.0")["num_cycles"] == 2
+
+
+def test_cycle_request_load(app, fl_process):
+    worker_ids = [assign_worker_id({})[MSG_FIELD.WORKER_ID] for _ in range(N_WORKERS)]
+
+    # warm up the cache of the FL process
+    _request(app, fl_process, worker_ids[0])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        responses = list(
+            pool.map(lambda _id: _request(app, fl_process, _id), worker_ids[1:])
+        )
+    elapsed = time.perf_counter() - start
+    print(f"cycle-request admission: {len(responses) / elapsed:.0f} requests/sec")
+
+    accepted = [r for r in responses if r[CYCLE.STATUS] == "accepted"]
+    assert len(accepted) == len(responses)
+    assert len({r[CYCLE.KEY] for r in accepted}) == len(accepted)
+
+    cycle_admission.flush()
+    cycle_id = cycle_manager.last(cycle_admission._processes[(fl_process, "1.0")]).id
+    assert db.session.query(WorkerCycle).filter_by(cycle_id=cycle_id).count() == (
+        N_WORKERS
+    )
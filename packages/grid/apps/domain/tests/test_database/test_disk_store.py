@@ -13,6 +13,8 @@ from syft.core.store.storeable_object import StorableObject
 
 from src.main.core.database import *
 from src.main.core.database.store_disk import DiskObjectStore
+from src.main.core.database.store_disk import migrate_obj_types
+from src.main.core.database.store_disk import type_name
 
 tensor1 = th.tensor([[1, 2, 3, 4], [10, 20, 30, 40]])
 tensor2 = th.tensor([[-1, -2, -3, -4], [-100, -200, -300, -400]])
@@ -319,3 +321,82 @@ def test_values(client, database, cleanup):
     assert any(th.all(th.eq(tensor1, v)) for v in values_data)
     assert any(th.all(th.eq(tensor2, v)) for v in values_data)
     assert len(values_data) == 2
+
+
+def test_get_metadata_of_type(client, database, cleanup):
+    disk_store = DiskObjectStore(database)
+
+    id1 = UID()
+    id2 = UID()
+    storable1 = StorableObject(id=id1, data=tensor1, tags=["#a"], description="a")
+    disk_store.__setitem__(id1, storable1)
+    storable2 = StorableObject(id=id2, data=th.nn.Parameter(tensor2.float()))
+    disk_store.__setitem__(id2, storable2)
+
+    # the binaries are not needed to list the objects
+    database.session.query(BinObject).update({"binary": b""})
+    database.session.commit()
+
+    metadata = disk_store.get_metadata_of_type(th.Tensor)
+    assert {m.obj for m in metadata} == {str(id1.value), str(id2.value)}
+
+    metadata = disk_store.get_metadata_of_type(th.nn.Parameter)
+    assert [m.obj for m in metadata] == [str(id2.value)]
+
+    metadata = disk_store.get_metadata_of_type(np.ndarray)
+    assert metadata == []
+
+    metadata = disk_store.get_metadata_of_type(object)
+    assert len(metadata) == 2
+
+
+def test_untyped_objects_are_listed_and_backfilled(client, database, cleanup):
+    disk_store = DiskObjectStore(database)
+
+    id1 = UID()
+    id2 = UID()
+    disk_store.__setitem__(id1, StorableObject(id=id1, data=tensor1))
+    parameter = th.nn.Parameter(tensor2.float())
+    disk_store.__setitem__(id2, StorableObject(id=id2, data=parameter))
+
+    # rows stored before obj_type existed
+    database.session.query(ObjectMetadata).update({"obj_type": None})
+    database.session.commit()
+
+    objects = disk_store.get_objects_of_type(th.nn.Parameter)
+    assert [o.id for o in objects] == [id2]
+
+    metadata = disk_store.get_metadata_of_type(th.Tensor)
+    assert {m.obj for m in metadata} == {str(id1.value), str(id2.value)}
+
+    # the types found on the way are saved
+    assert (
+        database.session.query(ObjectMetadata)
+        .filter(ObjectMetadata.obj_type.is_(None))
+        .count()
+        == 0
+    )
+
+
+def test_migrate_obj_types(client, database, cleanup):
+    disk_store = DiskObjectStore(database)
+    _id = UID()
+    disk_store.__setitem__(_id, StorableObject(id=_id, data=tensor1))
+    database.session.query(ObjectMetadata).update({"obj_type": None})
+    database.session.commit()
+
+    migrate_obj_types(database)
+
+    metadata = database.session.query(ObjectMetadata).filter_by(obj=str(_id.value))
+    assert metadata.one().obj_type == type_name(th.Tensor)
+
+
+def test__sizeof__(client, database, cleanup):
+    disk_store = DiskObjectStore(database)
+    assert disk_store.__sizeof__() == 0
+
+    _id = UID()
+    disk_store.__setitem__(_id, StorableObject(id=_id, data=tensor1))
+
+    bin_obj = database.session.query(BinObject).get(str(_id.value))
+    assert disk_store.__sizeof__() == len(bin_obj.binary)
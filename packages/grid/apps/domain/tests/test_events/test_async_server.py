@@ -0,0 +1,80 @@
+# stdlib
+import asyncio
+import json
+
+# third party
+import pytest
+from src.main.core.codes import CYCLE
+from src.main.core.codes import MODEL_CENTRIC_FL_EVENTS
+from src.main.core.codes import MSG_FIELD
+from src.main.events.frames import dump_message
+from src.main.events.frames import load_message
+
+websockets = pytest.importorskip("websockets")
+
+# third party
+from src.main.events.async_server import AsyncEventServer  # noqa: E402
+from src.main.events.async_server import TRY_AGAIN_LATER  # noqa: E402
+
+
+def test_frames():
+    message = {
+        MSG_FIELD.TYPE: MODEL_CENTRIC_FL_EVENTS.HOST_FL_TRAINING,
+        MSG_FIELD.REQUEST_ID: "abc",
+        MSG_FIELD.DATA: {
+            MSG_FIELD.MODEL: b"\x00model",
+            CYCLE.PLANS: {"training_plan": b"plan", "other": b""},
+            CYCLE.CLIENT_CONFIG: {"name": "mnist"},
+        },
+    }
+    frame = dump_message(message)
+
+    assert isinstance(frame, bytes)
+    assert b"\x00model" in frame
+    assert load_message(frame) == message
+    assert load_message(bytearray(frame)) == message
+
+
+def test_frames_without_bytes():
+    message = {MSG_FIELD.TYPE: "type", MSG_FIELD.DATA: {"status": "success"}}
+    frame = dump_message(message)
+
+    assert frame == json.dumps(message)
+    assert load_message(frame) == message
+
+
+async def _exchange(url, frames):
+    async with websockets.connect(url) as ws:
+        responses = []
+        for frame in frames:
+            await ws.send(frame)
+            responses.append(load_message(await ws.recv()))
+        return responses
+
+
+def test_async_server(app):
+    async def run():
+        server = AsyncEventServer(app, max_connections=1)
+        async with server.start("127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            url = f"ws://127.0.0.1:{port}"
+
+            unknown = {MSG_FIELD.TYPE: "unknown", MSG_FIELD.REQUEST_ID: "1"}
+            binary = {
+                MSG_FIELD.TYPE: "unknown",
+                MSG_FIELD.REQUEST_ID: "2",
+                MSG_FIELD.DATA: {CYCLE.DIFF: b"diff"},
+            }
+            responses = await _exchange(
+                url, [json.dumps(unknown), dump_message(binary)]
+            )
+            assert [r[MSG_FIELD.REQUEST_ID] for r in responses] == ["1", "2"]
+            assert all("error" in r for r in responses)
+
+            # connections beyond the limit are turned away
+            async with websockets.connect(url):
+                with pytest.raises(websockets.ConnectionClosed) as e:
+                    await _exchange(url, [json.dumps(unknown)])
+            assert e.value.rcvd.code == TRY_AGAIN_LATER
+
+    asyncio.run(run())
@@ -1,5 +1,6 @@
 # stdlib
 from json import dumps
+from io import BytesIO
 from json import loads
 import time
 
@@ -8,6 +9,11 @@ from flask import current_app as app
 import jwt
 import pytest
 from src.main.core.database import *
+from src.main.core.exceptions import InvalidTensorError
+from src.main.core.tensor_codec import iter_tensor
+from src.main.core.tensor_codec import read_tensor
+from syft.core.common.uid import UID
+import torch as th
 
 JSON_DECODE_ERR_MSG = (
     "Expecting property name enclosed in " "double quotes: line 1 column 2 (char 1)"
@@ -271,3 +277,141 @@ def test_delete_tensor(client, database, cleanup):
     result = client.delete("/data-centric/tensors/" + tensor_id, headers=headers)
 
     assert result.status_code == 204
+
+
+@pytest.mark.parametrize(
+    "tensor",
+    [
+        th.arange(12, dtype=th.float32).reshape(3, 4),
+        th.arange(12, dtype=th.int64).reshape(3, 4).t(),  # non contiguous
+        th.tensor([True, False]),
+        th.tensor(3.5, dtype=th.float64),
+    ],
+)
+def test_binary_tensor_roundtrip(client, database, cleanup, tensor):
+    new_role = create_role(*admin_role)
+    database.session.add(new_role)
+    new_user = create_user(*user1)
+    database.session.add(new_user)
+
+    database.session.commit()
+
+    token = jwt.encode({"id": 1}, app.config["SECRET_KEY"])
+    headers = {
+        "token": token.decode("UTF-8"),
+    }
+
+    result = client.post(
+        "/data-centric/tensors/binary?tags=%23binary&description=raw&searchable=true",
+        data=b"".join(iter_tensor(tensor)),
+        content_type="application/octet-stream",
+        headers=headers,
+    )
+    assert result.status_code == 201
+    tensor_id = result.get_json()["tensor_id"]
+
+    # the metadata endpoints see the binary tensor too
+    result = client.get("/data-centric/tensors/" + tensor_id, headers=headers)
+    assert result.status_code == 200
+    metadata = result.get_json()["tensor"]
+    assert metadata["tags"] == ["#binary"]
+    assert metadata["description"] == "raw"
+    assert metadata["shape"] == list(tensor.shape)
+
+    result = client.get(f"/data-centric/tensors/{tensor_id}/binary", headers=headers)
+    assert result.status_code == 200
+    assert result.mimetype == "application/octet-stream"
+
+    received = read_tensor(BytesIO(result.data))
+    assert received.dtype == tensor.dtype
+    assert th.equal(received, tensor)
+
+    # replace it in place
+    result = client.put(
+        f"/data-centric/tensors/{tensor_id}/binary",
+        data=b"".join(iter_tensor(tensor * 2)),
+        content_type="application/octet-stream",
+        headers=headers,
+    )
+    assert result.status_code == 200
+
+    result = client.get(f"/data-centric/tensors/{tensor_id}/binary", headers=headers)
+    assert th.equal(read_tensor(BytesIO(result.data)), tensor * 2)
+
+
+def test_binary_tensor_truncated(client, database, cleanup):
+    new_role = create_role(*admin_role)
+    database.session.add(new_role)
+    new_user = create_user(*user1)
+    database.session.add(new_user)
+
+    database.session.commit()
+
+    token = jwt.encode({"id": 1}, app.config["SECRET_KEY"])
+    headers = {
+        "token": token.decode("UTF-8"),
+    }
+
+    payload = b"".join(iter_tensor(th.ones(10)))
+    result = client.post(
+        "/data-centric/tensors/binary",
+        data=payload[:-4],
+        content_type="application/octet-stream",
+        headers=headers,
+    )
+    assert result.status_code == 400
+    assert result.get_json()["error"] == "Binary tensor is truncated!"
+
+
+def test_binary_tensor_too_large(client, database, cleanup):
+    new_role = create_role(*admin_role)
+    database.session.add(new_role)
+    new_user = create_user(*user1)
+    database.session.add(new_user)
+
+    database.session.commit()
+
+    token = jwt.encode({"id": 1}, app.config["SECRET_KEY"])
+    headers = {
+        "token": token.decode("UTF-8"),
+    }
+
+    # a header claiming far more than the body holds is refused before allocating
+    header = dumps({"dtype": "float64", "shape": [1 << 20, 1 << 20]}).encode("utf-8")
+    result = client.post(
+        "/data-centric/tensors/binary",
+        data=len(header).to_bytes(4, "little") + header,
+        content_type="application/octet-stream",
+        headers=headers,
+    )
+    assert result.status_code == 400
+    assert "is larger than the" in result.get_json()["error"]
+
+    payload = b"".join(iter_tensor(th.ones(10)))
+    with pytest.raises(InvalidTensorError):
+        read_tensor(BytesIO(payload), content_length=len(payload) + 1)
+    with pytest.raises(InvalidTensorError):
+        read_tensor(BytesIO(payload), max_size=39)
+    assert th.equal(
+        read_tensor(BytesIO(payload), content_length=len(payload)), th.ones(10)
+    )
+
+
+def test_binary_tensor_not_found(client, database, cleanup):
+    new_role = create_role(*admin_role)
+    database.session.add(new_role)
+    new_user = create_user(*user1)
+    database.session.add(new_user)
+
+    database.session.commit()
+
+    token = jwt.encode({"id": 1}, app.config["SECRET_KEY"])
+    headers = {
+        "token": token.decode("UTF-8"),
+    }
+
+    result = client.get(
+        "/data-centric/tensors/" + str(UID().value) + "/binary", headers=headers
+    )
+    assert result.status_code == 404
+    assert result.get_json()["error"] == "Tensor ID not found!"
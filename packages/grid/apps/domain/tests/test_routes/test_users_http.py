@@ -1,6 +1,7 @@
 # stdlib
 from json import dumps
 from json import loads
+import time
 
 # third party
 from bcrypt import checkpw
@@ -321,6 +322,29 @@ def test_get_users_invalid_token(client, database, cleanup):
     assert result.get_json()["error"] == "Invalid credentials!"
 
 
+def test_get_users_expired_token(client, database, cleanup):
+    new_role = create_role(*admin_role)
+    database.session.add(new_role)
+    new_user = create_user(*user1)
+    database.session.add(new_user)
+
+    database.session.commit()
+
+    token = jwt.encode({"id": 1, "exp": int(time.time()) + 1}, app.config["SECRET_KEY"])
+    headers = {
+        "token": token.decode("UTF-8"),
+    }
+    result = client.get("/users", headers=headers, content_type="application/json")
+    assert result.status_code == 200
+
+    # the decoded token is cached, but not past its expiry
+    time.sleep(2)
+    result = client.get("/users", headers=headers, content_type="application/json")
+
+    assert result.status_code == 403
+    assert result.get_json()["error"] == "Invalid credentials!"
+
+
 # GET SPECIFIC USER
 
 
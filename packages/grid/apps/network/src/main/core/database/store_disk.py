@@ -59,6 +59,7 @@ def dataset_to_dict(dataset: Dataset) -> dict:
 
 class DiskObjectStore(ObjectStore):
     def __init__(self, db):
+        super().__init__()
         self.db = db
 
     def __sizeof__(self) -> int:
@@ -5,8 +5,6 @@ from typing import Type
 from typing import Union
 
 # third party
-from nacl.encoding import HexEncoder
-from nacl.signing import SigningKey
 from nacl.signing import VerifyKey
 
 # syft relative
@@ -18,6 +16,7 @@ from syft.core.node.common.action.save_object_action import SaveObjectAction
 from syft.core.node.common.service.auth import service_auth
 from syft.core.node.common.service.node_service import ImmediateNodeServiceWithReply
 from syft.core.node.common.service.node_service import ImmediateNodeServiceWithoutReply
+from syft.core.node.pki.key_cache import get_signing_key
 from syft.core.store.storeable_object import StorableObject
 from syft.grid.messages.tensor_messages import CreateTensorMessage
 from syft.grid.messages.tensor_messages import CreateTensorResponse
@@ -59,9 +58,7 @@ def create_tensor_msg(
         obj_msg = SaveObjectAction(obj=storable, address=node.address)
 
         signed_message = obj_msg.sign(
-            signing_key=SigningKey(
-                payload["internal_key"].encode("utf-8"), encoder=HexEncoder
-            )
+            signing_key=get_signing_key(payload["internal_key"])
         )
 
         node.recv_immediate_msg_without_reply(msg=signed_message)
@@ -109,9 +106,7 @@ def update_tensor_msg(
         obj_msg = SaveObjectAction(obj=storable, address=node.address)
 
         signed_message = obj_msg.sign(
-            signing_key=SigningKey(
-                payload["internal_key"].encode("utf-8"), encoder=HexEncoder
-            )
+            signing_key=get_signing_key(payload["internal_key"])
         )
 
         node.recv_immediate_msg_without_reply(msg=signed_message)
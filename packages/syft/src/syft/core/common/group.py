@@ -11,6 +11,7 @@ from nacl.signing import VerifyKey
 from ...generate_wrapper import GenerateWrapper
 from ...proto.core.auth.signed_message_pb2 import VerifyAll as VerifyAllWrapper_PB
 from ...proto.core.auth.signed_message_pb2 import VerifyKey as VerifyKey_PB
+from ..node.pki.key_cache import get_verify_key
 from .serde.serializable import Serializable
 from .serde.serializable import bind_protobuf
 
@@ -20,7 +21,7 @@ def object2proto(obj: Any) -> VerifyKey_PB:
 
 
 def proto2object(proto: VerifyKey_PB) -> VerifyKey:
-    return VerifyKey(proto.verify_key)
+    return get_verify_key(proto.verify_key)
 
 
 GenerateWrapper(
@@ -1,9 +1,14 @@
 # stdlib
+from concurrent.futures import ThreadPoolExecutor
+import struct
 import sys
 from typing import Generic
+from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Type
 from typing import TypeVar
+from typing import Union
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -13,20 +18,27 @@ from nacl.signing import VerifyKey
 
 # syft relative
 from ...core.common.object import ObjectWithID
+from ...core.common.serde.serialize import _data_message_bytes
 from ...core.common.serde.serialize import _serialize as serialize
 from ...core.common.uid import UID
 from ...core.io.address import Address
+from ...core.node.pki.key_cache import get_verify_key
+from ...experimental_flags import flags
 from ...logger import debug
 from ...logger import traceback_and_raise
 from ...proto.core.auth.signed_message_pb2 import SignedMessage as SignedMessage_PB
 from ...util import get_fully_qualified_name
 from ...util import validate_type
 from ..common.serde.deserialize import _deserialize
+from ..common.serde.deserialize import register_frame_decoder
 from ..common.serde.serializable import bind_protobuf
 
 # this generic type for SignedMessage
 SignedMessageT = TypeVar("SignedMessageT")
 
+# magic bytes of the wire frame of a SignedMessage, see SignedMessage._object2bytes
+SIGNED_MESSAGE_FRAME = b"\xf5SM\x01"
+
 
 class AbstractMessage(ObjectWithID, Generic[SignedMessageT]):
     """ """
@@ -74,7 +86,7 @@ class SyftMessage(AbstractMessage):
         super().__init__(id=msg_id)
         self.post_init()
 
-    def sign(self, signing_key: SigningKey) -> SignedMessageT:
+    def sign(self, signing_key: SigningKey, trusted: bool = False) -> SignedMessageT:
         """
         It's important for all messages to be able to prove who they were sent from.
         This method endows every message with the ability for someone to "sign" (with a hash of the message)
@@ -82,25 +94,44 @@ class SyftMessage(AbstractMessage):
 
         Args:
             signing_key: The key to use to sign the SyftMessage.
+            trusted: The message will only travel over a trusted in-process transport,
+                so skip serializing and signing it. A trusted message which leaves the
+                process carries no signature and fails verification on the other side.
+                The receiver acts on the sender's own objects, not on copies of them.
 
         Returns:
             A :class:`SignedMessage`
 
         """
+        if trusted:
+            signed = self.signed_type(
+                msg_id=self.id,
+                address=self.address,
+                obj_type=get_fully_qualified_name(obj=self),
+                signature=b"",
+                verify_key=signing_key.verify_key,
+                message=None,
+            )
+            signed.trusted = True
+            signed.cached_deseralized_message = self
+            return signed
+
         debug(f"> Signing with {self.address.key_emoji(key=signing_key.verify_key)}")
-        signed_message = signing_key.sign(serialize(self, to_bytes=True))
+        serialized_message = serialize(self, to_bytes=True)
+        signature = signing_key.sign(serialized_message).signature
 
         # signed_type will be the final subclass callee's closest parent signed_type
         # for example ReprMessage -> ImmediateSyftMessageWithoutReply.signed_type
         # == SignedImmediateSyftMessageWithoutReply
-        return self.signed_type(
+        signed = self.signed_type(
             msg_id=self.id,
             address=self.address,
             obj_type=get_fully_qualified_name(obj=self),
-            signature=signed_message.signature,
+            signature=signature,
             verify_key=signing_key.verify_key,
-            message=signed_message.message,
+            message=serialized_message,
         )
+        return signed
 
 
 @bind_protobuf
@@ -116,6 +147,8 @@ class SignedMessage(SyftMessage):
         signature (bytes): the signature of the message.
         verify_key (VerifyKey): the signer's public key with which the signature can be verified.
         serialized_message: the serialized original message.
+        trusted (bool): the message was created by :meth:`SyftMessage.sign` for a trusted
+            in-process transport and is not signed. This is never serialized.
     """
 
     obj_type: str
@@ -128,15 +161,28 @@ class SignedMessage(SyftMessage):
         obj_type: str,
         signature: bytes,
         verify_key: VerifyKey,
-        message: bytes,
+        message: Optional[Union[bytes, memoryview]],
         msg_id: Optional[UID] = None,
     ) -> None:
         super().__init__(msg_id=msg_id, address=address)
         self.obj_type = obj_type
         self.signature = signature
         self.verify_key = verify_key
-        self.serialized_message = message
+        self._serialized_message = message
         self.cached_deseralized_message: Optional[SyftMessage] = None
+        self.trusted = False
+        # (verify_key, signature, serialized_message, result) of the last verification
+        self._verified: Optional[tuple] = None
+
+    @property
+    def serialized_message(self) -> Union[bytes, memoryview]:
+        if self._serialized_message is None:
+            self._serialized_message = serialize(self.message, to_bytes=True)
+        return self._serialized_message
+
+    @serialized_message.setter
+    def serialized_message(self, message: Union[bytes, memoryview]) -> None:
+        self._serialized_message = message
 
     @property
     def message(self) -> "SyftMessage":
@@ -157,12 +203,46 @@ class SignedMessage(SyftMessage):
 
     @property
     def is_valid(self) -> bool:
-        try:
-            _ = self.verify_key.verify(self.serialized_message, self.signature)
-        except BadSignatureError:
-            return False
+        if self.trusted:
+            return True
+
+        # the result is reused as long as none of the verified fields was replaced
+        inputs = (self.verify_key, self.signature, self.serialized_message)
+        if self._verified is None or any(
+            a is not b for a, b in zip(inputs, self._verified)
+        ):
+            try:
+                _ = self.verify_key.verify(self.serialized_message, self.signature)
+                valid = True
+            except BadSignatureError:
+                valid = False
+            self._verified = (*inputs, valid)
+
+        return self._verified[-1]
+
+    @staticmethod
+    def verify_batch(
+        messages: Sequence["SignedMessage"], max_workers: Optional[int] = None
+    ) -> List[bool]:
+        """Verify the signatures of a burst of messages in parallel.
+
+        libsodium releases the GIL while verifying, so the signatures are checked
+        concurrently on a thread pool. The result is cached on every message, so a
+        later :meth:`is_valid` (e.g. in :meth:`Node.process_message`) is free.
 
-        return True
+        Args:
+            messages: the messages to verify.
+            max_workers: size of the thread pool, defaults to the executor default.
+
+        Returns:
+            The validity of each message, in order.
+        """
+        pending = [msg for msg in messages if msg._verified is None and not msg.trusted]
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(lambda msg: msg.is_valid, pending))
+
+        return [msg.is_valid for msg in messages]
 
     def _object2proto(self) -> SignedMessage_PB:
         debug(f"> {self.icon} -> Proto 🔢 {self.id}")
@@ -173,14 +253,69 @@ class SignedMessage(SyftMessage):
             obj_type=self.obj_type,
             signature=bytes(self.signature),
             verify_key=bytes(self.verify_key),
-            message=self.serialized_message,
+            message=bytes(self.serialized_message),
+        )
+
+    def _object2bytes(self) -> bytes:
+        """Frame the message for the wire.
+
+        Layout: `SIGNED_MESSAGE_FRAME | uint32 header size | header | payload` where
+        the header is a SignedMessage_PB without its `message` field and the payload
+        is the signed serialized message. The payload is only copied once, into the
+        output, instead of being nested in two protobufs.
+
+        Peers from before the frame can't read it, so it is only written with
+        `flags.SIGNED_MESSAGE_FRAMES` on, otherwise the message is written in a
+        DataMessage as before. Both are always read.
+        """
+        if not flags.SIGNED_MESSAGE_FRAMES:
+            return _data_message_bytes(
+                obj_type=get_fully_qualified_name(obj=self),
+                content=self._object2proto().SerializeToString(),
+            )
+
+        header = SignedMessage_PB(
+            msg_id=serialize(self.id, to_proto=True),
+            obj_type=self.obj_type,
+            signature=bytes(self.signature),
+            verify_key=bytes(self.verify_key),
+        ).SerializeToString()
+        return b"".join(
+            (
+                SIGNED_MESSAGE_FRAME,
+                struct.pack("<I", len(header)),
+                header,
+                self.serialized_message,
+            )
         )
 
+    @staticmethod
+    def _bytes2object(frame: memoryview) -> SignedMessageT:
+        offset = len(SIGNED_MESSAGE_FRAME)
+        (header_size,) = struct.unpack_from("<I", frame, offset)
+        offset += 4
+
+        end = offset + header_size
+
+        header = SignedMessage_PB()
+        header.ParseFromString(frame[offset:end])
+
+        # the payload is kept as a view on the received frame and parsed once
+        # here. Verifying it still copies it once, PyNaCl joins the signature
+        # and the message before checking them
+        return SignedMessage._from_parts(proto=header, message=frame[end:])
+
     @staticmethod
     def _proto2object(proto: SignedMessage_PB) -> SignedMessageT:
+        return SignedMessage._from_parts(proto=proto, message=proto.message)
+
+    @staticmethod
+    def _from_parts(
+        proto: SignedMessage_PB, message: Union[bytes, memoryview]
+    ) -> SignedMessageT:
         # TODO: horrible temp hack, need to rethink address on SignedMessage
         sub_message = validate_type(
-            _deserialize(blob=proto.message, from_bytes=True), SyftMessage
+            _deserialize(blob=message, from_bytes=True), SyftMessage
         )
 
         address = sub_message.address
@@ -197,9 +332,11 @@ class SignedMessage(SyftMessage):
             address=address,
             obj_type=proto.obj_type,
             signature=proto.signature,
-            verify_key=VerifyKey(proto.verify_key),
-            message=proto.message,
+            verify_key=get_verify_key(proto.verify_key),
+            message=message,
         )
+        # we already paid for deserializing the message to get its address
+        obj.cached_deseralized_message = sub_message
 
         icon = "🤷🏾‍♀️"
         if hasattr(obj, "icon"):
@@ -221,6 +358,9 @@ class SignedMessage(SyftMessage):
         return SignedMessage_PB
 
 
+register_frame_decoder(SIGNED_MESSAGE_FRAME, SignedMessage._bytes2object)
+
+
 class SignedImmediateSyftMessageWithReply(SignedMessage):
     """ """
 
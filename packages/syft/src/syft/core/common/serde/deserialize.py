@@ -1,5 +1,7 @@
 # stdlib
 from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Union
 
 # third party
@@ -9,6 +11,20 @@ from google.protobuf.message import Message
 from ....logger import traceback_and_raise
 from ....proto.util.data_message_pb2 import DataMessage
 from ....util import index_syft_by_module_name
+from .scope import DESERIALIZE
+from .scope import serde_scope
+
+# Objects which write their own binary framing (see `_object2bytes`) register a
+# decoder here under the magic bytes their frames start with. Serialized
+# DataMessages always start with 0x0A or 0x12, so the two can't be confused.
+FRAME_MAGIC_SIZE = 4
+frame_decoders: Dict[bytes, Callable[[memoryview], Any]] = {}
+
+
+def register_frame_decoder(magic: bytes, decoder: Callable[[memoryview], Any]) -> None:
+    if len(magic) != FRAME_MAGIC_SIZE or magic[0] != 0xF5:
+        raise ValueError(f"Invalid frame magic {magic!r}")
+    frame_decoders[magic] = decoder
 
 
 def _deserialize(
@@ -42,7 +58,17 @@ def _deserialize(
     :return: a deserialized form of the object on which _deserialize() is called.
     :rtype: Serializable
     """
+    with serde_scope(DESERIALIZE):
+        return _deserialize_in_scope(
+            blob=blob, from_proto=from_proto, from_bytes=from_bytes
+        )
 
+
+def _deserialize_in_scope(
+    blob: Union[str, dict, bytes, Message],
+    from_proto: bool = True,
+    from_bytes: bool = False,
+) -> Any:
     deserialization_error = TypeError(
         "You tried to deserialize an unsupported type. This can be caused by "
         "several reasons. Either you are actively writing Syft code and forgot "
@@ -52,6 +78,10 @@ def _deserialize(
     )
 
     if from_bytes:
+        decoder = frame_decoders.get(bytes(blob[:FRAME_MAGIC_SIZE]))  # type: ignore
+        if decoder is not None:
+            return decoder(memoryview(blob))  # type: ignore
+
         data_message = DataMessage()
         data_message.ParseFromString(blob)
         obj_type = index_syft_by_module_name(fully_qualified_name=data_message.obj_type)
@@ -0,0 +1,69 @@
+"""State shared by the serializers of the objects of one message.
+
+`_serialize` and `_deserialize` open a scope around their outermost call, so
+every object serialized or deserialized as part of the same message sees the
+same `current_scope()`, e.g. to write data shared by several objects only
+once. Nested calls join the scope of the outermost one. Serialization and
+deserialization have separate scopes. A serialize scope also knows the
+`address` of the outermost object, if it is a message, so data which a peer
+only needs once can be sent once per peer.
+"""
+
+# stdlib
+from contextlib import contextmanager
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+SERIALIZE = "serialize"
+DESERIALIZE = "deserialize"
+
+_local = threading.local()
+
+
+class SerdeScope:
+    def __init__(self, address: Optional[Any] = None) -> None:
+        self.address = address
+        self.tables: Dict[str, Any] = {}
+        self._on_exit: List[Callable[[], None]] = []
+
+    def table(self, name: str, factory: Callable[[], Any]) -> Any:
+        """The table `name` of this message, created with `factory`."""
+        table = self.tables.get(name)
+        if table is None:
+            table = factory()
+            self.tables[name] = table
+        return table
+
+    def on_exit(self, check: Callable[[], None]) -> None:
+        """Call `check` once the whole message is done, e.g. to raise if it
+        referred to data it didn't contain."""
+        self._on_exit.append(check)
+
+    def close(self) -> None:
+        for check in self._on_exit:
+            check()
+
+
+def current_scope(direction: str) -> Optional[SerdeScope]:
+    return getattr(_local, direction, None)
+
+
+@contextmanager
+def serde_scope(direction: str, address: Optional[Any] = None) -> Iterator[SerdeScope]:
+    scope = current_scope(direction)
+    if scope is not None:
+        yield scope
+        return
+
+    scope = SerdeScope(address=address)
+    setattr(_local, direction, scope)
+    try:
+        yield scope
+        scope.close()
+    finally:
+        setattr(_local, direction, None)
@@ -7,12 +7,40 @@ from google.protobuf.message import Message
 # syft relative
 from ....logger import debug
 from ....logger import traceback_and_raise
-from ....proto.util.data_message_pb2 import DataMessage
 from ....util import get_fully_qualified_name
 from ....util import validate_type
+from .scope import SERIALIZE
+from .scope import serde_scope
 from .serializable import Serializable
 
 
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _data_message_bytes(obj_type: str, content: bytes) -> bytes:
+    """Encode a DataMessage straight into its wire format.
+
+    Building a DataMessage proto copies `content` once when the field is set
+    and once more in SerializeToString. Writing the two length delimited fields
+    ourselves only copies it once, into the output, and gives byte for byte the
+    same result.
+    """
+    type_bytes = obj_type.encode("utf-8")
+    parts = []
+    # proto3 does not write fields which hold their default value
+    if type_bytes:
+        parts += [b"\x0a", _varint(len(type_bytes)), type_bytes]
+    if len(content):
+        parts += [b"\x12", _varint(len(content)), content]
+    return b"".join(parts)
+
+
 def _serialize(
     obj: object,
     to_proto: bool = True,
@@ -44,7 +72,15 @@ def _serialize(
     :return: a serialized form of the object on which serialize() is called.
     :rtype: Union[str, bytes, Message]
     """
+    with serde_scope(SERIALIZE, address=getattr(obj, "address", None)):
+        return _serialize_in_scope(obj=obj, to_proto=to_proto, to_bytes=to_bytes)
 
+
+def _serialize_in_scope(
+    obj: object,
+    to_proto: bool = True,
+    to_bytes: bool = False,
+) -> Union[str, bytes, Message]:
     is_serializable: Serializable
     if not isinstance(obj, Serializable):
         if hasattr(obj, "_sy_serializable_wrapper_type"):
@@ -60,14 +96,18 @@ def _serialize(
 
     if to_bytes:
         debug(f"Serializing {type(is_serializable)}")
+        # objects with their own binary framing write it themselves
+        _object2bytes = getattr(is_serializable, "_object2bytes", None)
+        if callable(_object2bytes):
+            return validate_type(_object2bytes(), bytes)
+
         # indent=None means no white space or \n in the serialized version
         # this is compatible with json.dumps(x, indent=None)
         serialized_data = is_serializable._object2proto().SerializeToString()
-        blob: Message = DataMessage(
+        return _data_message_bytes(
             obj_type=get_fully_qualified_name(obj=is_serializable),
             content=serialized_data,
         )
-        return validate_type(blob.SerializeToString(), bytes)
     elif to_proto:
         return validate_type(is_serializable._object2proto(), Message)
     else:
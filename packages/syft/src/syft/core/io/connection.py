@@ -83,6 +83,10 @@ class ServerConnection(object):
 
 
 class ClientConnection(object):
+    # messages sent over a trusted connection never leave the process, so
+    # clients can skip signing them and nodes can skip verifying them
+    trusted: bool = False
+
     def __init__(self) -> None:
         self.opt_bidirectional_conn = BidirectionalConnection()
 
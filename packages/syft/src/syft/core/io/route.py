@@ -135,6 +135,10 @@ class Route(ObjectWithID):
     def pprint(self) -> str:
         return f"{self.icon} ({self.class_name})"
 
+    @property
+    def trusted(self) -> bool:
+        return False
+
     def send_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
     ) -> None:
@@ -160,6 +164,10 @@ class SoloRoute(Route):
         super().__init__(schema=RouteSchema(destination=destination))
         self.connection = connection
 
+    @property
+    def trusted(self) -> bool:
+        return getattr(self.connection, "trusted", False)
+
     def send_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
     ) -> None:
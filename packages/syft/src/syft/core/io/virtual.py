@@ -4,11 +4,15 @@ Replacing this object with an actual network connection object
 (such as one powered by P2P tech, web sockets, or HTTP) should
 execute the exact same functionality but do so over a network"""
 
+# stdlib
+from typing import Optional
+
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
 from typing_extensions import final
 
 # syft relative
+from ...experimental_flags import flags
 from ...proto.core.io.connection_pb2 import (
     VirtualClientConnection as VirtualClientConnection_PB,
 )
@@ -61,8 +65,9 @@ class VirtualServerConnection(ServerConnection):
 
 @final
 class VirtualClientConnection(ClientConnection):
-    def __init__(self, server: VirtualServerConnection):
+    def __init__(self, server: VirtualServerConnection, trusted: bool = False):
         self.server = server
+        self.trusted = trusted
 
     def send_immediate_msg_without_reply(
         self, msg: SignedImmediateSyftMessageWithoutReply
@@ -93,9 +98,21 @@ class VirtualClientConnection(ClientConnection):
         return VirtualClientConnection_PB
 
 
-def create_virtual_connection(node: AbstractNode) -> VirtualClientConnection:
+def create_virtual_connection(
+    node: AbstractNode, trusted: Optional[bool] = None
+) -> VirtualClientConnection:
+    """Connect to a node living in the same process.
+
+    Args:
+        node: the node to connect to.
+        trusted: skip signing and verifying the messages sent over this connection,
+            defaults to `flags.TRUSTED_LOOPBACK`. The node then acts on the objects
+            of the sender, e.g. an in-place op on a sent tensor changes it locally.
+    """
+    if trusted is None:
+        trusted = flags.TRUSTED_LOOPBACK
 
     server = VirtualServerConnection(node=node)
-    client = VirtualClientConnection(server=server)
+    client = VirtualClientConnection(server=server, trusted=trusted)
 
     return client
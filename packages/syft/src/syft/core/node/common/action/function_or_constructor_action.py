@@ -77,6 +77,15 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
         return {k: left[k] for k in intersection}
 
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        read = [
+            arg.id_at_location
+            for arg in list(self.args) + list(self.kwargs.values())
+            if isinstance(arg, Pointer)
+        ]
+        with node.store.lock(read=read, write=[self.id_at_location]):
+            self._execute_action(node=node, verify_key=verify_key)
+
+    def _execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         method = node.lib_ast(self.path)
         result_read_permissions: Union[None, Dict[VerifyKey, UID]] = None
 
@@ -158,6 +158,17 @@ class GetObjectAction(ImmediateActionWithReply):
 
     def execute_action(
         self, node: AbstractNode, verify_key: VerifyKey
+    ) -> ImmediateSyftMessageWithoutReply:
+        # no action may mutate the object while it's being copied
+        if self.delete_obj:
+            lock = node.store.lock(write=[self.id_at_location])
+        else:
+            lock = node.store.lock(read=[self.id_at_location])
+        with lock:
+            return self._execute_action(node=node, verify_key=verify_key)
+
+    def _execute_action(
+        self, node: AbstractNode, verify_key: VerifyKey
     ) -> ImmediateSyftMessageWithoutReply:
         try:
             try:
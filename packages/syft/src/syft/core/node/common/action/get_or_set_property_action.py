@@ -66,6 +66,19 @@ class GetOrSetPropertyAction(ImmediateActionWithoutReply):
         return RunClassMethodAction.intersect_keys(left, right)
 
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        read = [arg.id_at_location for arg in self.args]
+        read.extend(arg.id_at_location for arg in self.kwargs.values())
+        write = [self.id_at_location]
+        # getting a property only reads self
+        if self.action == PropertyActions.GET:
+            read.append(self._self.id_at_location)
+        else:
+            write.append(self._self.id_at_location)
+
+        with node.store.lock(read=read, write=write):
+            self._execute_action(node=node, verify_key=verify_key)
+
+    def _execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         ast_node = node.lib_ast.query(self.path)
         method = ast_node.object_ref
         resolved_self = node.store[self._self.id_at_location]
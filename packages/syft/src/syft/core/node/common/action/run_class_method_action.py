@@ -30,6 +30,36 @@ from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 from .common import ImmediateActionWithoutReply
 
+# dunders mutating a torch.Tensor in place, next to the foo_ methods
+INPLACE_DUNDERS = {
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__isub__",
+    "__imul__",
+    "__itruediv__",
+    "__ifloordiv__",
+    "__imod__",
+    "__ipow__",
+    "__iand__",
+    "__ior__",
+    "__ixor__",
+    "__ilshift__",
+    "__irshift__",
+    "__imatmul__",
+}
+
+
+def mutates_self(path: str) -> bool:
+    """Whether calling the method at `path` may mutate the object it's called on.
+    Only torch.Tensor methods are known not to, unless they are in place."""
+    if not path.startswith("torch.Tensor"):
+        return True
+    method_name = path.split(".")[-1]
+    if method_name in INPLACE_DUNDERS:
+        return True
+    return method_name.endswith("_") and not method_name.endswith("__")
+
 
 @bind_protobuf
 class RunClassMethodAction(ImmediateActionWithoutReply):
@@ -92,6 +122,30 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
         return f"RunClassMethodAction {self_name}.{method_name}({arg_names}, {kwargs_names})"
 
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        # the arguments are only read, self unless the method mutates it, while
+        # the result is written. A Plan or Module being called may run in place
+        # actions on its arguments, which are locked for writing up front
+        args = [arg.id_at_location for arg in self.args]
+        args.extend(arg.id_at_location for arg in self.kwargs.values())
+        write = [self.id_at_location]
+        method_name = self.path.split(".")[-1]
+        if method_name in ("__call__", "forward") and not self.path.startswith(
+            "torch.Tensor"
+        ):
+            read = []
+            write.extend(args)
+        else:
+            read = args
+        if not self.is_static:
+            if mutates_self(self.path):
+                write.append(self._self.id_at_location)
+            else:
+                read.append(self._self.id_at_location)
+
+        with node.store.lock(read=read, write=write):
+            self._execute_action(node=node, verify_key=verify_key)
+
+    def _execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         method = node.lib_ast(self.path)
 
         mutating_internal = False
@@ -0,0 +1,65 @@
+# stdlib
+from typing import List
+from typing import Optional
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from nacl.signing import VerifyKey
+
+# syft relative
+from ..... import serialize
+from .....proto.core.node.common.action.save_objects_pb2 import (
+    SaveObjectsAction as SaveObjectsAction_PB,
+)
+from ....common.serde.deserialize import _deserialize
+from ....common.serde.serializable import Serializable
+from ....common.serde.serializable import bind_protobuf
+from ....common.uid import UID
+from ....io.address import Address
+from ....store.storeable_object import StorableObject
+from ...abstract.node import AbstractNode
+from .common import ImmediateActionWithoutReply
+
+
+@bind_protobuf
+class SaveObjectsAction(ImmediateActionWithoutReply, Serializable):
+    """Save several objects in one message, each as a SaveObjectAction would.
+
+    The objects are serialized together, so data they share is written once
+    (see syft.core.common.serde.scope).
+    """
+
+    def __init__(
+        self,
+        objs: List[StorableObject],
+        address: Address,
+        msg_id: Optional[UID] = None,
+    ):
+        super().__init__(address=address, msg_id=msg_id)
+        self.objs = objs
+
+    def __repr__(self) -> str:
+        return f"SaveObjectsAction of {len(self.objs)} objects"
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        for obj in self.objs:
+            obj.read_permissions = {
+                node.verify_key: node.id,
+                verify_key: None,  # we dont have the passed in sender's UID
+            }
+            node.store[obj.id] = obj
+
+    def _object2proto(self) -> SaveObjectsAction_PB:
+        objs = [obj._object2proto() for obj in self.objs]
+        addr = serialize(self.address)
+        return SaveObjectsAction_PB(objs=objs, address=addr)
+
+    @staticmethod
+    def _proto2object(proto: SaveObjectsAction_PB) -> "SaveObjectsAction":
+        objs = [_deserialize(blob=obj) for obj in proto.objs]
+        addr = _deserialize(blob=proto.address)
+        return SaveObjectsAction(objs=objs, address=addr)
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        return SaveObjectsAction_PB
@@ -223,7 +223,10 @@ class Client(AbstractNodeClient):
                 + f"{self.key_emoji(key=self.signing_key.verify_key)}"
             )
             debug(output)
-            msg = msg.sign(signing_key=self.signing_key)
+            msg = msg.sign(
+                signing_key=self.signing_key,
+                trusted=self.routes[route_index].trusted,
+            )
 
         response = self.routes[route_index].send_immediate_msg_with_reply(msg=msg)
         if response.is_valid:
@@ -258,7 +261,10 @@ class Client(AbstractNodeClient):
                 + f"{self.key_emoji(key=self.signing_key.verify_key)}"
             )
             debug(output)
-            msg = msg.sign(signing_key=self.signing_key)
+            msg = msg.sign(
+                signing_key=self.signing_key,
+                trusted=self.routes[route_index].trusted,
+            )
         debug(f"> Sending {msg.pprint} {self.pprint} ➡️  {msg.address.pprint}")
         self.routes[route_index].send_immediate_msg_without_reply(msg=msg)
 
@@ -272,7 +278,7 @@ class Client(AbstractNodeClient):
         )
         debug(output)
         signed_msg: SignedEventualSyftMessageWithoutReply = msg.sign(
-            signing_key=self.signing_key
+            signing_key=self.signing_key, trusted=self.routes[route_index].trusted
         )
 
         self.routes[route_index].send_eventual_msg_without_reply(msg=signed_msg)
@@ -0,0 +1,207 @@
+"""Scheduling of the eventual messages of a Node.
+
+Eventual messages (e.g. the GarbageCollectBatchedAction sent when a client
+drops its pointers) don't need to run when they are received. With a queue
+attached
+
+    node.eventual_queue = EventualMessageQueue(node)
+
+they are queued and run on a background thread while no immediate message is
+in flight, so a storm of garbage collection doesn't add latency to the
+interactive calls. An eventual message still runs at the latest `max_delay`
+seconds after it was received, so a busy node doesn't pile them up forever,
+and once `maxsize` messages are queued the sender runs its own message inline.
+The signatures of the messages queued since the last one ran are verified
+together (see SignedMessage.verify_batch) before the next one runs.
+
+The count, latency and number in flight of every message class are kept in
+`node.message_stats` whether or not a queue is attached.
+"""
+
+# stdlib
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from threading import Lock
+from threading import Thread
+from time import perf_counter
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# syft relative
+from ....logger import error
+from ...common.message import SignedEventualSyftMessageWithoutReply
+
+IMMEDIATE_WITH_REPLY = "immediate_with_reply"
+IMMEDIATE_WITHOUT_REPLY = "immediate_without_reply"
+EVENTUAL_WITHOUT_REPLY = "eventual_without_reply"
+MESSAGE_CLASSES = (
+    IMMEDIATE_WITH_REPLY,
+    IMMEDIATE_WITHOUT_REPLY,
+    EVENTUAL_WITHOUT_REPLY,
+)
+
+
+class MessageStats:
+    """Count, latency and number in flight of the messages of each class."""
+
+    def __init__(self) -> None:
+        self._idle = Condition(Lock())
+        self.in_flight = {name: 0 for name in MESSAGE_CLASSES}
+        self.count = {name: 0 for name in MESSAGE_CLASSES}
+        self.total_latency = {name: 0.0 for name in MESSAGE_CLASSES}
+        self.max_latency = {name: 0.0 for name in MESSAGE_CLASSES}
+
+    @contextmanager
+    def track(
+        self, message_class: str, received: Optional[float] = None
+    ) -> Iterator[None]:
+        """Count a message of `message_class` as in flight while inside the
+        with block. Its latency runs from `received` (a perf_counter time,
+        now by default) to the end of the block."""
+        start = perf_counter() if received is None else received
+        with self._idle:
+            self.in_flight[message_class] += 1
+        try:
+            yield
+        finally:
+            latency = perf_counter() - start
+            with self._idle:
+                self.in_flight[message_class] -= 1
+                self.count[message_class] += 1
+                self.total_latency[message_class] += latency
+                if latency > self.max_latency[message_class]:
+                    self.max_latency[message_class] = latency
+                if not self._immediate_in_flight():
+                    self._idle.notify_all()
+
+    def _immediate_in_flight(self) -> int:
+        return (
+            self.in_flight[IMMEDIATE_WITH_REPLY]
+            + self.in_flight[IMMEDIATE_WITHOUT_REPLY]
+        )
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no immediate message is in flight, False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: not self._immediate_in_flight(), timeout=timeout
+            )
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._idle:
+            return {
+                name: {
+                    "count": self.count[name],
+                    "in_flight": self.in_flight[name],
+                    "mean_latency": self.total_latency[name] / self.count[name]
+                    if self.count[name]
+                    else 0.0,
+                    "max_latency": self.max_latency[name],
+                }
+                for name in MESSAGE_CLASSES
+            }
+
+
+class EventualMessageQueue:
+    def __init__(self, node: Any, maxsize: int = 1024, max_delay: float = 1.0):
+        """
+        Args:
+            node: the node processing the queued messages.
+            maxsize: the number of messages queued at most, beyond it the
+                sender processes its message itself.
+            max_delay: the seconds a queued message waits at most for the
+                immediate messages in flight.
+        """
+        self.node = node
+        self.maxsize = maxsize
+        self.max_delay = max_delay
+        self._queue: Deque[
+            Tuple[float, SignedEventualSyftMessageWithoutReply]
+        ] = deque()
+        # queued and not verified yet
+        self._unverified: List[SignedEventualSyftMessageWithoutReply] = []
+        self._cond = Condition(Lock())
+        self._busy = False
+        self._closed = False
+        self._thread = Thread(
+            target=self._drain, name="syft-eventual-queue", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, msg: SignedEventualSyftMessageWithoutReply) -> None:
+        received = perf_counter()
+        with self._cond:
+            if not self._closed and len(self._queue) < self.maxsize:
+                self._queue.append((received, msg))
+                self._unverified.append(msg)
+                self._cond.notify_all()
+                return
+        # queue full, the sender pays for its own message
+        self._process(received=received, msg=msg)
+
+    def _process(
+        self, received: float, msg: SignedEventualSyftMessageWithoutReply
+    ) -> None:
+        with self.node.message_stats.track(EVENTUAL_WITHOUT_REPLY, received):
+            try:
+                self.node.process_message(
+                    msg=msg, router=self.node.eventual_msg_without_reply_router
+                )
+            except Exception as e:
+                error(f"Exception processing eventual message {msg.message}. {e}")
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                received = self._queue[0][0]
+                unverified, self._unverified = self._unverified, []
+
+            # a burst of queued messages is verified in parallel, so
+            # process_message finds their signatures already checked
+            SignedEventualSyftMessageWithoutReply.verify_batch(unverified)
+
+            # immediate messages go first
+            delay = self.max_delay - (perf_counter() - received)
+            self.node.message_stats.wait_idle(timeout=max(delay, 0.0))
+
+            with self._cond:
+                received, msg = self._queue.popleft()
+                self._busy = True
+            try:
+                self._process(received=received, msg=msg)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued message has been processed, False on
+        timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._busy, timeout=timeout
+            )
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the background thread once the queued messages are done."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            self._thread.join()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {"depth": len(self._queue), "maxsize": self.maxsize}
@@ -0,0 +1,206 @@
+"""Optional executor layer of a Node.
+
+By default a node runs every service synchronously on the thread which
+received the message, so one long running action (e.g. a matmul on a large
+tensor) stalls the Flask app, the Duet event loop or the WebRTC consumer that
+delivered it. With a NodeExecutor attached
+
+    node.executor = NodeExecutor()
+
+the services listed in `pools` run on thread pools instead, while the cheap
+ones (repr, search, permissions, ...) keep running inline. Messages without
+reply are acknowledged as soon as they are queued.
+
+Messages touching the same objects (by UID, e.g. the result of an action and
+the GetObjectAction fetching it) still run in the order they were received:
+each message waits for the previous message on any of its objects, messages
+on disjoint objects run in parallel.
+
+The pools are thread pools rather than process pools since the services work
+on the live objects of the node's store, which can't be shared with another
+process. torch and numpy release the GIL in their kernels, so CPU bound
+actions from different clients still spread over the cores.
+"""
+
+# stdlib
+from concurrent import futures
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import os
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+
+# third party
+from nacl.signing import VerifyKey
+
+# syft relative
+from ....logger import error
+from ...common.message import SyftMessage
+from ...common.uid import UID
+from ...store.storeable_object import StorableObject
+from .service.obj_action_service import EventualObjectActionServiceWithoutReply
+from .service.obj_action_service import ImmediateObjectActionServiceWithReply
+from .service.obj_action_service import ImmediateObjectActionServiceWithoutReply
+
+POOLED_SERVICES = (
+    ImmediateObjectActionServiceWithoutReply,
+    ImmediateObjectActionServiceWithReply,
+    EventualObjectActionServiceWithoutReply,
+)
+
+
+def _uids(value: Any, nested: bool = True) -> Iterator[UID]:
+    if isinstance(value, UID):
+        yield value
+    elif isinstance(getattr(value, "id_at_location", None), UID):
+        # pointers
+        yield value.id_at_location
+    elif isinstance(value, StorableObject):
+        yield value.id
+    elif nested and isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _uids(item, nested=False)
+    elif nested and isinstance(value, dict):
+        for item in value.values():
+            yield from _uids(item, nested=False)
+
+
+def object_keys(msg: SyftMessage) -> Set[UID]:
+    """UIDs of the objects a message reads or writes: its id_at_location(s),
+    its pointer arguments and the objects it saves."""
+    keys: Set[UID] = set()
+    for name, value in vars(msg).items():
+        if name != "_id":
+            keys.update(_uids(value))
+    return keys
+
+
+class ServicePool:
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="syft-node"
+        )
+        # messages waiting for an earlier message on the same object or for a
+        # free worker
+        self.queued = 0
+        self.busy = 0
+        self.completed = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "busy": self.busy,
+            "queued": self.queued,
+            "completed": self.completed,
+            "utilization": self.busy / self.max_workers,
+        }
+
+
+class NodeExecutor:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pools: Optional[Dict[type, ServicePool]] = None,
+    ) -> None:
+        """
+        Args:
+            max_workers: size of the default pool shared by the object action
+                services, the number of CPUs by default.
+            pools: the pool of each service type, instead of the default one.
+                Services without a pool run inline.
+        """
+        if pools is None:
+            pool = ServicePool(max_workers or os.cpu_count() or 1)
+            pools = {service: pool for service in POOLED_SERVICES}
+        self.pools = pools
+        self._lock = Lock()
+        # the last message submitted on each object
+        self._last: Dict[UID, Future] = {}
+
+    def submit(
+        self, service: Any, node: Any, msg: SyftMessage, verify_key: VerifyKey
+    ) -> Future:
+        """Run `service.process` once the earlier messages on the same objects
+        are done, on the service's pool or inline if it has none."""
+        keys = object_keys(msg)
+        pool = self.pools.get(type(service), None)
+        future: Future = Future()
+
+        with self._lock:
+            deps = [self._last[key] for key in keys if key in self._last]
+            for key in keys:
+                self._last[key] = future
+            if pool is not None:
+                pool.queued += 1
+
+        def run() -> None:
+            if pool is not None:
+                with self._lock:
+                    pool.queued -= 1
+                    pool.busy += 1
+            result, exception = None, None
+            try:
+                result = service.process(node=node, msg=msg, verify_key=verify_key)
+            except BaseException as e:
+                exception = e
+            # the metrics are up to date by the time the result is seen
+            with self._lock:
+                for key in keys:
+                    if self._last.get(key) is future:
+                        del self._last[key]
+                if pool is not None:
+                    pool.busy -= 1
+                    pool.completed += 1
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+        if pool is None:
+            futures.wait(deps)
+            run()
+        else:
+            self._submit_after(pool, run, deps)
+        return future
+
+    def _submit_after(self, pool: ServicePool, run: Any, deps: List[Future]) -> None:
+        # hand the message to the pool only once its dependencies are done,
+        # so no worker is ever blocked waiting on another message
+        remaining = [len(deps)]
+
+        def dep_done(_: Future) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                pool.executor.submit(run)
+
+        if not deps:
+            pool.executor.submit(run)
+        for dep in deps:
+            dep.add_done_callback(dep_done)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Utilization and queue depth of the pools, by service type."""
+        with self._lock:
+            return {
+                service.__name__: pool.metrics() for service, pool in self.pools.items()
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        for pool in set(self.pools.values()):
+            pool.executor.shutdown(wait=wait)
+
+
+def log_exception(future: Future) -> None:
+    # nobody waits on messages without reply
+    if future.exception() is not None:
+        error(
+            f"Exception processing a message on the node executor. {future.exception()}"
+        )
@@ -10,10 +10,8 @@ Do NOT (without talking to trask):
 
 # stdlib
 from typing import Any
-from typing import Dict
 from typing import List
 from typing import Optional
-from typing import Type
 from typing import TypeVar
 from typing import Union
 
@@ -27,8 +25,6 @@ from ....logger import critical
 from ....logger import debug
 from ....logger import error
 from ....logger import traceback_and_raise
-from ....util import get_subclasses
-from ...common.message import EventualSyftMessageWithoutReply
 from ...common.message import ImmediateSyftMessageWithReply
 from ...common.message import ImmediateSyftMessageWithoutReply
 from ...common.message import SignedEventualSyftMessageWithoutReply
@@ -48,15 +44,21 @@ from ..abstract.node import AbstractNode
 from .action.exception_action import ExceptionMessage
 from .action.exception_action import UnknownPrivateException
 from .client import Client
+from .eventual_queue import EVENTUAL_WITHOUT_REPLY
+from .eventual_queue import EventualMessageQueue
+from .eventual_queue import IMMEDIATE_WITHOUT_REPLY
+from .eventual_queue import IMMEDIATE_WITH_REPLY
+from .eventual_queue import MessageStats
+from .executor import NodeExecutor
+from .executor import log_exception
 from .metadata import Metadata
+from .router import ServiceRouter
 from .service.auth import AuthorizationException
 from .service.child_node_lifecycle_service import ChildNodeLifecycleService
 from .service.get_repr_service import GetReprService
 from .service.heritage_update_service import HeritageUpdateService
 from .service.msg_forwarding_service import SignedMessageWithReplyForwardingService
 from .service.msg_forwarding_service import SignedMessageWithoutReplyForwardingService
-from .service.node_service import EventualNodeServiceWithoutReply
-from .service.node_service import ImmediateNodeServiceWithReply
 from .service.obj_action_service import EventualObjectActionServiceWithoutReply
 from .service.obj_action_service import ImmediateObjectActionServiceWithReply
 from .service.obj_action_service import ImmediateObjectActionServiceWithoutReply
@@ -167,22 +169,16 @@ class Node(AbstractNode):
         # for messages which need a reply, this uses the type
         # of the message to look up the service which
         # addresses that message.
-        self.immediate_msg_with_reply_router: Dict[
-            Type[ImmediateSyftMessageWithReply], ImmediateNodeServiceWithReply
-        ] = {}
+        self.immediate_msg_with_reply_router = ServiceRouter()
 
         # for messages which don't lead to a reply, this uses
         # the type of the message to look up the service
         # which addresses that message
-        self.immediate_msg_without_reply_router: Dict[
-            Type[ImmediateSyftMessageWithoutReply], Any
-        ] = {}
+        self.immediate_msg_without_reply_router = ServiceRouter()
 
         # for messages which don't need to be run right now
         # and will not generate a reply.
-        self.eventual_msg_without_reply_router: Dict[
-            Type[EventualSyftMessageWithoutReply], EventualNodeServiceWithoutReply
-        ] = {}
+        self.eventual_msg_without_reply_router = ServiceRouter()
 
         # This is the list of services which all node support.
         # You can read more about them by reading their respective
@@ -262,6 +258,15 @@ class Node(AbstractNode):
         # For logging the number of messages received
         self.message_counter = 0
 
+        # Optional pools to run the CPU heavy services on, see NodeExecutor.
+        # Without it every service runs on the thread receiving the message.
+        self.executor: Optional[NodeExecutor] = None
+
+        # Count and latency of the messages of each class. With a queue the
+        # eventual messages wait for the immediate ones, see EventualMessageQueue.
+        self.message_stats = MessageStats()
+        self.eventual_queue: Optional[EventualMessageQueue] = None
+
     @property
     def icon(self) -> str:
         return "📍"
@@ -346,9 +351,10 @@ class Node(AbstractNode):
                 f"> Received with Reply {msg.message.pprint} {msg.message.id} @ {self.pprint}"
             )
             # try to process message
-            response = self.process_message(
-                msg=msg, router=self.immediate_msg_with_reply_router
-            )
+            with self.message_stats.track(IMMEDIATE_WITH_REPLY):
+                response = self.process_message(
+                    msg=msg, router=self.immediate_msg_with_reply_router
+                )
 
         except Exception as e:
             error(e)
@@ -381,7 +387,10 @@ class Node(AbstractNode):
 
         # maybe I shouldn't have created process_message because it screws up
         # all the type inference.
-        res_msg = response.sign(signing_key=self.signing_key)  # type: ignore
+        # a reply travels back over the connection the request came from
+        res_msg = response.sign(  # type: ignore
+            signing_key=self.signing_key, trusted=msg.trusted
+        )
         output = (
             f"> {self.pprint} Signing {res_msg.pprint} with "
             + f"{self.key_emoji(key=self.signing_key.verify_key)}"  # type: ignore
@@ -396,7 +405,10 @@ class Node(AbstractNode):
             f"> Received without Reply {msg.message.pprint} {msg.message.id} @ {self.pprint}"
         )
 
-        self.process_message(msg=msg, router=self.immediate_msg_without_reply_router)
+        with self.message_stats.track(IMMEDIATE_WITHOUT_REPLY):
+            self.process_message(
+                msg=msg, router=self.immediate_msg_without_reply_router
+            )
         try:
             pass
         except Exception as e:
@@ -447,7 +459,12 @@ class Node(AbstractNode):
     def recv_eventual_msg_without_reply(
         self, msg: SignedEventualSyftMessageWithoutReply
     ) -> None:
-        self.process_message(msg=msg, router=self.eventual_msg_without_reply_router)
+        if self.eventual_queue is not None:
+            self.eventual_queue.put(msg=msg)
+            return
+
+        with self.message_stats.track(EVENTUAL_WITHOUT_REPLY):
+            self.process_message(msg=msg, router=self.eventual_msg_without_reply_router)
 
     # TODO: Add SignedEventualSyftMessageWithoutReply and others
     def process_message(
@@ -478,10 +495,11 @@ class Node(AbstractNode):
                 self.ensure_services_have_been_registered_error_if_not()
                 traceback_and_raise(KeyError(log))
 
-            result = service.process(
-                node=self,
+            result = self._run_service(
+                service=service,
                 msg=msg.message,
                 verify_key=msg.verify_key,
+                wait=router is self.immediate_msg_with_reply_router,
             )
             return result
 
@@ -502,6 +520,78 @@ class Node(AbstractNode):
                 )
         return None
 
+    def dispatch(
+        self, msg: SyftMessage, verify_key: VerifyKey
+    ) -> Union[SyftMessage, None]:
+        """Route an unsigned message straight to the service that handles it.
+
+        This is for callers living in the same process as the node which have
+        already authenticated the sender (e.g. the REST routes of a grid app).
+        The message is not serialized, signed or verified, so it must never
+        carry input from an unauthenticated transport. It must be addressed to
+        this node, it is never forwarded.
+
+        Args:
+            msg: the message to process.
+            verify_key: the authenticated key of the sender, services use it
+                for their permission checks.
+
+        Returns:
+            The unsigned reply of the service, None for messages without reply.
+        """
+        if not self.message_is_for_me(msg=msg):
+            traceback_and_raise(
+                ValueError(
+                    f"Can't dispatch {msg.pprint}, it is addressed to "
+                    + f"{msg.address} instead of {self.pprint}"
+                )
+            )
+
+        with_reply = isinstance(msg, ImmediateSyftMessageWithReply)
+        if with_reply:
+            router = self.immediate_msg_with_reply_router
+            message_class = IMMEDIATE_WITH_REPLY
+        elif isinstance(msg, ImmediateSyftMessageWithoutReply):
+            router = self.immediate_msg_without_reply_router
+            message_class = IMMEDIATE_WITHOUT_REPLY
+        else:
+            router = self.eventual_msg_without_reply_router
+            message_class = EVENTUAL_WITHOUT_REPLY
+
+        self.message_counter += 1
+        try:
+            service = router[type(msg)]
+        except KeyError as e:
+            log = (
+                f"The node {self.id} of type {type(self)} cannot process messages of type "
+                + f"{type(msg)} because there is no service running to process it."
+                + f"{e}"
+            )
+            error(log)
+            self.ensure_services_have_been_registered_error_if_not()
+            traceback_and_raise(KeyError(log))
+
+        with self.message_stats.track(message_class):
+            return self._run_service(
+                service=service, msg=msg, verify_key=verify_key, wait=with_reply
+            )
+
+    def _run_service(
+        self, service: Any, msg: SyftMessage, verify_key: VerifyKey, wait: bool
+    ) -> Union[SyftMessage, None]:
+        if self.executor is None:
+            return service.process(node=self, msg=msg, verify_key=verify_key)
+
+        future = self.executor.submit(
+            service=service, node=self, msg=msg, verify_key=verify_key
+        )
+        if wait:
+            return future.result()
+
+        # messages without reply don't wait for their service to run
+        future.add_done_callback(log_exception)
+        return None
+
     def ensure_services_have_been_registered_error_if_not(self) -> None:
         if not self.services_registered:
             traceback_and_raise(
@@ -522,50 +612,26 @@ class Node(AbstractNode):
 
         for isr in self.immediate_services_with_reply:
             # Create a single instance of the service to cache in the router corresponding
-            # to one or more message types.
+            # to one or more message types, and all their sub-classes.
             isr_instance = isr()
             for handler_type in isr.message_handler_types():
-                # for each explicitly supported type, add it to the router
-                self.immediate_msg_with_reply_router[handler_type] = isr_instance
-
-                # for all sub-classes of the explicitly supported type, add them
-                # to the router as well.
-                for handler_type_subclass in get_subclasses(obj_type=handler_type):
-                    self.immediate_msg_with_reply_router[
-                        handler_type_subclass
-                    ] = isr_instance
+                self.immediate_msg_with_reply_router.register(
+                    handler_type, isr_instance
+                )
 
         for iswr in self.immediate_services_without_reply:
-            # Create a single instance of the service to cache in the router corresponding
-            # to one or more message types.
             iswr_instance = iswr()
             for handler_type in iswr.message_handler_types():
-
-                # for each explicitly supported type, add it to the router
-                self.immediate_msg_without_reply_router[handler_type] = iswr_instance
-
-                # for all sub-classes of the explicitly supported type, add them
-                # to the router as well.
-                for handler_type_subclass in get_subclasses(obj_type=handler_type):
-                    self.immediate_msg_without_reply_router[
-                        handler_type_subclass
-                    ] = iswr_instance
+                self.immediate_msg_without_reply_router.register(
+                    handler_type, iswr_instance
+                )
 
         for eswr in self.eventual_services_without_reply:
-            # Create a single instance of the service to cache in the router corresponding
-            # to one or more message types.
             eswr_instance = eswr()
             for handler_type in eswr.message_handler_types():
-
-                # for each explicitly supported type, add it to the router
-                self.eventual_msg_without_reply_router[handler_type] = eswr_instance
-
-                # for all sub-classes of the explicitly supported type, add them
-                # to the router as well.
-                for handler_type_subclass in get_subclasses(obj_type=handler_type):
-                    self.eventual_msg_without_reply_router[
-                        handler_type_subclass
-                    ] = eswr_instance
+                self.eventual_msg_without_reply_router.register(
+                    handler_type, eswr_instance
+                )
 
         # Set the services_registered flag to true so that we know that all services
         # have been properly registered. This mostly exists because someone might
@@ -0,0 +1,30 @@
+# stdlib
+from typing import Any
+
+# syft relative
+from ....util import get_subclasses
+
+
+class ServiceRouter(dict):
+    """The service of each message type.
+
+    Node._register_services fills it once with every subclass known at that
+    point. Message types defined later (e.g. by a library loaded afterwards)
+    resolve to the service of their closest registered base class on first
+    use and are then cached, so routing a message is always a single dict
+    lookup on its type.
+    """
+
+    def register(self, handler_type: type, service: Any) -> None:
+        """Route `handler_type` and all its current subclasses to `service`."""
+        self[handler_type] = service
+        for handler_type_subclass in get_subclasses(obj_type=handler_type):
+            self[handler_type_subclass] = service
+
+    def __missing__(self, message_type: type) -> Any:
+        for base in getattr(message_type, "__mro__", ())[1:]:
+            if base in self:
+                service = self[base]
+                self[message_type] = service
+                return service
+        raise KeyError(message_type)
@@ -27,6 +27,7 @@ from ....common.uid import UID
 from ....io.address import Address
 from ...abstract.node import AbstractNode
 from ...common.service.auth import AuthorizationException
+from ...pki.key_cache import get_verify_key
 from .auth import service_auth
 from .node_service import ImmediateNodeServiceWithoutReply
 
@@ -93,7 +94,7 @@ class ObjectSearchPermissionUpdateMessage(ImmediateSyftMessageWithoutReply):
         return ObjectSearchPermissionUpdateMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            target_verify_key=VerifyKey(proto.target_verify_key)
+            target_verify_key=get_verify_key(proto.target_verify_key)
             if proto.target_verify_key
             else None,
             target_object_id=_deserialize(blob=proto.target_object_id),
@@ -28,6 +28,7 @@ from ...abstract.node import AbstractNode
 from ...common.node import Node
 from ...common.service.node_service import ImmediateNodeServiceWithoutReply
 from ...domain.service.accept_or_deny_request_service import AcceptOrDenyRequestMessage
+from ...pki.key_cache import get_verify_key
 
 
 class RequestStatus(Enum):
@@ -159,7 +160,7 @@ class RequestMessage(ImmediateSyftMessageWithoutReply):
             address=deserialize(blob=proto.target_address),
             object_id=deserialize(blob=proto.object_id),
             owner_address=deserialize(blob=proto.owner_address),
-            requester_verify_key=VerifyKey(proto.requester_verify_key),
+            requester_verify_key=get_verify_key(proto.requester_verify_key),
             timeout_secs=proto.timeout_secs,
         )
         request_msg.request_id = deserialize(blob=proto.request_id)
@@ -0,0 +1,44 @@
+"""Bounded caches of parsed ed25519 key objects.
+
+Every inbound SignedMessage carries its verify key as raw bytes and every
+grid REST call carries the user's signing key as a hex string. Building the
+nacl key objects from those is cheap but not free, and the same handful of
+keys shows up on almost every message, so we keep the parsed objects around.
+"""
+
+# stdlib
+from threading import Lock
+from typing import Union
+
+# third party
+from cachetools import LRUCache
+from cachetools import cached
+from cachetools.keys import hashkey
+from nacl.encoding import HexEncoder
+from nacl.signing import SigningKey
+from nacl.signing import VerifyKey
+
+KEY_CACHE_SIZE = 1024
+
+verify_key_cache: LRUCache = LRUCache(maxsize=KEY_CACHE_SIZE)
+signing_key_cache: LRUCache = LRUCache(maxsize=KEY_CACHE_SIZE)
+
+
+@cached(cache=verify_key_cache, key=lambda key: hashkey(bytes(key)), lock=Lock())
+def get_verify_key(key: Union[bytes, VerifyKey]) -> VerifyKey:
+    """Return the VerifyKey for the raw key bytes, parsing it only once."""
+    if isinstance(key, VerifyKey):
+        return key
+    return VerifyKey(bytes(key))
+
+
+@cached(cache=signing_key_cache, key=hashkey, lock=Lock())
+def get_signing_key(hex_key: str) -> SigningKey:
+    """Return the SigningKey for a hex encoded private key, parsing it only
+    once."""
+    return SigningKey(hex_key.encode("utf-8"), encoder=HexEncoder)
+
+
+def clear_key_caches() -> None:
+    verify_key_cache.clear()
+    signing_key_cache.clear()
@@ -115,6 +115,7 @@ from ..node.common.service.obj_search_permission_service import (
     ObjectSearchPermissionUpdateMessage,
 )
 from ..store.storeable_object import StorableObject
+from .prefetch import PrefetchIterator
 
 
 # TODO: Fix the Client, Address, Location confusion
@@ -288,6 +289,29 @@ class Pointer(AbstractPointer):
 
         return result
 
+    def iter(
+        self,
+        prefetch: int = 256,
+        max_bytes: Optional[int] = None,
+        read_ahead: bool = False,
+    ) -> PrefetchIterator:
+        """Iterate over the values of a remote sequence, fetching `prefetch` items
+        per round trip instead of one, see PrefetchIterator.
+
+        Example:
+
+        .. code-block::
+
+            for item in list_ptr.iter(prefetch=256):
+                print(item)
+
+        :return: an iterator over the local values of the items
+        :rtype: PrefetchIterator
+        """
+        return PrefetchIterator(
+            pointer=self, prefetch=prefetch, max_bytes=max_bytes, read_ahead=read_ahead
+        )
+
     def _object2proto(self) -> Pointer_PB:
         """Returns a protobuf serialization of self.
 
@@ -0,0 +1,193 @@
+"""Prefetching iteration over remote sequences.
+
+`for x in ptr` yields a pointer per item and costs a round trip per item, on
+top of the `len(ptr)` it starts with. `ptr.iter(prefetch=256)` instead slices
+the remote object into chunks of up to 256 items, `.get()`s a chunk per round
+trip and yields the local values. The chunks are plain slices of the remote
+object fetched with `.get()`, so the same read permissions apply as to a
+`ptr[i].get()` per item.
+
+With `max_bytes` the chunk size adapts so a chunk stays around `max_bytes`,
+based on the size of the items received so far. With `read_ahead=True` a
+background thread already fetches the next chunk while the current one is
+consumed; the client must then be safe to use from two threads. Call
+`close()` when leaving the loop early, it stops and joins the thread.
+
+Objects which can't be sliced (e.g. a torch Dataset) fall back to getting
+every item, still ahead of the consumer with `read_ahead`. The error of the
+slice is logged, in case it wasn't about slicing.
+"""
+
+# stdlib
+from queue import Queue
+import sys
+from threading import Event
+from threading import Thread
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+# syft relative
+from ...logger import traceback_and_raise
+from ...logger import warning
+from ..node.common.service.auth import AuthorizationException
+
+# chunks fetched ahead of the one being consumed
+READ_AHEAD_CHUNKS = 1
+
+
+def approx_size(obj: Any) -> int:
+    """Rough size in bytes of a local object, used to size the chunks."""
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        # numpy
+        return nbytes
+    if hasattr(obj, "element_size") and hasattr(obj, "nelement"):
+        # torch
+        return obj.element_size() * obj.nelement()
+    if isinstance(obj, (list, tuple)):
+        return sum(approx_size(item) for item in obj)
+    return sys.getsizeof(obj)
+
+
+class PrefetchIterator:
+    def __init__(
+        self,
+        pointer: Any,
+        prefetch: int = 256,
+        max_bytes: Optional[int] = None,
+        read_ahead: bool = False,
+    ) -> None:
+        """
+        Args:
+            pointer: pointer to a remote object supporting slicing or indexing.
+            prefetch: the number of items fetched at most per round trip.
+            max_bytes: the approximate size a chunk is kept under, if any.
+            read_ahead: fetch the next chunk on a background thread while the
+                current one is consumed.
+        """
+        if prefetch < 1:
+            traceback_and_raise(ValueError("prefetch must be at least 1"))
+        if not hasattr(pointer, "__getitem__"):
+            traceback_and_raise(
+                TypeError(f"Can't iterate over {type(pointer).__name__} remotely.")
+            )
+
+        self.pointer = pointer
+        self.prefetch = prefetch
+        self.max_bytes = max_bytes
+        self._sliceable = True
+        self._length: Optional[int] = None
+        self._item_bytes = 0
+        self._items_seen = 0
+
+        self._chunks = self._fetch_chunks()
+        self._queue: Optional["Queue[Any]"] = None
+        self._stop = Event()
+        if read_ahead:
+            self._queue = Queue(maxsize=READ_AHEAD_CHUNKS)
+            self._thread = Thread(
+                target=self._read_ahead, name="syft-prefetch", daemon=True
+            )
+            self._thread.start()
+        self._current: Iterator[Any] = iter(())
+        self._exhausted = False
+
+    def _chunk_size(self) -> int:
+        if self.max_bytes is None or not self._items_seen:
+            return self.prefetch
+        item_bytes = max(self._item_bytes // self._items_seen, 1)
+        return max(1, min(self.prefetch, self.max_bytes // item_bytes))
+
+    def _get_slice(self, start: int, stop: int) -> List[Any]:
+        return list(self.pointer[start:stop].get())
+
+    def _get_items(self, start: int, stop: int) -> List[Any]:
+        # one .get() per item, for objects which can't be sliced
+        if self._length is None:
+            self._length = len(self.pointer)
+        return [self.pointer[i].get() for i in range(start, min(stop, self._length))]
+
+    def _fetch_chunks(self) -> Iterator[List[Any]]:
+        start = 0
+        while True:
+            stop = start + self._chunk_size()
+            if self._sliceable:
+                try:
+                    chunk = self._get_slice(start, stop)
+                except AuthorizationException:
+                    raise
+                except Exception as e:
+                    if start:
+                        raise
+                    warning(
+                        f"Can't slice {type(self.pointer).__name__} remotely, "
+                        + f"getting its items one by one instead. {e}"
+                    )
+                    self._sliceable = False
+                    chunk = self._get_items(start, stop)
+            else:
+                chunk = self._get_items(start, stop)
+
+            if chunk:
+                if self.max_bytes is not None:
+                    self._item_bytes += approx_size(chunk)
+                    self._items_seen += len(chunk)
+                yield chunk
+            # a short chunk is the end of the remote object
+            if len(chunk) < stop - start:
+                return
+            start = stop
+
+    def _read_ahead(self) -> None:
+        queue = self._queue
+        if queue is None:
+            return
+        try:
+            for chunk in self._chunks:
+                queue.put((chunk, None))
+                if self._stop.is_set():
+                    return
+            queue.put((None, None))
+        except Exception as e:
+            queue.put((None, e))
+
+    def _next_chunk(self) -> Optional[List[Any]]:
+        if self._queue is None:
+            return next(self._chunks, None)
+        chunk, exception = self._queue.get()
+        if exception is not None:
+            raise exception
+        return chunk
+
+    def __iter__(self) -> "PrefetchIterator":
+        return self
+
+    def __next__(self) -> Any:
+        while True:
+            for item in self._current:
+                return item
+            if self._exhausted:
+                raise StopIteration
+            try:
+                chunk = self._next_chunk()
+            except Exception:
+                self._exhausted = True
+                raise
+            if chunk is None:
+                self._exhausted = True
+                raise StopIteration
+            self._current = iter(chunk)
+
+    def close(self) -> None:
+        """Stop reading ahead, e.g. when breaking out of the loop early, once
+        the chunk being fetched has arrived."""
+        self._stop.set()
+        if self._queue is None:
+            return
+        while self._thread.is_alive():
+            # unblock the thread if it waits on a full queue
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._thread.join(timeout=0.1)
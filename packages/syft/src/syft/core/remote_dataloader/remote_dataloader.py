@@ -1,13 +1,27 @@
 # stdlib
+import os
+from queue import Empty
+from queue import Full
+from queue import Queue
+from threading import Event
+from threading import Thread
 from typing import Any
+from typing import Dict
 from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Union
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
+import numpy as np
 import torch as th
 from torch.utils.data import DataLoader
 from torch.utils.data import Dataset
+from torch.utils.data import Sampler
+from torch.utils.data import SubsetRandomSampler
 
 # syft relative
 from ... import deserialize
@@ -23,6 +37,107 @@ from ..common.serde.serializable import Serializable
 from ..common.serde.serializable import bind_protobuf
 
 DATA_TYPE_TORCH_TENSOR = "torch_tensor"
+# one or more .npy files, separated by os.pathsep, read through a memory map
+DATA_TYPE_NUMPY_MEMMAP = "numpy_memmap"
+
+
+class MemmapDataset(Dataset):
+    def __init__(self, paths: Sequence[str]):
+        """
+        A Dataset over .npy files which are memory mapped instead of loaded, so
+        it can be larger than the RAM of the node. Item i is row i of every
+        file, a single tensor for a single file, a tuple of tensors otherwise
+        (e.g. features and labels).
+        """
+        self.paths = list(paths)
+        self._arrays: Optional[List[np.ndarray]] = None
+        lengths = {len(array) for array in self.arrays}
+        if len(lengths) > 1:
+            traceback_and_raise(
+                ValueError(f"The files of a dataset must have as many rows: {paths}")
+            )
+
+    @property
+    def arrays(self) -> List[np.ndarray]:
+        # opened lazily so the DataLoader worker processes map the files
+        # themselves instead of receiving a copy
+        if self._arrays is None:
+            self._arrays = [np.load(path, mmap_mode="r") for path in self.paths]
+        return self._arrays
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"paths": self.paths, "_arrays": None}
+
+    def __len__(self) -> int:
+        return len(self.arrays[0])
+
+    def __getitem__(self, key: int) -> Union[th.Tensor, Tuple[th.Tensor, ...]]:
+        # copy the rows out of the read only map
+        rows = tuple(th.from_numpy(np.array(array[key])) for array in self.arrays)
+        return rows[0] if len(rows) == 1 else rows
+
+
+class BackgroundIterator:
+    """Iterates over `source` on a background thread, up to `prefetch` items
+    ahead, so the node's message loop doesn't wait for a batch to be built.
+    `close()` stops the thread, e.g. for an epoch which isn't iterated to its
+    end."""
+
+    def __init__(self, source: Iterator, prefetch: int) -> None:
+        self._source = source
+        self._queue: "Queue[Tuple[Any, Optional[BaseException]]]" = Queue(
+            maxsize=prefetch
+        )
+        self._done = False
+        self._stop = Event()
+        self._thread = Thread(target=self._fill, name="syft-dataloader", daemon=True)
+        self._thread.start()
+
+    def _put(self, entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        # waits for room in the queue until the iterator is closed
+        while not self._stop.is_set():
+            try:
+                self._queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _fill(self) -> None:
+        try:
+            for item in self._source:
+                if not self._put((item, None)):
+                    return
+            self._put((StopIteration, None))
+        except BaseException as e:
+            self._put((None, e))
+
+    def __iter__(self) -> "BackgroundIterator":
+        return self
+
+    def __next__(self) -> Any:
+        if self._done:
+            raise StopIteration
+        item, exception = self._queue.get()
+        if exception is not None:
+            self._done = True
+            raise exception
+        if item is StopIteration:
+            self._done = True
+            raise StopIteration
+        return item
+
+    def close(self) -> None:
+        """Stop the thread once the batch it builds is done and drop the
+        batches built ahead."""
+        self._done = True
+        self._stop.set()
+        self._thread.join()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                return
 
 
 @bind_protobuf
@@ -39,11 +154,18 @@ class RemoteDataset(Dataset, Serializable):
 
     def load_dataset(self) -> None:
         """
-        Load the real Dataset object on DO's machine.
-        But for now, it's just simply calling torch.load on a .pt file.
+        Load the real Dataset object on DO's machine: torch.load on a .pt file
+        storing a Dataset object, or a MemmapDataset over .npy files which are
+        read from disk as the items are accessed.
         """
         if self.data_type == DATA_TYPE_TORCH_TENSOR:
             self.dataset = th.load(self.path)
+        elif self.data_type == DATA_TYPE_NUMPY_MEMMAP:
+            self.dataset = MemmapDataset(self.path.split(os.pathsep))
+        else:
+            traceback_and_raise(
+                ValueError(f"Cannot load a dataset of type: {self.data_type}")
+            )
 
     def __len__(self) -> int:
         return len(self.dataset)
@@ -71,26 +193,61 @@ class RemoteDataset(Dataset, Serializable):
 
 @bind_protobuf
 class RemoteDataLoader(Serializable):
-    def __init__(self, remote_dataset: RemoteDataset, batch_size: int = 1):
+    def __init__(
+        self,
+        remote_dataset: RemoteDataset,
+        batch_size: int = 1,
+        shuffle: bool = False,
+        sampler: Optional[Sequence[int]] = None,
+        num_workers: int = 0,
+        prefetch_factor: int = 2,
+        drop_last: bool = False,
+    ):
         """
-        TODO: now, only batch_size can be passed in by users, and it's used when create
-        DataLoader object in self.create_dataloader. In future steps, more augmentations
-        should be supported, like shuffle, sampler, collate_fn, etc.
+        Arguments:
+            remote_dataset: the dataset to load the batches from.
+            batch_size, shuffle, num_workers, prefetch_factor, drop_last: like in
+                torch's DataLoader.
+            sampler: the indices of the samples to draw, in order or shuffled
+                with shuffle=True. A Sampler object can't be sent to the DO, so
+                only the indices are.
+        Without worker processes the batches are still built ahead of time,
+        `prefetch_factor` of them, on a background thread of the DO's node.
         """
         self.remote_dataset = remote_dataset
         self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.sampler = list(sampler) if sampler is not None else None
+        self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
+        self.drop_last = drop_last
+        self._epoch: Optional[BackgroundIterator] = None
 
     def _object2proto(self) -> RemoteDataLoader_PB:
         proto = RemoteDataLoader_PB()
         proto.batch_size = self.batch_size
         proto.remote_dataset.CopyFrom(serialize(self.remote_dataset))
+        proto.shuffle = self.shuffle
+        proto.num_workers = self.num_workers
+        proto.prefetch_factor = self.prefetch_factor
+        proto.drop_last = self.drop_last
+        if self.sampler is not None:
+            proto.sampler.extend(self.sampler)
         return proto
 
     @staticmethod
     def _proto2object(proto: Any) -> "RemoteDataLoader":
         remote_dataset = deserialize(proto.remote_dataset)
-        batch_size = proto.batch_size
-        return RemoteDataLoader(remote_dataset=remote_dataset, batch_size=batch_size)
+        return RemoteDataLoader(
+            remote_dataset=remote_dataset,
+            batch_size=proto.batch_size,
+            shuffle=proto.shuffle,
+            sampler=list(proto.sampler) if len(proto.sampler) else None,
+            num_workers=proto.num_workers,
+            # 0 is the default of messages from older clients
+            prefetch_factor=proto.prefetch_factor or 2,
+            drop_last=proto.drop_last,
+        )
 
     @staticmethod
     def get_protobuf_schema() -> GeneratedProtocolMessageType:
@@ -99,19 +256,57 @@ class RemoteDataLoader(Serializable):
     def load_dataset(self) -> None:
         self.remote_dataset.load_dataset()
 
+    def _create_sampler(self) -> Optional[Union[Sampler, List[int]]]:
+        if self.sampler is None:
+            return None
+        if self.shuffle:
+            return SubsetRandomSampler(self.sampler)
+        return self.sampler
+
     def create_dataloader(self) -> None:
-        if self.remote_dataset.data_type == DATA_TYPE_TORCH_TENSOR:
-            dataset = getattr(self.remote_dataset, "dataset", None)
-            self.dataloader = DataLoader(dataset=dataset, batch_size=self.batch_size)
-        else:
+        dataset = getattr(self.remote_dataset, "dataset", None)
+        if dataset is None:
             traceback_and_raise(
                 ValueError(
-                    "Cannot create a DataLoader for type: {self.remote_dataset.data_type}"
+                    f"Cannot create a DataLoader for type: {self.remote_dataset.data_type}"
+                    + ", was load_dataset called?"
                 )
             )
 
+        kwargs: Dict[str, Any] = {}
+        if self.num_workers > 0:
+            # torch refuses prefetch_factor without workers
+            kwargs["prefetch_factor"] = self.prefetch_factor
+            kwargs["persistent_workers"] = True
+
+        sampler = self._create_sampler()
+        self.dataloader = DataLoader(
+            dataset=dataset,
+            batch_size=self.batch_size,
+            # a sampler replaces shuffle
+            shuffle=self.shuffle and sampler is None,
+            sampler=sampler,
+            num_workers=self.num_workers,
+            drop_last=self.drop_last,
+            **kwargs,
+        )
+
     def __len__(self) -> int:
         return len(self.dataloader)
 
     def __iter__(self) -> "Iterator":
-        return iter(self.dataloader)
+        if self.num_workers > 0:
+            # the worker processes already build the batches ahead
+            return iter(self.dataloader)
+        # an epoch left before its end stops building batches
+        self.close()
+        self._epoch = BackgroundIterator(
+            iter(self.dataloader), prefetch=self.prefetch_factor
+        )
+        return self._epoch
+
+    def close(self) -> None:
+        """Stop building the batches of the current epoch ahead."""
+        if self._epoch is not None:
+            self._epoch.close()
+            self._epoch = None
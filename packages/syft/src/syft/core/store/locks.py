@@ -0,0 +1,172 @@
+# stdlib
+from contextlib import contextmanager
+from threading import Condition
+from threading import Lock
+from threading import local
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+# syft relative
+from ...logger import traceback_and_raise
+
+
+class RWLock:
+    """A readers-writer lock: many readers or a single writer at a time.
+    Waiting writers block new readers, so a stream of reads can't starve an
+    in-place mutation."""
+
+    __slots__ = ["_cond", "_readers", "_writer", "_waiting_writers", "users"]
+
+    def __init__(self) -> None:
+        self._cond = Condition(Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        # threads holding or waiting for the lock, see LockTable
+        self.users = 0
+
+    def acquire_read(self) -> None:
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    def upgrade(self) -> bool:
+        """Turn the read lock of the calling thread into a write lock, if no
+        other thread reads. Waiting for the other readers instead would
+        deadlock two threads upgrading at once."""
+        with self._cond:
+            if self._writer or self._readers != 1:
+                return False
+            self._readers = 0
+            self._writer = True
+            return True
+
+    def downgrade(self) -> None:
+        with self._cond:
+            self._writer = False
+            self._readers = 1
+            self._cond.notify_all()
+
+
+class LockTable:
+    """Readers-writer locks of the objects of a store, by key. A lock only
+    lives while some thread holds or waits for it.
+
+    Locks are reentrant: keys the calling thread already holds (e.g. an action
+    running a Plan, whose own actions read the Plan's inputs) are not locked
+    again. A key the thread holds for reading is upgraded to writing while no
+    other thread reads it, otherwise it has to be locked for writing up
+    front."""
+
+    def __init__(self) -> None:
+        self._mutex = Lock()
+        self._locks: Dict[Hashable, RWLock] = {}
+        self._thread = local()
+
+    def _held_keys(self) -> Dict[Hashable, bool]:
+        """The keys the calling thread holds, True for those held to write."""
+        try:
+            return self._thread.keys
+        except AttributeError:
+            self._thread.keys = {}
+            return self._thread.keys
+
+    def _checkout(self, key: Hashable) -> RWLock:
+        with self._mutex:
+            lock = self._locks.get(key, None)
+            if lock is None:
+                lock = self._locks[key] = RWLock()
+            lock.users += 1
+            return lock
+
+    def _checkin(self, key: Hashable, lock: RWLock) -> None:
+        with self._mutex:
+            lock.users -= 1
+            if not lock.users:
+                del self._locks[key]
+
+    @contextmanager
+    def hold(
+        self, read: Iterable[Hashable] = (), write: Iterable[Hashable] = ()
+    ) -> Iterator[None]:
+        """Hold read locks on the `read` keys and write locks on the `write`
+        keys. The locks are always taken in the same (sorted) order, so two
+        threads locking overlapping sets of objects can't deadlock."""
+        modes: Dict[Hashable, bool] = {key: False for key in read}
+        modes.update({key: True for key in write})
+        held_keys = self._held_keys()
+        upgrades = [
+            key
+            for key in modes
+            if key in held_keys and modes[key] and not held_keys[key]
+        ]
+        for key in [key for key in modes if key in held_keys]:
+            del modes[key]
+
+        held: List[Tuple[Hashable, RWLock, bool]] = []
+        upgraded: List[Tuple[Hashable, RWLock]] = []
+        try:
+            for key in upgrades:
+                with self._mutex:
+                    lock = self._locks[key]
+                if not lock.upgrade():
+                    traceback_and_raise(
+                        RuntimeError(
+                            f"Can't write {key}, it is already held for reading by "
+                            + "this thread and read by another one. Lock it for "
+                            + "writing up front."
+                        )
+                    )
+                upgraded.append((key, lock))
+                held_keys[key] = True
+            for key in sorted(modes, key=str):
+                lock = self._checkout(key)
+                try:
+                    if modes[key]:
+                        lock.acquire_write()
+                    else:
+                        lock.acquire_read()
+                except BaseException:
+                    self._checkin(key, lock)
+                    raise
+                held.append((key, lock, modes[key]))
+                held_keys[key] = modes[key]
+            yield
+        finally:
+            for key, lock, write_mode in reversed(held):
+                del held_keys[key]
+                if write_mode:
+                    lock.release_write()
+                else:
+                    lock.release_read()
+                self._checkin(key, lock)
+            for key, lock in reversed(upgraded):
+                held_keys[key] = False
+                lock.downgrade()
+
+    def __len__(self) -> int:
+        return len(self._locks)
@@ -1,5 +1,6 @@
 # stdlib
 from abc import ABC
+from typing import ContextManager
 from typing import Iterable
 from typing import Optional
 from typing import Type
@@ -9,6 +10,7 @@ from ...logger import debug
 from ...logger import traceback_and_raise
 from ..common.storeable_object import AbstractStorableObject
 from ..common.uid import UID
+from .locks import LockTable
 from .storeable_object import StorableObject
 
 
@@ -19,6 +21,26 @@ class ObjectStore(ABC):
     by using UID objects, while de-indexed value should always be a SerizableObject.
     """
 
+    def __init__(self) -> None:
+        self._locks = LockTable()
+
+    def lock(
+        self, read: Iterable[UID] = (), write: Iterable[UID] = ()
+    ) -> ContextManager[None]:
+        """
+        Method to lock objects of the store while an action works on them, so actions of
+        concurrent messages (see NodeExecutor) don't mutate an object another action is
+        reading. Objects are locked by UID, whether or not they are in the store yet.
+
+        Args:
+            read (Iterable[UID]): the objects read by the action, shared with other readers.
+            write (Iterable[UID]): the objects created, mutated or deleted by the action.
+
+        Returns:
+            ContextManager[None]: holds the locks while inside the with block.
+        """
+        return self._locks.hold(read=read, write=write)
+
     def __sizeof__(self) -> int:
         """
         Method to return the memory size of the object if possible, if not, it will return __len__.
@@ -38,7 +38,8 @@ class MemoryStore(ObjectStore):
         return self._objects.get(key, None)
 
     def get_objects_of_type(self, obj_type: type) -> Iterable[StorableObject]:
-        return [obj for obj in self.values() if isinstance(obj.data, obj_type)]
+        # snapshot, actions on other threads may be adding objects
+        return [obj for obj in list(self.values()) if isinstance(obj.data, obj_type)]
 
     def __sizeof__(self) -> int:
         return self._objects.__sizeof__()
@@ -7,6 +7,8 @@ class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._regenerate_numpy_serde: Optional[Callable] = None
+        self._TRUSTED_LOOPBACK = False
+        self._SIGNED_MESSAGE_FRAMES = False
 
     @property
     def APACHE_ARROW_TENSOR_SERDE(self) -> bool:
@@ -25,5 +27,26 @@ class ExperimentalFlags:
         if self._regenerate_numpy_serde:
             self._regenerate_numpy_serde()
 
+    @property
+    def TRUSTED_LOOPBACK(self) -> bool:
+        """Skip sign/verify on new in-process (VM <-> Device) virtual connections."""
+        return self._TRUSTED_LOOPBACK
+
+    @TRUSTED_LOOPBACK.setter
+    def TRUSTED_LOOPBACK(self, value: bool) -> None:
+        self._TRUSTED_LOOPBACK = value
+
+    @property
+    def SIGNED_MESSAGE_FRAMES(self) -> bool:
+        """Write SignedMessages in their own wire frame instead of a DataMessage.
+
+        Every version which reads the frame also reads the DataMessage, so turn
+        it on once all the peers are new enough to read it."""
+        return self._SIGNED_MESSAGE_FRAMES
+
+    @SIGNED_MESSAGE_FRAMES.setter
+    def SIGNED_MESSAGE_FRAMES(self, value: bool) -> None:
+        self._SIGNED_MESSAGE_FRAMES = value
+
 
 flags = ExperimentalFlags()
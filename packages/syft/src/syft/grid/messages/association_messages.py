@@ -1,5 +1,4 @@
 # stdlib
-import json
 from typing import Dict
 from typing import Optional
 
@@ -14,6 +13,8 @@ from syft.core.common.message import ImmediateSyftMessageWithoutReply
 from syft.core.common.serde.deserialize import _deserialize
 from syft.core.common.uid import UID
 from syft.core.io.address import Address
+from syft.grid.messages.content_encoding import decode_content
+from syft.grid.messages.content_encoding import encode_content
 from syft.proto.grid.messages.association_messages_pb2 import (
     DeleteAssociationRequestMessage as DeleteAssociationRequestMessage_PB,
 )
@@ -83,7 +84,7 @@ class SendAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return SendAssociationRequestMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -104,7 +105,7 @@ class SendAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return SendAssociationRequestMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -156,7 +157,7 @@ class SendAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -177,7 +178,7 @@ class SendAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -226,7 +227,7 @@ class ReceiveAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return ReceiveAssociationRequestMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -247,7 +248,7 @@ class ReceiveAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return ReceiveAssociationRequestMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -299,7 +300,7 @@ class ReceiveAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -320,7 +321,7 @@ class ReceiveAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -369,7 +370,7 @@ class RespondAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return RespondAssociationRequestMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -390,7 +391,7 @@ class RespondAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return RespondAssociationRequestMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -442,7 +443,7 @@ class RespondAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -463,7 +464,7 @@ class RespondAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -512,7 +513,7 @@ class GetAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return GetAssociationRequestMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -533,7 +534,7 @@ class GetAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return GetAssociationRequestMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -585,7 +586,7 @@ class GetAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -606,7 +607,7 @@ class GetAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -655,7 +656,7 @@ class GetAssociationRequestsMessage(ImmediateSyftMessageWithReply):
         return GetAssociationRequestsMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -676,7 +677,7 @@ class GetAssociationRequestsMessage(ImmediateSyftMessageWithReply):
         return GetAssociationRequestsMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -728,7 +729,7 @@ class GetAssociationRequestsResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -749,7 +750,7 @@ class GetAssociationRequestsResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -798,7 +799,7 @@ class DeleteAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return DeleteAssociationRequestMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -819,7 +820,7 @@ class DeleteAssociationRequestMessage(ImmediateSyftMessageWithReply):
         return DeleteAssociationRequestMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -871,7 +872,7 @@ class DeleteAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -892,7 +893,7 @@ class DeleteAssociationRequestResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -0,0 +1,59 @@
+"""Encoding of the `content` payload of the grid messages.
+
+The content used to travel as a JSON string inside the protobuf message, so
+every hop paid a text dump/load on top of protobuf and binary values had to
+be base64/hex'd into strings. It now travels as msgpack by default, which
+keeps ints, floats, bools, None, str and raw bytes apart.
+
+The encoding can be switched per message class, e.g. back to JSON to talk to
+a peer which only understands JSON content:
+
+    set_content_encoding(GetTensorsMessage, ContentEncoding.JSON)
+
+Decoding doesn't depend on that setting: msgpack payloads start with 0xC1, a
+byte that neither msgpack nor UTF-8 ever produce, anything else is JSON, so
+content sent by older peers is still understood.
+"""
+
+# stdlib
+from enum import Enum
+import json
+from typing import Any
+from typing import Dict
+from typing import Union
+
+# third party
+import msgpack
+
+
+class ContentEncoding(Enum):
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+MSGPACK_MARKER = b"\xc1"
+DEFAULT_CONTENT_ENCODING = ContentEncoding.MSGPACK
+
+content_encodings: Dict[type, ContentEncoding] = {}
+
+
+def set_content_encoding(message_type: type, encoding: ContentEncoding) -> None:
+    """Select the encoding used to send the content of a message class."""
+    content_encodings[message_type] = encoding
+
+
+def encode_content(content: Any, message_type: type) -> bytes:
+    encoding = content_encodings.get(message_type, DEFAULT_CONTENT_ENCODING)
+    if encoding == ContentEncoding.MSGPACK:
+        try:
+            return MSGPACK_MARKER + msgpack.packb(content, use_bin_type=True)
+        except OverflowError:
+            # ints beyond 64 bits, JSON can hold them
+            pass
+    return json.dumps(content).encode("utf-8")
+
+
+def decode_content(blob: Union[bytes, str]) -> Any:
+    if isinstance(blob, bytes) and blob[:1] == MSGPACK_MARKER:
+        return msgpack.unpackb(memoryview(blob)[1:], raw=False, strict_map_key=False)
+    return json.loads(blob)
@@ -1,5 +1,4 @@
 # stdlib
-import json
 from typing import Dict
 from typing import Optional
 
@@ -15,6 +14,8 @@ from syft.core.common.serde.deserialize import _deserialize
 from syft.core.common.serde.serializable import bind_protobuf
 from syft.core.common.uid import UID
 from syft.core.io.address import Address
+from syft.grid.messages.content_encoding import decode_content
+from syft.grid.messages.content_encoding import encode_content
 from syft.proto.grid.messages.dataset_messages_pb2 import (
     CreateDatasetMessage as CreateDatasetMessage_PB,
 )
@@ -87,7 +88,7 @@ class CreateDatasetMessage(ImmediateSyftMessageWithReply):
         return CreateDatasetMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -108,7 +109,7 @@ class CreateDatasetMessage(ImmediateSyftMessageWithReply):
         return CreateDatasetMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -160,7 +161,7 @@ class CreateDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -181,7 +182,7 @@ class CreateDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -230,7 +231,7 @@ class GetDatasetMessage(ImmediateSyftMessageWithReply):
         return GetDatasetMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -251,7 +252,7 @@ class GetDatasetMessage(ImmediateSyftMessageWithReply):
         return GetDatasetMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -303,7 +304,7 @@ class GetDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -324,7 +325,7 @@ class GetDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -373,7 +374,7 @@ class GetDatasetsMessage(ImmediateSyftMessageWithReply):
         return GetDatasetsMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -394,7 +395,7 @@ class GetDatasetsMessage(ImmediateSyftMessageWithReply):
         return GetDatasetsMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -446,7 +447,7 @@ class GetDatasetsResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -467,7 +468,7 @@ class GetDatasetsResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -516,7 +517,7 @@ class GetDatasetInfoMessage(ImmediateSyftMessageWithReply):
         return GetDatasetInfoMessage_PB(
             msg_id=self.id.serialize(),
             address=self.address.serialize(),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=self.reply_to.serialize(),
         )
 
@@ -537,7 +538,7 @@ class GetDatasetInfoMessage(ImmediateSyftMessageWithReply):
         return GetDatasetInfoMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -589,7 +590,7 @@ class GetDatasetInfoResponse(ImmediateSyftMessageWithoutReply):
             msg_id=self.id.serialize(),
             address=self.address.serialize(),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -610,7 +611,7 @@ class GetDatasetInfoResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -659,7 +660,7 @@ class GetDatasetsInfoMessage(ImmediateSyftMessageWithReply):
         return GetDatasetsInfoMessage_PB(
             msg_id=self.id.serialize(),
             address=self.address.serialize(),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=self.reply_to.serialize(),
         )
 
@@ -680,7 +681,7 @@ class GetDatasetsInfoMessage(ImmediateSyftMessageWithReply):
         return GetDatasetsInfoMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -732,7 +733,7 @@ class GetDatasetsInfoResponse(ImmediateSyftMessageWithoutReply):
             msg_id=self.id.serialize(),
             address=self.address.serialize(),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -753,7 +754,7 @@ class GetDatasetsInfoResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -802,7 +803,7 @@ class UpdateDatasetMessage(ImmediateSyftMessageWithReply):
         return UpdateDatasetMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -823,7 +824,7 @@ class UpdateDatasetMessage(ImmediateSyftMessageWithReply):
         return UpdateDatasetMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -875,7 +876,7 @@ class UpdateDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -896,7 +897,7 @@ class UpdateDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -945,7 +946,7 @@ class DeleteDatasetMessage(ImmediateSyftMessageWithReply):
         return DeleteDatasetMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -966,7 +967,7 @@ class DeleteDatasetMessage(ImmediateSyftMessageWithReply):
         return DeleteDatasetMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -1018,7 +1019,7 @@ class DeleteDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -1039,7 +1040,7 @@ class DeleteDatasetResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
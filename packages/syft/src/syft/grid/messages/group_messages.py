@@ -1,5 +1,4 @@
 # stdlib
-import json
 from typing import Dict
 from typing import Optional
 
@@ -15,6 +14,8 @@ from syft.core.common.serde.deserialize import _deserialize
 from syft.core.common.serde.serializable import bind_protobuf
 from syft.core.common.uid import UID
 from syft.core.io.address import Address
+from syft.grid.messages.content_encoding import decode_content
+from syft.grid.messages.content_encoding import encode_content
 from syft.proto.grid.messages.group_messages_pb2 import (
     CreateGroupMessage as CreateGroupMessage_PB,
 )
@@ -75,7 +76,7 @@ class CreateGroupMessage(ImmediateSyftMessageWithReply):
         return CreateGroupMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -96,7 +97,7 @@ class CreateGroupMessage(ImmediateSyftMessageWithReply):
         return CreateGroupMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -148,7 +149,7 @@ class CreateGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -169,7 +170,7 @@ class CreateGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -218,7 +219,7 @@ class GetGroupMessage(ImmediateSyftMessageWithReply):
         return GetGroupMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -239,7 +240,7 @@ class GetGroupMessage(ImmediateSyftMessageWithReply):
         return GetGroupMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -291,7 +292,7 @@ class GetGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -312,7 +313,7 @@ class GetGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -361,7 +362,7 @@ class GetGroupsMessage(ImmediateSyftMessageWithReply):
         return GetGroupsMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -382,7 +383,7 @@ class GetGroupsMessage(ImmediateSyftMessageWithReply):
         return GetGroupsMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -434,7 +435,7 @@ class GetGroupsResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -455,7 +456,7 @@ class GetGroupsResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -504,7 +505,7 @@ class UpdateGroupMessage(ImmediateSyftMessageWithReply):
         return UpdateGroupMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -525,7 +526,7 @@ class UpdateGroupMessage(ImmediateSyftMessageWithReply):
         return UpdateGroupMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -577,7 +578,7 @@ class UpdateGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -598,7 +599,7 @@ class UpdateGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -647,7 +648,7 @@ class DeleteGroupMessage(ImmediateSyftMessageWithReply):
         return DeleteGroupMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -668,7 +669,7 @@ class DeleteGroupMessage(ImmediateSyftMessageWithReply):
         return DeleteGroupMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -720,7 +721,7 @@ class DeleteGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -741,7 +742,7 @@ class DeleteGroupResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -1,5 +1,4 @@
 # stdlib
-import json
 from typing import Dict
 from typing import Optional
 
@@ -15,6 +14,8 @@ from syft.core.common.serde.deserialize import _deserialize
 from syft.core.common.serde.serializable import bind_protobuf
 from syft.core.common.uid import UID
 from syft.core.io.address import Address
+from syft.grid.messages.content_encoding import decode_content
+from syft.grid.messages.content_encoding import encode_content
 from syft.proto.grid.messages.infra_messages_pb2 import (
     CreateWorkerMessage as CreateWorkerMessage_PB,
 )
@@ -81,7 +82,7 @@ class CreateWorkerMessage(ImmediateSyftMessageWithReply):
         return CreateWorkerMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -102,7 +103,7 @@ class CreateWorkerMessage(ImmediateSyftMessageWithReply):
         return CreateWorkerMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -154,7 +155,7 @@ class CreateWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -175,7 +176,7 @@ class CreateWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -224,7 +225,7 @@ class GetWorkerInstanceTypesMessage(ImmediateSyftMessageWithReply):
         return GetWorkerInstanceTypesMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -245,7 +246,7 @@ class GetWorkerInstanceTypesMessage(ImmediateSyftMessageWithReply):
         return GetWorkerInstanceTypesMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -297,7 +298,7 @@ class GetWorkerInstanceTypesResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -318,7 +319,7 @@ class GetWorkerInstanceTypesResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -367,7 +368,7 @@ class GetWorkerMessage(ImmediateSyftMessageWithReply):
         return GetWorkerMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -388,7 +389,7 @@ class GetWorkerMessage(ImmediateSyftMessageWithReply):
         return GetWorkerMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -440,7 +441,7 @@ class GetWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -461,7 +462,7 @@ class GetWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -510,7 +511,7 @@ class GetWorkersMessage(ImmediateSyftMessageWithReply):
         return GetWorkersMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -531,7 +532,7 @@ class GetWorkersMessage(ImmediateSyftMessageWithReply):
         return GetWorkersMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -583,7 +584,7 @@ class GetWorkersResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -604,7 +605,7 @@ class GetWorkersResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -653,7 +654,7 @@ class UpdateWorkerMessage(ImmediateSyftMessageWithReply):
         return UpdateWorkerMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -674,7 +675,7 @@ class UpdateWorkerMessage(ImmediateSyftMessageWithReply):
         return UpdateWorkerMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -726,7 +727,7 @@ class UpdateWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -747,7 +748,7 @@ class UpdateWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
@@ -796,7 +797,7 @@ class DeleteWorkerMessage(ImmediateSyftMessageWithReply):
         return DeleteWorkerMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -817,7 +818,7 @@ class DeleteWorkerMessage(ImmediateSyftMessageWithReply):
         return DeleteWorkerMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -869,7 +870,7 @@ class DeleteWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -890,7 +891,7 @@ class DeleteWorkerResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
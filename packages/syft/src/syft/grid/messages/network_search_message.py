@@ -1,5 +1,4 @@
 # stdlib
-import json
 from typing import Dict
 from typing import Optional
 
@@ -15,6 +14,8 @@ from syft.core.common.serde.deserialize import _deserialize
 from syft.core.common.serde.serializable import bind_protobuf
 from syft.core.common.uid import UID
 from syft.core.io.address import Address
+from syft.grid.messages.content_encoding import decode_content
+from syft.grid.messages.content_encoding import encode_content
 from syft.proto.grid.messages.network_search_messages_pb2 import (
     NetworkSearchMessage as NetworkSearchMessage_PB,
 )
@@ -51,7 +52,7 @@ class NetworkSearchMessage(ImmediateSyftMessageWithReply):
         return NetworkSearchMessage_PB(
             msg_id=serialize(self.id),
             address=serialize(self.address),
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
             reply_to=serialize(self.reply_to),
         )
 
@@ -72,7 +73,7 @@ class NetworkSearchMessage(ImmediateSyftMessageWithReply):
         return NetworkSearchMessage(
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
             reply_to=_deserialize(blob=proto.reply_to),
         )
 
@@ -124,7 +125,7 @@ class NetworkSearchResponse(ImmediateSyftMessageWithoutReply):
             msg_id=serialize(self.id),
             address=serialize(self.address),
             status_code=self.status_code,
-            content=json.dumps(self.content),
+            content=encode_content(self.content, type(self)),
         )
 
     @staticmethod
@@ -145,7 +146,7 @@ class NetworkSearchResponse(ImmediateSyftMessageWithoutReply):
             msg_id=_deserialize(blob=proto.msg_id),
             address=_deserialize(blob=proto.address),
             status_code=proto.status_code,
-            content=json.loads(proto.content),
+            content=decode_content(proto.content),
         )
 
     @staticmethod
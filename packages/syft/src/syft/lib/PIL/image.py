@@ -1,35 +1,168 @@
+"""Serialization of PIL images.
+
+An image is sent as its raw pixel buffer along with its mode and size, so it
+costs what it takes in memory, e.g. a byte per channel and pixel for an 8 bit
+image, and comes back with the same mode.
+
+Within an `encoding()` block images are saved in a format PIL can write
+instead, lossless like PNG or lossless WebP or lossy like JPEG:
+
+    with sy.lib.PIL.image.encoding("PNG", compress_level=1):
+        ptr = image.send(duet)
+
+    with sy.lib.PIL.image.encoding("WEBP", quality=80, batch=images):
+        ptr = sy.lib.python.List(images).send(duet)
+
+The keyword arguments go to `Image.save`. The images passed as `batch` are all
+encoded up front in one pass over a thread pool, rather than one after the
+other as the List is serialized.
+
+Only the formats of ENCODED_FORMATS are decoded, and no image larger than
+`PIL.Image.MAX_IMAGE_PIXELS` is decoded at all.
+"""
+
+# stdlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
 # third party
 import PIL
-import numpy as np
-import torch
-import torchvision
+import PIL.Image
 
 # syft relative
 from ...generate_wrapper import GenerateWrapper
-from ...lib.torch.tensor_util import protobuf_tensor_deserializer
-from ...lib.torch.tensor_util import protobuf_tensor_serializer
-from ...proto.lib.torch.tensor_pb2 import TensorData
+from ...logger import traceback_and_raise
+from ...proto.lib.PIL.image_pb2 import ImageProto
+
+# the format of images sent as their raw pixels
+RAW = ""
+# the formats images can be sent in, the only ones decoded when received
+ENCODED_FORMATS = ("PNG", "WEBP", "JPEG")
+
+_local = threading.local()
+
+
+class Encoding:
+    def __init__(self, format: str = RAW, **params: Any) -> None:
+        self.format = format.upper()
+        if self.format != RAW and self.format not in ENCODED_FORMATS:
+            traceback_and_raise(
+                ValueError(
+                    f"Images can't be sent as {format}, only as one of "
+                    + f"{ENCODED_FORMATS}"
+                )
+            )
+        self.params = params
+        # encoded images by id, with the image to make sure the id is its own
+        self._encoded: Dict[int, Tuple[PIL.Image.Image, bytes]] = {}
+
+    def encode(self, image: PIL.Image.Image) -> bytes:
+        encoded = self._encoded.get(id(image))
+        if encoded is not None and encoded[0] is image:
+            return encoded[1]
+        buffer = BytesIO()
+        image.save(buffer, format=self.format, **self.params)
+        return buffer.getvalue()
+
+    def encode_batch(
+        self, images: Iterable[PIL.Image.Image], workers: Optional[int] = None
+    ) -> None:
+        """Encode `images` ahead of their serialization, on a thread pool."""
+        images = list(images)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for image, data in zip(images, pool.map(self.encode, images)):
+                self._encoded[id(image)] = (image, data)
+
+
+def current_encoding() -> Optional[Encoding]:
+    return getattr(_local, "encoding", None)
+
+
+@contextmanager
+def encoding(
+    format: str,
+    batch: Optional[Iterable[PIL.Image.Image]] = None,
+    workers: Optional[int] = None,
+    **params: Any,
+) -> Iterator[Encoding]:
+    """Send the images serialized in this block in `format`, see above."""
+    previous = current_encoding()
+    current = Encoding(format, **params)
+    if batch is not None and current.format != RAW:
+        current.encode_batch(batch, workers=workers)
+    _local.encoding = current
+    try:
+        yield current
+    finally:
+        _local.encoding = previous
+
+
+def object2proto(obj: PIL.Image.Image) -> ImageProto:
+    proto = ImageProto(mode=obj.mode, width=obj.width, height=obj.height)
+    current = current_encoding()
+    if current is not None and current.format != RAW:
+        proto.format = current.format
+        proto.data = current.encode(obj)
+        return proto
+
+    proto.data = obj.tobytes()
+    if obj.mode in ("P", "PA") and obj.palette is not None:
+        proto.palette_mode = obj.palette.mode
+        proto.palette = obj.palette.tobytes()
+    return proto
 
 
-def object2proto(obj: PIL.Image.Image) -> TensorData:
-    image_tensor = torch.Tensor(np.array(obj))
-    tensor_proto = protobuf_tensor_serializer(image_tensor)
+def check_size(width: int, height: int) -> None:
+    max_pixels = PIL.Image.MAX_IMAGE_PIXELS
+    if max_pixels is not None and width * height > max_pixels:
+        traceback_and_raise(
+            ValueError(
+                f"Image of {width}x{height} pixels is larger than the "
+                + f"{max_pixels} pixels of PIL.Image.MAX_IMAGE_PIXELS"
+            )
+        )
 
-    return tensor_proto
 
+def proto2object(proto: ImageProto) -> PIL.Image.Image:
+    check_size(proto.width, proto.height)
+    if proto.format:
+        if proto.format not in ENCODED_FORMATS:
+            traceback_and_raise(
+                ValueError(f"Images sent as {proto.format} are not decoded")
+            )
+        image = PIL.Image.open(BytesIO(proto.data), formats=[proto.format])
+        # the header read by open, the pixels are only decoded by load
+        if image.size != (proto.width, proto.height):
+            traceback_and_raise(
+                ValueError(
+                    f"Image of {image.width}x{image.height} pixels was sent as "
+                    + f"{proto.width}x{proto.height}"
+                )
+            )
+        image.load()
+        # e.g. WebP decodes grayscale images as RGB
+        if image.mode != proto.mode:
+            image = image.convert(proto.mode)
+        return image
 
-def proto2object(proto: TensorData) -> PIL.Image.Image:
-    image_tensor = protobuf_tensor_deserializer(proto)
-    if image_tensor.dim() == 3:
-        image_tensor = image_tensor.permute(2, 0, 1)
-    image_obj = torchvision.transforms.functional.to_pil_image(image_tensor)
-    return image_obj
+    image = PIL.Image.frombytes(proto.mode, (proto.width, proto.height), proto.data)
+    if proto.palette:
+        image.putpalette(proto.palette, rawmode=proto.palette_mode)
+    return image
 
 
 GenerateWrapper(
     wrapped_type=PIL.Image.Image,
     import_path="PIL.Image.Image",
-    protobuf_scheme=TensorData,
+    protobuf_scheme=ImageProto,
     type_object2proto=object2proto,
     type_proto2object=proto2object,
 )
@@ -24,6 +24,7 @@ from ..core.node.abstract.node import AbstractNodeClient
 from ..lib.plan import create_plan_ast
 from ..lib.python import create_python_ast
 from ..lib.remote_dataloader import create_remote_dataloader_ast
+from ..lib.torch import create_state_sync_ast
 from ..lib.torch import create_torch_ast
 from ..lib.torchvision import create_torchvision_ast
 from ..logger import critical
@@ -220,6 +221,7 @@ def create_lib_ast(client: Optional[Any] = None) -> Globals:
     # numpy_ast = create_numpy_ast()
     plan_ast = create_plan_ast(client=client)
     remote_dataloader_ast = create_remote_dataloader_ast(client=client)
+    state_sync_ast = create_state_sync_ast(client=client)
 
     lib_ast = Globals(client=client)
     lib_ast.add_attr(attr_name="syft", attr=python_ast.attrs["syft"])
@@ -229,6 +231,7 @@ def create_lib_ast(client: Optional[Any] = None) -> Globals:
     lib_ast.syft.core.add_attr(
         "remote_dataloader", remote_dataloader_ast.syft.core.remote_dataloader
     )
+    lib_ast.syft.lib.add_attr("torch", attr=state_sync_ast.syft.lib.torch)
 
     # let the misc creation be always the last, as it needs the full ast solved
     # to properly generated unions
@@ -1,13 +1,11 @@
 # third party
 import numpy as np
 import pyarrow as pa
-import torch
 
 # syft relative
 from ...experimental_flags import flags
 from ...generate_wrapper import GenerateWrapper
 from ...lib.torch.tensor_util import protobuf_tensor_deserializer
-from ...lib.torch.tensor_util import protobuf_tensor_serializer
 from ...proto.lib.numpy.array_pb2 import NumpyProto
 from ...proto.lib.numpy.array_pb2 import NumpyProtoArrow
 
@@ -31,26 +29,24 @@ SUPPORTED_FLOAT_TYPES = [
 
 SUPPORTED_DTYPES = SUPPORTED_BOOL_TYPES + SUPPORTED_INT_TYPES + SUPPORTED_FLOAT_TYPES
 
-DTYPE_REFACTOR = {
-    np.dtype("uint16"): np.int16,
-    np.dtype("uint32"): np.int32,
-    np.dtype("uint64"): np.int64,
-}
+# the raw buffer of NumpyProto is always little endian and in C order
+WIRE_BYTEORDER = "<"
 
 
 def arrow_object2proto(obj: np.ndarray) -> NumpyProtoArrow:
+    # arrow only takes native byte order, this is a no-op for contiguous arrays
+    obj = np.ascontiguousarray(obj, dtype=obj.dtype.newbyteorder("="))
     apache_arrow = pa.Tensor.from_numpy(obj=obj)
-    sink = pa.BufferOutputStream()
-    pa.ipc.write_tensor(apache_arrow, sink)
-    buf = sink.getvalue().to_pybytes()
-    proto = NumpyProtoArrow(data=buf)
+    # write straight into a buffer of the final size instead of a growing stream
+    buf = pa.allocate_buffer(pa.ipc.get_tensor_size(apache_arrow))
+    pa.ipc.write_tensor(apache_arrow, pa.FixedSizeBufferWriter(buf))
+    proto = NumpyProtoArrow(data=buf.to_pybytes())
     return proto
 
 
 def arrow_proto2object(proto: NumpyProtoArrow) -> np.ndarray:
-    reader = pa.BufferReader(proto.data)
-    buf = reader.read_buffer()
-    result = pa.ipc.read_tensor(buf)
+    # py_buffer wraps the message bytes without copying them
+    result = pa.ipc.read_tensor(pa.py_buffer(proto.data))
     np_array = result.to_numpy()
     np_array.setflags(write=True)
     return np_array
@@ -58,27 +54,34 @@ def arrow_proto2object(proto: NumpyProtoArrow) -> np.ndarray:
 
 def protobuf_object2proto(obj: np.ndarray) -> NumpyProto:
     original_dtype = obj.dtype
-    if original_dtype not in SUPPORTED_DTYPES:
+    if original_dtype.newbyteorder("=") not in SUPPORTED_DTYPES:
         raise NotImplementedError(f"{original_dtype} is not supported")
 
-    if original_dtype in DTYPE_REFACTOR:
-        # store as a signed int, the negative wrap around values convert back to the
-        # same original unsigned values on the other side
-        obj = obj.astype(DTYPE_REFACTOR[original_dtype])
+    wire_dtype = original_dtype.newbyteorder(WIRE_BYTEORDER)
+    if original_dtype != wire_dtype:
+        obj = obj.astype(wire_dtype)
 
-    tensor = torch.from_numpy(obj).clone()
-    tensor_proto = protobuf_tensor_serializer(tensor)
-    dtype = original_dtype.name
-    return NumpyProto(tensor=tensor_proto, dtype=dtype)
+    # tobytes is the only copy, it also lays out non contiguous arrays in C order
+    return NumpyProto(
+        data=obj.tobytes(order="C"), shape=obj.shape, dtype=original_dtype.name
+    )
 
 
 def protobuf_proto2object(proto: NumpyProto) -> np.ndarray:
-    tensor = protobuf_tensor_deserializer(proto.tensor)
-    array = tensor.to("cpu").detach().numpy().copy()
-    str_dtype = proto.dtype
-    original_dtype = np.dtype(str_dtype)
-    obj = array.astype(original_dtype)
-    return obj
+    original_dtype = np.dtype(proto.dtype)
+
+    if proto.HasField("tensor"):
+        # arrays serialized by older versions went through a torch tensor
+        tensor = protobuf_tensor_deserializer(proto.tensor)
+        array = tensor.to("cpu").detach().numpy()
+        return array.astype(original_dtype)
+
+    array = np.frombuffer(
+        proto.data, dtype=original_dtype.newbyteorder(WIRE_BYTEORDER)
+    ).reshape(tuple(proto.shape))
+    # the view on the message bytes is read only, astype makes the one writeable
+    # copy in native byte order
+    return array.astype(original_dtype)
 
 
 def _generate_serde() -> None:
@@ -0,0 +1,397 @@
+"""Serialization of fitted models, e.g. sklearn estimators, xgboost Boosters
+and statsmodels results.
+
+A model is written attribute by attribute, following the same protocol as
+pickle (`__reduce_ex__`, `__getstate__` and `__setstate__`), into a JSON
+skeleton which holds the primitive values like hyperparameters. numpy arrays
+are stored next to it as raw buffers with the numpy serde, byte strings (e.g.
+the raw model of a Booster) as they are, and objects with a syft serde of
+their own (e.g. a pandas DataFrame) serialized by it. Objects and arrays
+referred to several times are written once.
+
+Unlike pickle, reading a model back calls no function of the sender's choice.
+Objects are created with `cls.__new__(cls)` and their state set as pickle
+does, and only for the classes of the packages in `REBUILD_PACKAGES`, which
+don't define a `__new__` of their own, or the classes in `REBUILD_CLASSES`.
+Only the classes in `CONSTRUCTED_CLASSES`, whose objects can't be created
+empty, are called with the arguments in the model.
+"""
+
+# stdlib
+import ast
+import copyreg
+import importlib
+import json
+import types
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# third party
+import numpy as np
+
+# syft relative
+from ...core.common.serde.deserialize import _deserialize as deserialize
+from ...core.common.serde.serialize import _serialize as serialize
+from ...generate_wrapper import GenerateWrapper
+from ...logger import traceback_and_raise
+from ...proto.lib.numpy.array_pb2 import NumpyProto
+from ...proto.lib.numpy.model_pb2 import ModelProto
+from .array import SUPPORTED_DTYPES
+from .array import protobuf_object2proto
+from .array import protobuf_proto2object
+
+# packages of the models, their objects are always written attribute by attribute
+MODEL_PACKAGES = ("sklearn", "xgboost", "statsmodels")
+# packages whose classes are created when reading a model back
+REBUILD_PACKAGES = MODEL_PACKAGES
+# classes of other packages created when reading a model back
+REBUILD_CLASSES = {
+    f"scipy.sparse._{kind}.{kind}_{container}"
+    for kind in ("csr", "csc", "coo")
+    for container in ("matrix", "array")
+}
+# the classes called with the arguments in the model, e.g. the sizes of a Tree
+CONSTRUCTED_CLASSES = {"sklearn.tree._tree.Tree"}
+# packages whose classes and functions a model may refer to, e.g. as a
+# hyperparameter like `dtype=np.float32` or `score_func=f_classif`
+REFERENCE_PACKAGES = MODEL_PACKAGES + ("numpy", "builtins")
+
+PRIMITIVE_TYPES = (bool, int, float, str, type(None))
+
+# the wrappers of the models, whose objects are written inline
+_MODEL_WRAPPERS: List[type] = []
+# set on a model by .send(), the storable object carries them instead
+SYFT_ATTRIBUTES = ("id", "tags", "description")
+
+
+def _name(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _package(name: str) -> str:
+    return name.split(".", 1)[0]
+
+
+def _check_reference(name: str) -> None:
+    if _package(name) not in REFERENCE_PACKAGES or "<" in name:
+        traceback_and_raise(TypeError(f"Models can't refer to {name}."))
+
+
+def _resolve(name: str) -> Any:
+    _check_reference(name)
+    return _import(name)
+
+
+def _import(name: str) -> Any:
+    # the module is the longest importable prefix of the name
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        try:
+            obj = importlib.import_module(".".join(parts[:i]))
+        except ImportError:
+            continue
+        for attr in parts[i:]:
+            obj = getattr(obj, attr)
+        if _package(name) == "builtins" and not isinstance(obj, type):
+            traceback_and_raise(TypeError(f"Models can't refer to {name}."))
+        return obj
+    traceback_and_raise(TypeError(f"Can't find {name}."))
+
+
+def _can_rebuild(cls: Any) -> bool:
+    if not isinstance(cls, type):
+        return False
+    name = _name(cls)
+    if name in REBUILD_CLASSES or name in CONSTRUCTED_CLASSES:
+        return True
+    # a __new__ written in python could do anything with the arguments
+    return _package(name) in REBUILD_PACKAGES and not isinstance(
+        cls.__new__, types.FunctionType
+    )
+
+
+def _rebuild_class(name: str) -> type:
+    # checked before importing anything
+    if (
+        name not in REBUILD_CLASSES
+        and name not in CONSTRUCTED_CLASSES
+        and (_package(name) not in REBUILD_PACKAGES or "<" in name)
+    ):
+        traceback_and_raise(TypeError(f"Models can't contain objects of {name}."))
+    cls = _import(name)
+    if not _can_rebuild(cls) or _name(cls) != name:
+        traceback_and_raise(TypeError(f"Models can't contain objects of {name}."))
+    return cls
+
+
+class ModelEncoder:
+    def __init__(self) -> None:
+        self.arrays: List[NumpyProto] = []
+        self.blobs: List[bytes] = []
+        self._array_ids: Dict[int, int] = {}
+        self._memo: Dict[int, int] = {}
+        # keeps the objects created while encoding alive, so their ids stay theirs
+        self._keep: List[Any] = []
+
+    def _blob(self, data: bytes) -> int:
+        self.blobs.append(data)
+        return len(self.blobs) - 1
+
+    def _array(self, value: np.ndarray) -> Dict[str, Any]:
+        index = self._array_ids.get(id(value))
+        if index is not None:
+            return {"t": "array", "i": index}
+
+        node: Dict[str, Any] = {"t": "array", "i": len(self.arrays)}
+        if value.dtype.newbyteorder("=") in SUPPORTED_DTYPES:
+            self.arrays.append(protobuf_object2proto(value))
+        else:
+            # e.g. strings or the structured nodes of a sklearn Tree
+            node["descr"] = repr(np.lib.format.dtype_to_descr(value.dtype))
+            self.arrays.append(
+                NumpyProto(data=value.tobytes(order="C"), shape=value.shape)
+            )
+        self._array_ids[id(value)] = node["i"]
+        self._keep.append(value)
+        return node
+
+    def encode(self, value: Any) -> Any:
+        if type(value) in PRIMITIVE_TYPES:
+            return value
+        if type(value) is list:
+            return [self.encode(item) for item in value]
+        if type(value) is tuple:
+            return {"t": "tuple", "items": [self.encode(item) for item in value]}
+        if type(value) is dict:
+            return {
+                "t": "dict",
+                "items": [[self.encode(k), self.encode(v)] for k, v in value.items()],
+            }
+        if type(value) in (set, frozenset):
+            return {
+                "t": type(value).__name__,
+                "items": [self.encode(item) for item in value],
+            }
+        if type(value) is complex:
+            return {"t": "complex", "real": value.real, "imag": value.imag}
+        if type(value) in (bytes, bytearray):
+            return {
+                "t": type(value).__name__,
+                "i": self._blob(bytes(value)),
+            }
+
+        if type(value) is np.ndarray:
+            if value.dtype.hasobject:
+                return {
+                    "t": "objects",
+                    "shape": list(value.shape),
+                    "items": [self.encode(item) for item in value.ravel().tolist()],
+                }
+            return self._array(value)
+        if isinstance(value, np.generic):
+            return {"t": "scalar", "array": self._array(np.asarray(value))}
+        if isinstance(value, np.dtype):
+            return {"t": "dtype", "descr": repr(np.lib.format.dtype_to_descr(value))}
+        if isinstance(value, np.ufunc):
+            return {"t": "ref", "name": f"numpy.{value.__name__}"}
+        if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+            name = _name(value)
+            _check_reference(name)
+            return {"t": "ref", "name": name}
+
+        index = self._memo.get(id(value))
+        if index is not None:
+            return {"t": "memo", "i": index}
+
+        if isinstance(value, np.random.RandomState):
+            index = self._memo[id(value)] = len(self._memo)
+            return {
+                "t": "random_state",
+                "memo": index,
+                "state": self.encode(value.get_state()),
+            }
+
+        package = _package(type(value).__module__)
+        wrapper = getattr(type(value), "_sy_serializable_wrapper_type", None)
+        is_model = wrapper is not None and wrapper in _MODEL_WRAPPERS
+        if wrapper is not None and not is_model and package not in MODEL_PACKAGES:
+            # e.g. a pandas DataFrame
+            data = serialize(value, to_bytes=True)
+            return {"t": "syft", "i": self._blob(data)}  # type: ignore
+        if not is_model and not _can_rebuild(type(value)):
+            traceback_and_raise(
+                TypeError(f"Models can't contain objects of {_name(type(value))}.")
+            )
+        return self._object(value, model=is_model)
+
+    def _object(self, value: Any, model: bool = False) -> Dict[str, Any]:
+        reduced = value.__reduce_ex__(2)
+        if isinstance(reduced, str):
+            # a module level singleton
+            return {"t": "ref", "name": f"{type(value).__module__}.{reduced}"}
+        self._keep.append(reduced)
+
+        func, args = reduced[0], reduced[1]
+        node: Dict[str, Any] = {"t": "object"}
+        if func is copyreg.__newobj__ and len(args) == 1:  # type: ignore
+            node["new"] = _name(args[0])
+        elif isinstance(func, type) and not args:
+            # e.g. an extension type whose empty object is all there is
+            node["new"] = _name(func)
+        elif isinstance(func, type) and _name(func) in CONSTRUCTED_CLASSES:
+            node["cls"] = _name(func)
+            node["args"] = self.encode(list(args))
+        else:
+            traceback_and_raise(
+                TypeError(f"Can't serialize {_name(type(value))} as part of a model.")
+            )
+
+        # objects referring back to this one find it in the memo
+        node["memo"] = self._memo[id(value)] = len(self._memo)
+        self._keep.append(value)
+        if len(reduced) > 2 and reduced[2] is not None:
+            state = reduced[2]
+            if model and isinstance(state, dict):
+                state = {k: v for k, v in state.items() if k not in SYFT_ATTRIBUTES}
+            node["state"] = self.encode(state)
+        if len(reduced) > 3 and reduced[3] is not None:
+            node["listitems"] = self.encode(list(reduced[3]))
+        if len(reduced) > 4 and reduced[4] is not None:
+            node["dictitems"] = self.encode(dict(reduced[4]))
+        return node
+
+
+class ModelDecoder:
+    def __init__(self, proto: ModelProto) -> None:
+        self.proto = proto
+        self._arrays: Dict[int, np.ndarray] = {}
+        self._memo: Dict[int, Any] = {}
+
+    def _array(self, node: Dict[str, Any]) -> np.ndarray:
+        index = node["i"]
+        if index not in self._arrays:
+            array_proto = self.proto.arrays[index]
+            if "descr" in node:
+                dtype = np.lib.format.descr_to_dtype(ast.literal_eval(node["descr"]))
+                array = (
+                    np.frombuffer(array_proto.data, dtype=dtype)
+                    .reshape(tuple(array_proto.shape))
+                    .copy()
+                )
+            else:
+                array = protobuf_proto2object(array_proto)
+            self._arrays[index] = array
+        return self._arrays[index]
+
+    def decode(self, node: Any) -> Any:
+        if isinstance(node, list):
+            return [self.decode(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        kind = node["t"]
+        decoders: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "tuple": lambda n: tuple(self.decode(n["items"])),
+            "dict": lambda n: {self.decode(k): self.decode(v) for k, v in n["items"]},
+            "set": lambda n: set(self.decode(n["items"])),
+            "frozenset": lambda n: frozenset(self.decode(n["items"])),
+            "complex": lambda n: complex(n["real"], n["imag"]),
+            "bytes": lambda n: self.proto.blobs[n["i"]],
+            "bytearray": lambda n: bytearray(self.proto.blobs[n["i"]]),
+            "array": self._array,
+            "objects": self._objects,
+            "scalar": lambda n: self._array(n["array"])[()],
+            "dtype": lambda n: np.lib.format.descr_to_dtype(
+                ast.literal_eval(n["descr"])
+            ),
+            "ref": lambda n: _resolve(n["name"]),
+            "memo": lambda n: self._memo[n["i"]],
+            "random_state": self._random_state,
+            "syft": lambda n: deserialize(self.proto.blobs[n["i"]], from_bytes=True),
+            "object": self._object,
+        }
+        if kind not in decoders:
+            traceback_and_raise(ValueError(f"Unknown kind of model value {kind}."))
+        return decoders[kind](node)
+
+    def _objects(self, node: Dict[str, Any]) -> np.ndarray:
+        items = self.decode(node["items"])
+        array = np.empty(len(items), dtype=object)
+        # item by item, numpy would unpack items which are sequences themselves
+        for i, item in enumerate(items):
+            array[i] = item
+        return array.reshape(tuple(node["shape"]))
+
+    def _random_state(self, node: Dict[str, Any]) -> np.random.RandomState:
+        random_state = np.random.RandomState()
+        self._memo[node["memo"]] = random_state
+        random_state.set_state(self.decode(node["state"]))
+        return random_state
+
+    def _object(self, node: Dict[str, Any]) -> Any:
+        if "new" in node:
+            cls = _rebuild_class(node["new"])
+            obj = cls.__new__(cls)
+        elif node.get("cls") in CONSTRUCTED_CLASSES:
+            obj = _rebuild_class(node["cls"])(*self.decode(node["args"]))
+        else:
+            traceback_and_raise(
+                TypeError(f"Models can't contain objects of {node.get('cls')}.")
+            )
+        self._memo[node["memo"]] = obj
+
+        if "state" in node:
+            _set_state(obj, self.decode(node["state"]))
+        if "listitems" in node:
+            for item in self.decode(node["listitems"]):
+                obj.append(item)
+        if "dictitems" in node:
+            for key, value in self.decode(node["dictitems"]).items():
+                obj[key] = value
+        return obj
+
+
+def _set_state(obj: Any, state: Any) -> None:
+    # the same as pickle does
+    setstate = getattr(obj, "__setstate__", None)
+    if setstate is not None:
+        setstate(state)
+        return
+    slotstate = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slotstate = state
+    if state:
+        obj.__dict__.update(state)
+    if slotstate:
+        for key, value in slotstate.items():
+            setattr(obj, key, value)
+
+
+def object2proto(obj: Any) -> ModelProto:
+    encoder = ModelEncoder()
+    skeleton = json.dumps(encoder.encode(obj), separators=(",", ":"))
+    return ModelProto(skeleton=skeleton, arrays=encoder.arrays, blobs=encoder.blobs)
+
+
+def proto2object(proto: ModelProto) -> Any:
+    return ModelDecoder(proto).decode(json.loads(proto.skeleton))
+
+
+def register_models(*types: Tuple[type, str]) -> None:
+    """Serialize the given types, and their subclasses, as models.
+
+    Args:
+        types: tuples of a type and its import path.
+    """
+    for wrapped_type, import_path in types:
+        GenerateWrapper(
+            wrapped_type=wrapped_type,
+            import_path=import_path,
+            protobuf_scheme=ModelProto,
+            type_object2proto=object2proto,
+            type_proto2object=proto2object,
+        )
+        _MODEL_WRAPPERS.append(wrapped_type._sy_serializable_wrapper_type)  # type: ignore
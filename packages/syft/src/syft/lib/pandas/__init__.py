@@ -12,6 +12,7 @@ import pandas as pd
 from . import categorical  # noqa: 401
 from . import categorical_dtype  # noqa: 401
 from . import frame  # noqa: 401
+from . import ipc  # noqa: 401
 from . import series  # noqa: 401
 from ...ast import add_classes
 from ...ast import add_methods
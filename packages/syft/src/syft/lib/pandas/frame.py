@@ -2,16 +2,20 @@
 
 # third party
 import pandas as pd
-import pyarrow as pa
 
 # syft relative
 from ...generate_wrapper import GenerateWrapper
 from ...proto.lib.pandas.frame_pb2 import PandasDataFrame as PandasDataFrame_PB
+from .ipc import frame_to_stream
+from .ipc import legacy_file_to_frame
+from .ipc import stream_to_frame
 
 
 def object2proto(obj: pd.DataFrame) -> PandasDataFrame_PB:
     """Convert pd.DataFrame to PandasDataFrame_PB with pyarrow.
 
+    The compression and record batches are set with `ipc.compression()`.
+
     Args:
         obj: target Dataframe
 
@@ -19,20 +23,7 @@ def object2proto(obj: pd.DataFrame) -> PandasDataFrame_PB:
         Serialized version of Dataframe, which will be used to reconstruction.
 
     """
-    schema = pa.Schema.from_pandas(obj)
-    table = pa.Table.from_pandas(obj)
-    sink = pa.BufferOutputStream()
-
-    writer = pa.ipc.new_file(sink, schema)
-    writer.write(table)
-    writer.close()
-
-    buf = sink.getvalue()
-
-    siz = len(buf)
-    df_bytes = pa.compress(buf, asbytes=True)
-
-    return PandasDataFrame_PB(dataframe=df_bytes, decompressed_size=siz)
+    return PandasDataFrame_PB(dataframe=frame_to_stream(obj), ipc_stream=True)
 
 
 def proto2object(proto: PandasDataFrame_PB) -> pd.DataFrame:
@@ -44,8 +35,9 @@ def proto2object(proto: PandasDataFrame_PB) -> pd.DataFrame:
     Returns:
         Re-constructed dataframe.
     """
-    buf = pa.decompress(proto.dataframe, decompressed_size=proto.decompressed_size)
-    return pa.ipc.open_file(buf).read_pandas()
+    if proto.ipc_stream:
+        return stream_to_frame(proto.dataframe)
+    return legacy_file_to_frame(proto.dataframe, proto.decompressed_size)
 
 
 GenerateWrapper(
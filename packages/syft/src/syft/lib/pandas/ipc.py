@@ -0,0 +1,135 @@
+"""Arrow IPC streams of DataFrames, for the serde of pd.DataFrame and pd.Series.
+
+A frame is written as an Arrow IPC stream, with its buffers compressed by
+Arrow itself, so there is no separate pass compressing a copy of the whole
+stream and none decompressing it on the other side. Within a `compression()`
+block the codec, its level and the number of rows per record batch can be
+chosen, e.g. no compression at all for an in-memory VM, or record batches of
+a bounded number of rows so a large frame is never converted to Arrow at once:
+
+    with sy.lib.pandas.ipc.compression("none"):
+        ptr = df.send(vm_client)
+
+    with sy.lib.pandas.ipc.compression("zstd", level=9, chunk_rows=100_000):
+        ptr = df.send(duet)
+"""
+
+# stdlib
+from contextlib import contextmanager
+import threading
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+# third party
+import pandas as pd
+import pyarrow as pa
+
+# syft relative
+from ...logger import traceback_and_raise
+
+# the codec Arrow compresses buffers with unless told otherwise
+DEFAULT_CODEC = "lz4"
+NO_COMPRESSION = "none"
+# the codecs of the buffers of an Arrow IPC stream
+IPC_CODECS = ("lz4", "zstd")
+
+_local = threading.local()
+
+
+class Compression:
+    def __init__(
+        self,
+        codec: str = DEFAULT_CODEC,
+        level: Optional[int] = None,
+        chunk_rows: Optional[int] = None,
+    ) -> None:
+        codec = codec.lower()
+        if codec != NO_COMPRESSION and (
+            codec not in IPC_CODECS or not pa.Codec.is_available(codec)
+        ):
+            traceback_and_raise(
+                ValueError(f"Arrow can't compress IPC streams with {codec}")
+            )
+        if chunk_rows is not None and chunk_rows < 1:
+            traceback_and_raise(
+                ValueError(f"chunk_rows must be at least 1, not {chunk_rows}")
+            )
+        self.codec = codec
+        self.level = level
+        self.chunk_rows = chunk_rows
+
+    def write_options(self) -> pa.ipc.IpcWriteOptions:
+        if self.codec == NO_COMPRESSION:
+            return pa.ipc.IpcWriteOptions(compression=None)
+        codec = pa.Codec(self.codec, compression_level=self.level)
+        return pa.ipc.IpcWriteOptions(compression=codec)
+
+
+def current_compression() -> Compression:
+    current = getattr(_local, "compression", None)
+    return current if current is not None else Compression()
+
+
+@contextmanager
+def compression(
+    codec: str = DEFAULT_CODEC,
+    level: Optional[int] = None,
+    chunk_rows: Optional[int] = None,
+) -> Iterator[Compression]:
+    """Send the frames serialized in this block with `codec`, see above."""
+    previous = getattr(_local, "compression", None)
+    _local.compression = Compression(codec, level=level, chunk_rows=chunk_rows)
+    try:
+        yield _local.compression
+    finally:
+        _local.compression = previous
+
+
+def chunks(rows: int, chunk_rows: int) -> Iterator[Tuple[int, int]]:
+    # an empty frame still gets a batch
+    for start in range(0, max(rows, 1), chunk_rows):
+        yield start, min(start + chunk_rows, rows)
+
+
+def conform(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch:
+    """`batch` with the types of the whole frame, e.g. for a chunk whose
+    object column only holds None."""
+    columns = [
+        column if column.type == field.type else column.cast(field.type)
+        for column, field in zip(batch.columns, schema)
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def frame_to_stream(frame: pd.DataFrame) -> bytes:
+    current = current_compression()
+    if current.chunk_rows is None:
+        table = pa.Table.from_pandas(frame)
+        # an empty table has no batch, and so would lose e.g. the categories
+        batches = table.to_batches() or [pa.RecordBatch.from_pandas(frame)]
+        schema = batches[0].schema
+    else:
+        schema = pa.Schema.from_pandas(frame)
+        batches = (
+            conform(pa.RecordBatch.from_pandas(frame.iloc[start:stop]), schema)
+            for start, stop in chunks(len(frame), current.chunk_rows)
+        )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema, options=current.write_options()) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    # the one copy, into the bytes of the protobuf message
+    return sink.getvalue().to_pybytes()
+
+
+def stream_to_frame(data: bytes) -> pd.DataFrame:
+    # read in place, the buffers are only copied when converted to pandas
+    return pa.ipc.open_stream(pa.py_buffer(data)).read_pandas()
+
+
+def legacy_file_to_frame(data: bytes, decompressed_size: int) -> pd.DataFrame:
+    """Frames sent as a compressed Arrow IPC file, before the streams."""
+    buf = pa.decompress(data, decompressed_size=decompressed_size)
+    return pa.ipc.open_file(buf).read_pandas()
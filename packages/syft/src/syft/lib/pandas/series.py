@@ -2,16 +2,20 @@
 
 # third party
 import pandas as pd
-import pyarrow as pa
 
 # syft relative
 from ...generate_wrapper import GenerateWrapper
 from ...proto.lib.pandas.series_pb2 import PandasSeries as PandasSeries_PB
+from .ipc import frame_to_stream
+from .ipc import legacy_file_to_frame
+from .ipc import stream_to_frame
 
 
 def object2proto(obj: pd.Series) -> PandasSeries_PB:
     """Convert pd.Series to PandasDataFrame_PB with pyarrow.
 
+    The compression and record batches are set with `ipc.compression()`.
+
     Args:
         obj: target Series
 
@@ -23,20 +27,7 @@ def object2proto(obj: pd.Series) -> PandasSeries_PB:
     # series must either be converted to a dataframe or use pa.Array
     # however pa.Array mentions you must account for the null values yourself
     dataframe = obj.to_frame()
-    schema = pa.Schema.from_pandas(dataframe)
-    table = pa.Table.from_pandas(dataframe)
-    sink = pa.BufferOutputStream()
-
-    writer = pa.ipc.new_file(sink, schema)
-    writer.write(table)
-    writer.close()
-
-    buf = sink.getvalue()
-
-    siz = len(buf)
-    df_bytes = pa.compress(buf, asbytes=True)
-
-    return PandasSeries_PB(series=df_bytes, decompressed_size=siz)
+    return PandasSeries_PB(series=frame_to_stream(dataframe), ipc_stream=True)
 
 
 def proto2object(proto: PandasSeries_PB) -> pd.Series:
@@ -49,8 +40,10 @@ def proto2object(proto: PandasSeries_PB) -> pd.Series:
         Re-constructed Series.
 
     """
-    buf = pa.decompress(proto.series, decompressed_size=proto.decompressed_size)
-    dataframe = pa.ipc.open_file(buf).read_pandas()
+    if proto.ipc_stream:
+        dataframe = stream_to_frame(proto.series)
+    else:
+        dataframe = legacy_file_to_frame(proto.series, proto.decompressed_size)
     # we know that this is a series being stored as a dataframe so just grab the first
     return dataframe[dataframe.columns[0]]
 
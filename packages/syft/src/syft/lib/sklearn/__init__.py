@@ -12,6 +12,7 @@ from typing import Tuple as TypeTuple
 
 # third party
 import sklearn
+import sklearn.ensemble
 import sklearn.linear_model
 
 # syft relative
@@ -40,6 +41,7 @@ def create_ast(client: TypeAny = None) -> Globals:
     modules: TypeList[TypeTuple[str, TypeAny]] = [
         ("sklearn", sklearn),
         ("sklearn.linear_model", sklearn.linear_model),
+        ("sklearn.ensemble", sklearn.ensemble),
     ]
 
     classes: TypeList[TypeTuple[str, str, TypeAny]] = [
@@ -57,6 +59,17 @@ def create_ast(client: TypeAny = None) -> Globals:
             "sklearn.linear_model._base.LinearRegression",
             sklearn.linear_model._base.LinearRegression,
         ),
+        # ensemble
+        (
+            "sklearn.ensemble.RandomForestClassifier",
+            "sklearn.ensemble._forest.RandomForestClassifier",
+            sklearn.ensemble._forest.RandomForestClassifier,
+        ),
+        (
+            "sklearn.ensemble.RandomForestRegressor",
+            "sklearn.ensemble._forest.RandomForestRegressor",
+            sklearn.ensemble._forest.RandomForestRegressor,
+        ),
     ]
 
     methods: TypeList[TypeTuple[str, str]] = [
@@ -72,6 +85,17 @@ def create_ast(client: TypeAny = None) -> Globals:
             "sklearn.linear_model.LinearRegression.fit",
             "sklearn.linear_model._base.LinearRegression",
         ),
+        # ensemble
+        (
+            "sklearn.ensemble.RandomForestClassifier.fit",
+            "sklearn.ensemble._forest.RandomForestClassifier",
+        ),
+        ("sklearn.ensemble.RandomForestClassifier.predict", "numpy.ndarray"),
+        (
+            "sklearn.ensemble.RandomForestRegressor.fit",
+            "sklearn.ensemble._forest.RandomForestRegressor",
+        ),
+        ("sklearn.ensemble.RandomForestRegressor.predict", "numpy.ndarray"),
     ]
 
     add_modules(ast, modules)
@@ -7,6 +7,7 @@ from typing import List as TypeList
 from typing import Tuple as TypeTuple
 
 # syft relative
+from . import batch  # noqa: 401
 from . import rst_share  # noqa: 401
 from . import session  # noqa: 401
 from . import share  # noqa: 401
@@ -0,0 +1,119 @@
+"""Batched transfer of shares.
+
+Within a `batched_shares(session)` block the shares sent to the parties of the
+session aren't sent one message each. They are kept per party and sent as a
+single SaveObjectsAction right before the next message to that party, so they
+still arrive before anything using them, or at the end of the block. A round
+of a protocol then costs a message per party instead of one per share, and
+the shares of a message look their session up once.
+
+    with batched_shares(session):
+        x = MPCTensor(secret=secret, shape=shape, session=session)
+"""
+
+# stdlib
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+
+# third party
+from sympc.session import Session
+from sympc.tensor import ReplicatedSharedTensor
+from sympc.tensor import ShareTensor
+
+# syft relative
+from ...core.node.common.action.save_object_action import SaveObjectAction
+from ...core.node.common.action.save_objects_action import SaveObjectsAction
+from ...core.store.storeable_object import StorableObject
+
+SHARE_TYPES = (ShareTensor, ReplicatedSharedTensor)
+
+# the client methods sending messages, any of them sends the pending shares first
+SEND_METHODS = (
+    "send_immediate_msg_with_reply",
+    "send_immediate_msg_without_reply",
+    "send_eventual_msg_without_reply",
+)
+
+
+class ShareBatcher:
+    def __init__(self, clients: Iterable[Any]) -> None:
+        self.clients = list(clients)
+        # the shares waiting to be sent to each client, by id of the client
+        self.pending: Dict[int, List[StorableObject]] = {}
+        # the methods of each client before the batcher, and which of them were
+        # set on the client itself, e.g. by an outer batcher
+        self._originals: Dict[int, Dict[str, Callable]] = {}
+        self._own: Dict[int, List[str]] = {}
+
+    @staticmethod
+    def _is_share(msg: Any) -> bool:
+        # the StorableObject keeps its tags, description and permissions
+        return isinstance(msg, SaveObjectAction) and isinstance(
+            msg.obj.data, SHARE_TYPES
+        )
+
+    def _wrap(self, client: Any, name: str) -> Callable:
+        original = self._originals[id(client)][name]
+
+        def send(msg: Any, *args: Any, **kwargs: Any) -> Any:
+            if name == "send_immediate_msg_without_reply" and self._is_share(msg):
+                self.pending.setdefault(id(client), []).append(msg.obj)
+                return None
+            self.flush(client)
+            return original(msg, *args, **kwargs)
+
+        return send
+
+    def install(self) -> None:
+        for client in self.clients:
+            if id(client) in self._originals:
+                continue
+            self._originals[id(client)] = {
+                name: getattr(client, name) for name in SEND_METHODS
+            }
+            self._own[id(client)] = [
+                name for name in SEND_METHODS if name in client.__dict__
+            ]
+            for name in SEND_METHODS:
+                setattr(client, name, self._wrap(client, name))
+
+    def flush(self, client: Any) -> None:
+        objs = self.pending.pop(id(client), [])
+        if not objs:
+            return
+        if len(objs) == 1:
+            msg = SaveObjectAction(obj=objs[0], address=client.address)
+        else:
+            msg = SaveObjectsAction(objs=objs, address=client.address)
+        self._originals[id(client)]["send_immediate_msg_without_reply"](msg=msg)
+
+    def close(self) -> None:
+        """Send the pending shares and restore the clients."""
+        try:
+            for client in self.clients:
+                self.flush(client)
+        finally:
+            for client in self.clients:
+                originals = self._originals.pop(id(client), {})
+                own = self._own.pop(id(client), [])
+                for name in SEND_METHODS:
+                    if name in own:
+                        setattr(client, name, originals[name])
+                    else:
+                        client.__dict__.pop(name, None)
+
+
+@contextmanager
+def batched_shares(session: Session) -> Iterator[ShareBatcher]:
+    """Batch the shares sent to the parties of `session` in this block."""
+    batcher = ShareBatcher(session.parties)
+    batcher.install()
+    try:
+        yield batcher
+    finally:
+        batcher.close()
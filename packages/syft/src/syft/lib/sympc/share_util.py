@@ -0,0 +1,85 @@
+# stdlib
+import dataclasses
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+# third party
+import numpy as np
+import sympc
+from sympc.config import Config
+import torch as th
+
+# syft absolute
+import syft
+
+# syft relative
+from ...core.common.serde.scope import DESERIALIZE
+from ...core.common.serde.scope import current_scope
+from ...proto.lib.python.dict_pb2 import Dict as Dict_PB
+from ...proto.lib.sympc.raw_tensor_pb2 import RawTensor as RawTensor_PB
+from ..python.primitive_factory import PrimitiveFactory
+from ..torch.tensor_util import TORCH_DTYPE_STR
+from ..torch.tensor_util import TORCH_STR_DTYPE
+
+# the config of each session met in a message, by session uuid
+SESSION_CONFIG_TABLE = "sympc.session_configs"
+
+# the raw buffer of RawTensor is always little endian
+WIRE_BYTEORDER = "<"
+
+
+def raw_tensor_serializer(tensor: th.Tensor) -> RawTensor_PB:
+    dtype = TORCH_DTYPE_STR[tensor.dtype]
+    array = tensor.detach().cpu().contiguous()
+    if array.dtype == th.bfloat16:
+        # numpy has no bfloat16
+        array = array.view(th.int16)
+    array = array.numpy()
+    wire_dtype = array.dtype.newbyteorder(WIRE_BYTEORDER)
+    if array.dtype != wire_dtype:
+        array = array.astype(wire_dtype)
+    return RawTensor_PB(dtype=dtype, shape=tensor.shape, data=array.tobytes())
+
+
+def raw_tensor_deserializer(proto: RawTensor_PB) -> th.Tensor:
+    dtype = TORCH_STR_DTYPE[proto.dtype]
+    wire_dtype = th.int16 if dtype == th.bfloat16 else dtype
+    np_dtype = th.empty(0, dtype=wire_dtype).numpy().dtype
+    # the bytearray is the one writeable copy of the buffer torch then uses
+    array = np.frombuffer(
+        bytearray(proto.data), dtype=np_dtype.newbyteorder(WIRE_BYTEORDER)
+    )
+    tensor = th.from_numpy(array.astype(np_dtype, copy=False))
+    return tensor.view(dtype).reshape(tuple(proto.shape))
+
+
+def config_serializer(share: Any) -> Optional[Dict_PB]:
+    """The config of a share, unless its session gives it to the receiver."""
+    if share.session_uuid is not None:
+        return None
+    config = dataclasses.asdict(share.config)
+    return syft.serialize(
+        PrimitiveFactory.generate_primitive(value=config), to_proto=True
+    )
+
+
+def session_config(session_uuid: str) -> Dict[str, Any]:
+    """The config of the session `session_uuid`, looked up once per message."""
+    scope = current_scope(DESERIALIZE)
+    configs = scope.table(SESSION_CONFIG_TABLE, dict) if scope is not None else {}
+
+    config = configs.get(session_uuid)
+    if config is None:
+        session = sympc.session.get_session(session_uuid)
+        if session is None:
+            raise ValueError(f"The session {session_uuid} could not be found")
+        config = dataclasses.asdict(session.config)
+        configs[session_uuid] = config
+    return config
+
+
+def config_deserializer(session_uuid: str, config: Dict_PB) -> Config:
+    if session_uuid:
+        return Config(**session_config(session_uuid))
+    return Config(**syft.deserialize(config, from_proto=True))
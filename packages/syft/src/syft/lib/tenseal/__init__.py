@@ -13,6 +13,7 @@ from . import ckks_tensor  # noqa: 401
 from . import ckks_vector  # noqa: 401
 from . import context  # noqa: 401
 from . import plain_tensor  # noqa: 401
+from . import stream  # noqa: 401
 from ...ast import add_classes
 from ...ast import add_methods
 from ...ast import add_modules
@@ -5,12 +5,15 @@ import tenseal as ts
 from ...generate_wrapper import GenerateWrapper
 from ...proto.lib.tenseal.vector_pb2 import TenSEALVector as TenSEALVector_PB
 from ..util import full_name_with_name
+from .context import vector_context_deserializer
+from .context import vector_context_serializer
 
 
 def object2proto(obj: object) -> TenSEALVector_PB:
     proto = TenSEALVector_PB()
     proto.obj_type = full_name_with_name(klass=obj._sy_serializable_wrapper_type)  # type: ignore
     proto.vector = obj.serialize()  # type: ignore
+    vector_context_serializer(obj, proto)
 
     return proto
 
@@ -18,7 +21,7 @@ def object2proto(obj: object) -> TenSEALVector_PB:
 def proto2object(proto: TenSEALVector_PB) -> ts.CKKSTensor:
     vec = ts.lazy_ckks_tensor_from(proto.vector)
 
-    return vec
+    return vector_context_deserializer(vec, proto)
 
 
 GenerateWrapper(
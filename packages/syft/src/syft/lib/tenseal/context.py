@@ -1,18 +1,170 @@
+"""Serialization of TenSEAL contexts, and of the context of encrypted vectors.
+
+Encrypted vectors and tensors don't carry their context, it holds the keys and
+can be much larger than them. Every context serialized or deserialized gets an
+id, the sha256 of its serialized bytes, and an encrypted vector refers to its
+context by that id. Once a context was sent to a node, e.g. with
+`context.send(client)`, the vectors using it are linked to it when they arrive
+there. A vector sent to a node its context was never sent to carries the
+context, without the secret key, the first time. A vector serialized outside
+of a message, with no node to send it to, always carries it.
+"""
+
 # stdlib
+from collections import OrderedDict
+import hashlib
 import sys
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Set
+from typing import Tuple
+import weakref
 
 # third party
 from packaging import version
 import tenseal as ts
 
 # syft relative
+from ...core.common.serde.scope import SERIALIZE
+from ...core.common.serde.scope import current_scope
+from ...core.common.uid import UID
 from ...generate_wrapper import GenerateWrapper
 from ...logger import info
 from ...logger import traceback_and_raise
+from ...proto.lib.tenseal.vector_pb2 import TenSEALVector as TenSEALVector_PB
 from ...proto.util.vendor_bytes_pb2 import VendorBytes as VendorBytes_PB
 from ...util import get_fully_qualified_name
 from ..util import full_name_with_name
 
+# the contexts which only arrived along with vectors, kept for the next ones
+MAX_EMBEDDED_CONTEXTS = 8
+
+
+def destination() -> Optional[UID]:
+    """The node the message being serialized is sent to, if any."""
+    scope = current_scope(SERIALIZE)
+    address = scope.address if scope is not None else None
+    if address is None:
+        return None
+    try:
+        return address.target_id.id
+    except Exception:
+        return None
+
+
+class ContextRegistry:
+    """The ids of the contexts serialized or deserialized by this process."""
+
+    def __init__(self) -> None:
+        # by the underlying context of the tenseal.Context, with its state
+        self.ids: "weakref.WeakKeyDictionary[Any, Tuple[Tuple, str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.contexts: "weakref.WeakValueDictionary[str, Any]" = (
+            weakref.WeakValueDictionary()
+        )
+        self.embedded: "OrderedDict[str, Any]" = OrderedDict()
+        # by node, the ids of the contexts it was sent
+        self.sent: Dict[UID, Set[str]] = {}
+
+    @staticmethod
+    def state(context: ts.Context) -> Tuple:
+        """What can change about a context once it was sent."""
+        try:
+            scale: Optional[float] = context.global_scale
+        except ValueError:
+            scale = None
+        return (
+            context.has_public_key(),
+            context.has_secret_key(),
+            context.has_galois_keys(),
+            context.has_relin_keys(),
+            context.auto_relin,
+            context.auto_rescale,
+            context.auto_mod_switch,
+            scale,
+        )
+
+    def add(
+        self,
+        context: ts.Context,
+        content: bytes,
+        embedded: bool = False,
+        context_id: Optional[str] = None,
+    ) -> str:
+        if context_id is None:
+            context_id = hashlib.sha256(content).hexdigest()
+        self.ids[context.data] = (self.state(context), context_id)
+        # the first of identical contexts stays, e.g. the one of the sender
+        if self.contexts.get(context_id) is None:
+            self.contexts[context_id] = context.data
+        if embedded:
+            self.embedded[context_id] = context.data
+            self.embedded.move_to_end(context_id)
+            while len(self.embedded) > MAX_EMBEDDED_CONTEXTS:
+                self.embedded.popitem(last=False)
+        return context_id
+
+    def id_of(self, context: ts.Context) -> Optional[str]:
+        known = self.ids.get(context.data)
+        if known is None or known[0] != self.state(context):
+            return None
+        return known[1]
+
+    def get(self, context_id: str) -> Optional[ts.Context]:
+        data = self.contexts.get(context_id)
+        return ts.Context._wrap(data) if data is not None else None
+
+    def mark_sent(self, context_id: str, node: Optional[UID]) -> bool:
+        """Record that `node` was sent the context, False if it already was."""
+        if node is None:
+            return True
+        sent = self.sent.setdefault(node, set())
+        if context_id in sent:
+            return False
+        sent.add(context_id)
+        return True
+
+
+registry = ContextRegistry()
+
+
+def vector_context_serializer(obj: Any, proto: TenSEALVector_PB) -> None:
+    """Refer to the context of the encrypted vector `obj` in `proto`."""
+    try:
+        context = obj.context()
+    except ValueError:
+        # a vector which was never linked to a context
+        return
+    content: Optional[bytes] = None
+    context_id = registry.id_of(context)
+    if context_id is None:
+        content = context.serialize(save_secret_key=False)
+        context_id = registry.add(context, content)
+    if registry.mark_sent(context_id, destination()):
+        if content is None:
+            content = context.serialize(save_secret_key=False)
+        proto.context = content
+    proto.context_id = context_id
+
+
+def vector_context_deserializer(vec: Any, proto: TenSEALVector_PB) -> Any:
+    """Link `vec` to the context `proto` refers to, if it is known here."""
+    context = registry.get(proto.context_id) if proto.context_id else None
+    # a context known here, e.g. the one of the sender, wins over its public copy
+    if context is None and proto.context:
+        context = ts.context_from(proto.context, n_threads=1)
+        registry.add(
+            context,
+            proto.context,
+            embedded=True,
+            context_id=proto.context_id or None,
+        )
+    if context is not None:
+        vec.link_context(context)
+    return vec
+
 
 def context_object2proto(obj: object) -> VendorBytes_PB:
     proto = VendorBytes_PB()
@@ -20,6 +172,8 @@ def context_object2proto(obj: object) -> VendorBytes_PB:
     proto.vendor_lib = "tenseal"
     proto.vendor_lib_version = ts.__version__
     proto.content = obj.serialize(save_secret_key=True)  # type: ignore
+    context_id = registry.add(obj, proto.content)  # type: ignore
+    registry.mark_sent(context_id, destination())
 
     return proto
 
@@ -37,7 +191,9 @@ def context_proto2object(proto: VendorBytes_PB) -> ts.Context:
             log = f"Warning {lib_version} > local imported version {ts.__version__}"
             info(log)
 
-    return ts.context_from(proto.content, n_threads=1)
+    context = ts.context_from(proto.content, n_threads=1)
+    registry.add(context, proto.content)
+    return context
 
 
 GenerateWrapper(
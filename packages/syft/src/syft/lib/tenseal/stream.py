@@ -0,0 +1,65 @@
+"""Sending many encrypted vectors to a client.
+
+`send_stream` sends the vectors of an iterable, e.g. a generator encrypting
+them one at a time, in messages of `chunk_size` vectors. Only one message is
+serialized at a time, so a large batch never has to be in memory as bytes at
+once. The vectors refer to their context by id (see .context), so it is sent at
+most once, not with every message:
+
+    ctx_ptr = context.send(client)
+    ptrs = send_stream((ts.ckks_vector(context, row) for row in rows), client)
+"""
+
+# stdlib
+from itertools import islice
+from typing import Any
+from typing import Iterable
+from typing import List
+
+# syft relative
+from ...core.common.group import VERIFYALL
+from ...core.common.uid import UID
+from ...core.node.common.action.save_objects_action import SaveObjectsAction
+from ...core.pointer.pointer import Pointer
+from ...core.store.storeable_object import StorableObject
+from ...logger import traceback_and_raise
+from ...util import obj2pointer_type
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def send_stream(
+    vectors: Iterable[Any],
+    client: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    pointable: bool = True,
+) -> List[Pointer]:
+    """Send `vectors` to `client`, `chunk_size` of them per message."""
+    if chunk_size < 1:
+        traceback_and_raise(
+            ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+        )
+
+    ptrs: List[Pointer] = []
+    vectors = iter(vectors)
+    while True:
+        chunk = list(islice(vectors, chunk_size))
+        if not chunk:
+            return ptrs
+
+        objs = []
+        for vec in chunk:
+            ptr = obj2pointer_type(obj=vec)(client=client, id_at_location=UID())
+            ptr._pointable = pointable
+            ptr.gc_enabled = not pointable
+            ptrs.append(ptr)
+            objs.append(
+                StorableObject(
+                    id=ptr.id_at_location,
+                    data=vec,
+                    search_permissions={VERIFYALL: None} if pointable else {},
+                )
+            )
+        client.send_immediate_msg_without_reply(
+            msg=SaveObjectsAction(objs=objs, address=client.address)
+        )
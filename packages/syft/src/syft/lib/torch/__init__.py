@@ -1,6 +1,8 @@
 # stdlib
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Tuple
 from typing import Union
 
 # third party
@@ -13,11 +15,15 @@ from . import parameter  # noqa: 401
 from . import return_types  # noqa: 401
 from . import size  # noqa: 401
 from . import uppercase_tensor  # noqa: 401
+from ...ast import add_classes
 from ...ast import add_dynamic_objects
+from ...ast import add_methods
+from ...ast import add_modules
 from ...ast.globals import Globals
 from ...logger import info
 from .allowlist import allowlist
 from .allowlist import dynamic_allowlist
+from .state_sync import StateTracker
 
 TORCH_VERSION = version.parse(torch.__version__.split("+")[0])
 
@@ -78,3 +84,35 @@ def create_torch_ast(client: Any = None) -> Globals:
         klass.create_storable_object_attr_convenience_methods()
 
     return ast
+
+
+def create_state_sync_ast(client: Any = None) -> Globals:
+    ast = Globals(client)
+
+    modules = ["syft", "syft.lib", "syft.lib.torch", "syft.lib.torch.state_sync"]
+    classes: List[Tuple[str, str, Any]] = [
+        (
+            "syft.lib.torch.state_sync.StateTracker",
+            "syft.lib.torch.state_sync.StateTracker",
+            StateTracker,
+        ),
+    ]
+    methods: List[Tuple[str, str]] = [
+        (
+            "syft.lib.torch.state_sync.StateTracker.mark_synced",
+            "syft.lib.python._SyNone",
+        ),
+        ("syft.lib.torch.state_sync.StateTracker.changes", "syft.lib.python.Dict"),
+        ("syft.lib.torch.state_sync.StateTracker.apply", "syft.lib.python._SyNone"),
+    ]
+
+    add_modules(ast, modules)
+    add_classes(ast, classes)
+    add_methods(ast, methods)
+
+    for klass in ast.classes:
+        klass.create_pointer_class()
+        klass.create_send_method()
+        klass.create_storable_object_attr_convenience_methods()
+
+    return ast
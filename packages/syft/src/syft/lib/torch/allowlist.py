@@ -2846,6 +2846,7 @@ allowlist["torch.nn.Module.extra_repr"] = "syft.lib.python.String"
 
 allowlist["torch.nn.ModuleDict"] = "torch.nn.ModuleDict"
 allowlist["torch.nn.ModuleDict.__call__"] = "torch.Tensor"
+allowlist["torch.nn.ModuleDict.__getitem__"] = "torch.nn.Module"
 allowlist["torch.nn.ModuleDict.parameters"] = "syft.lib.python.List"
 allowlist["torch.nn.ModuleDict.register_parameter"] = "syft.lib.python._SyNone"
 allowlist["torch.nn.ModuleDict.train"] = "torch.nn.ModuleDict"
@@ -36,6 +36,7 @@ from ...logger import traceback_and_raise
 from ...proto.lib.torch.module_pb2 import Module as Module_PB
 from ..python.collections import OrderedDict as SyOrderedDict
 from ..python.util import downcast
+from .state_sync import StateTracker
 
 # from ...core.node.common.service.auth import AuthorizationException
 
@@ -114,6 +115,7 @@ class Module:
 
         self.torch_ref = torch_ref
         self.training = False
+        self._state_tracker: Optional[Any] = None
         self._modules: OrderedDict[str, Module] = OrderedDict()
         real_module = torch_ref.nn.Module()
         self.__dict__["real_module"] = real_module  # bypass getattr/setattr
@@ -277,7 +279,14 @@ class Module:
 
         self.load_state_dict(input=path)
 
-    def send(self, client: Any, send_parameters: bool = True) -> Any:
+    def send(self, client: Any, send_parameters: bool = True, bulk: bool = True) -> Any:
+        """Send the model to `client` and return the remote model.
+
+        With `bulk` all the layers travel with their parameters and buffers as
+        a single object and no message waits for a reply. Otherwise every layer
+        is constructed remotely from its extra_repr and its state_dict is sent
+        and loaded separately.
+        """
         if not self.is_local:
             info("> This model is remote so try calling .get()")
             return
@@ -288,6 +297,13 @@ class Module:
         remote_model.setup(torch_ref=client.torch)
         remote_model.duet = client
 
+        if bulk and send_parameters:
+            self._send_layers(client=client, remote_model=remote_model)
+            info("\n> Finished sending local model <\n\n")
+            self.remote_model = remote_model
+            remote_model.local_model = self
+            return self.remote_model
+
         for name, module in self.modules.items():
             fqn = full_name_with_qualname(klass=type(module))
             klass = client.lib_ast.query(fqn, obj_type=type(module))
@@ -317,16 +333,39 @@ class Module:
 
         info("\n> Finished sending local model <\n\n")
         self.remote_model = remote_model
+        remote_model.local_model = self
         return self.remote_model
 
+    def _send_layers(self, client: Any, remote_model: "Module") -> None:
+        info(f"  Sending {len(self.modules)} local layers")
+        layers_ptr = torch.nn.ModuleDict(self.modules).send(client, pointable=False)
+        for name, module in self.modules.items():
+            layer_ptr = layers_ptr[name]
+            # ModuleDict.__getitem__ gives a torch.nn.Module pointer, swap it
+            # for a pointer of the layer's own type like resolve_pointer_type
+            fqn = full_name_with_qualname(klass=type(module))
+            klass = client.lib_ast.query(fqn, obj_type=type(module))
+            remote_module_ptr = klass.pointer_type(
+                client=client, id_at_location=layer_ptr.id_at_location
+            )
+            layer_ptr.gc_enabled = False
+            remote_model.__setattr__(name, remote_module_ptr)
+
     def get(
         self,
         request_block: bool = False,
         timeout_secs: int = 20,
         reason: str = "",
         delete_obj: bool = False,
+        bulk: bool = True,
     ) -> Optional["Module"]:
+        """Download the remote model and return it as a local model.
 
+        With `bulk` the whole model is downloaded as a single object, so there
+        is a single request to approve, and the remote model is left as it is.
+        Otherwise every layer's extra_repr and state_dict are requested
+        separately and `delete_obj` applies to the downloaded state_dicts.
+        """
         if self.is_local:
             info("> This model is local. Maybe you meant to call .send()?")
             return None
@@ -337,6 +376,26 @@ class Module:
         local_model.setup(torch_ref=torch)
         local_model.duet = self.duet
 
+        if bulk:
+            info(f"  Downloading {len(self.modules)} remote layers")
+            real_module = self.real_module.get(
+                request_block=request_block,
+                reason=reason,
+                timeout_secs=timeout_secs,
+                delete_obj=False,
+            )
+            if real_module is None:
+                info(f"  Request for {reason} model failed")
+                return None
+
+            for layer_name, local_module in real_module.named_children():
+                local_model.__setattr__(layer_name, local_module)
+
+            info("\n> Finished downloading remote model <\n\n")
+            self.local_model = local_model
+            local_model.remote_model = self
+            return self.local_model
+
         for layer_name, module in self.modules.items():
             module_parts = module.path_and_name.split(".")
             klass_name = module_parts.pop()
@@ -394,6 +453,85 @@ class Module:
 
         info("\n> Finished downloading remote model <\n\n")
         self.local_model = local_model
+        local_model.remote_model = self
+        return self.local_model
+
+    def _tracker(self) -> Any:
+        # the StateTracker of this end, created on the first push or pull
+        if self._state_tracker is None:
+            if self.is_local:
+                self._state_tracker = StateTracker(self.real_module)
+            else:
+                client = self.real_module.client
+                self._state_tracker = client.syft.lib.torch.state_sync.StateTracker(
+                    self.real_module
+                )
+        return self._state_tracker
+
+    def push(self, compression: Optional[str] = None) -> Optional["Module"]:
+        """Send the tensors changed since the last push or pull to the remote
+        model, without waiting on any reply.
+
+        The first push sends the whole state. `compression` can be "fp16" or
+        "int8" to send the changes as quantized differences, see
+        syft.lib.torch.state_sync.
+        """
+        if not self.is_local:
+            info("> This model is remote so try calling .pull()")
+            return None
+        if self.remote_model is None:
+            info("> This model has no remote model so try calling .send()")
+            return None
+
+        changes = self._tracker().changes(compression=compression)
+        info(f"> Pushing {len(changes)} changed tensors")
+        if len(changes) > 0:
+            client = self.remote_model.real_module.client
+            changes_ptr = changes.send(client, pointable=False)
+            self.remote_model._tracker().apply(changes_ptr)
+        return self.remote_model
+
+    def pull(
+        self,
+        request_block: bool = False,
+        timeout_secs: int = 20,
+        reason: str = "",
+        compression: Optional[str] = None,
+    ) -> Optional["Module"]:
+        """Download the tensors changed since the last push or pull into the
+        local model, with a single request.
+
+        Without a local model yet, the first pull gets the whole model.
+        `compression` can be "fp16" or "int8" to receive the changes as
+        quantized differences, see syft.lib.torch.state_sync.
+        """
+        if self.is_local:
+            info("> This model is local so try calling .push()")
+            return None
+
+        if self.local_model is None:
+            local_model = self.get(
+                request_block=request_block, timeout_secs=timeout_secs, reason=reason
+            )
+            if local_model is None:
+                return None
+            keep_values = compression is not None
+            self._tracker().mark_synced(keep_values)
+            local_model._tracker().mark_synced(keep_values)
+            return local_model
+
+        changes_ptr = self._tracker().changes(compression)
+        changes = changes_ptr.get(
+            request_block=request_block,
+            reason=reason,
+            timeout_secs=timeout_secs,
+        )
+        if changes is None:
+            info(f"  Request for {reason} changes failed")
+            return None
+
+        info(f"> Pulling {len(changes)} changed tensors")
+        self.local_model._tracker().apply(changes)
         return self.local_model
 
     # zero them so we know they are copied
@@ -434,6 +572,8 @@ def object2proto(obj: torch.nn.Module, is_child: bool = False) -> Module_PB:
         proto._uid2attr.CopyFrom(sy.serialize(SyOrderedDict(obj._uid2attr)))
 
     proto.parameters.CopyFrom(sy.serialize(SyOrderedDict(obj._parameters)))
+    # e.g. the running stats of a BatchNorm
+    proto.buffers.CopyFrom(sy.serialize(SyOrderedDict(obj._buffers)))
 
     for n, m in obj.named_children():
         child_proto = object2proto(m, is_child=True)
@@ -463,6 +603,11 @@ def proto2object(proto: Module_PB) -> torch.nn.Module:
         if not isinstance(param, _SyNone):
             setattr(obj, str(name), param)
 
+    if proto.HasField("buffers"):
+        for name, buffer in sy.deserialize(proto.buffers).items():
+            if not isinstance(buffer, _SyNone):
+                obj.register_buffer(str(name), buffer)
+
     if proto.HasField("forward"):
         forward_plan = sy.deserialize(proto.forward)
         obj._forward_plan = forward_plan
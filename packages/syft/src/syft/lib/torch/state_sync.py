@@ -0,0 +1,139 @@
+"""Incremental synchronization of the state of a torch.nn.Module.
+
+A StateTracker sits on each end of a model which is kept in sync between two
+machines, e.g. a sy.Module and its remote copy. It keeps a digest of every
+tensor of the module's state_dict as the other end last saw it, so `changes()`
+only returns the tensors which changed since and `apply()` loads the changes
+of the other end into the module in place.
+
+With a `compression` the changed floating point tensors travel as their
+difference to the last synced value, in half precision ("fp16") or quantized
+to int8 with a scale per tensor ("int8"). Both ends then keep the last synced
+values to add the differences to. The sender keeps the value the receiver
+reconstructs rather than its own, so the quantization error of a tensor is
+sent along with its next change instead of accumulating.
+"""
+
+# stdlib
+import hashlib
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+# third party
+import torch
+
+# syft relative
+from ...logger import traceback_and_raise
+from ..python.dict import Dict as SyDict
+
+# the value itself
+FULL = "full"
+# the value itself, kept by both ends for the differences to come
+BASE = "base"
+# the difference to the last synced value
+FP16 = "fp16"
+INT8 = "int8"
+
+COMPRESSIONS = (None, FP16, INT8)
+
+
+def digest(tensor: torch.Tensor) -> bytes:
+    tensor = tensor.detach().cpu().contiguous()
+    if tensor.dtype == torch.bfloat16:
+        # numpy has no bfloat16
+        tensor = tensor.view(torch.int16)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{tensor.dtype}{tuple(tensor.shape)}".encode())
+    h.update(tensor.numpy().tobytes())
+    return h.digest()
+
+
+def encode(
+    value: torch.Tensor, base: Optional[torch.Tensor], compression: Optional[str]
+) -> Tuple[Any, ...]:
+    value = value.detach()
+    if compression is None or not value.is_floating_point():
+        return (FULL, value.clone())
+    if base is None or base.shape != value.shape or base.dtype != value.dtype:
+        return (BASE, value.clone())
+
+    delta = value - base
+    if compression == FP16:
+        return (FP16, delta.half())
+    scale = delta.abs().max() / 127
+    if scale == 0:
+        scale = torch.ones_like(scale)
+    quantized = torch.round(delta / scale).clamp(-127, 127).to(torch.int8)
+    return (INT8, quantized, scale)
+
+
+def decode(payload: Tuple[Any, ...], base: Optional[torch.Tensor]) -> torch.Tensor:
+    kind = str(payload[0])
+    if kind in (FULL, BASE):
+        return payload[1]
+    if base is None:
+        traceback_and_raise(ValueError(f"No synced value to add the {kind} to."))
+    if kind == FP16:
+        return base + payload[1].to(base.dtype)
+    if kind == INT8:
+        return base + payload[1].to(base.dtype) * payload[2].to(base.dtype)
+    traceback_and_raise(ValueError(f"Unknown kind of change {kind}."))
+
+
+class StateTracker:
+    def __init__(self, module: torch.nn.Module) -> None:
+        self.module = module
+        # digest of each tensor as the other end has it
+        self._digests: Dict[str, bytes] = {}
+        # value of each tensor as the other end has it, for the differences
+        self._synced: Dict[str, torch.Tensor] = {}
+
+    def _record(self, name: str, kind: str, value: torch.Tensor) -> None:
+        # both ends follow the same rule so they keep the same values
+        if kind == FULL:
+            self._synced.pop(name, None)
+        else:
+            self._synced[name] = value.detach().clone()
+
+    def mark_synced(self, keep_values: bool = False) -> None:
+        """Consider the current state as the one the other end has, e.g.
+        right after the whole module was sent or downloaded."""
+        for name, value in self.module.state_dict().items():
+            self._digests[name] = digest(value)
+            kind = BASE if keep_values and value.is_floating_point() else FULL
+            self._record(name, kind, value)
+
+    def changes(self, compression: Optional[str] = None) -> SyDict:
+        """The tensors which changed since the last sync, by state_dict key."""
+        if compression not in COMPRESSIONS:
+            traceback_and_raise(
+                ValueError(
+                    f"Unknown compression {compression}, use one of {COMPRESSIONS}"
+                )
+            )
+
+        changes = {}
+        for name, value in self.module.state_dict().items():
+            value_digest = digest(value)
+            if self._digests.get(name) == value_digest:
+                continue
+            payload = encode(value, self._synced.get(name), compression)
+            self._record(name, payload[0], decode(payload, self._synced.get(name)))
+            self._digests[name] = value_digest
+            changes[name] = payload
+        return SyDict(changes)
+
+    def apply(self, changes: Dict[str, Tuple[Any, ...]]) -> None:
+        """Load the changes of the other end into the module."""
+        state = self.module.state_dict()
+        with torch.no_grad():
+            for name, payload in changes.items():
+                name = str(name)
+                if name not in state:
+                    traceback_and_raise(KeyError(f"Module has no state {name}."))
+                value = decode(payload, self._synced.get(name))
+                state[name].copy_(value)
+                self._record(name, str(payload[0]), state[name])
+                self._digests[name] = digest(state[name])
@@ -1,7 +1,20 @@
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
 # third party
 import torch as th
 
 # syft relative
+from ...core.common.serde.scope import DESERIALIZE
+from ...core.common.serde.scope import SERIALIZE
+from ...core.common.serde.scope import SerdeScope
+from ...core.common.serde.scope import current_scope
+from ...logger import traceback_and_raise
 from ...proto.lib.torch.tensor_pb2 import TensorData
 
 # Torch dtypes to string (and back) mappers
@@ -26,10 +39,133 @@ TORCH_DTYPE_STR = {
 TORCH_STR_DTYPE = {name: cls for cls, name in TORCH_DTYPE_STR.items()}
 
 
+STORAGE_TABLE = "torch.storages"
+
+
+class StorageTable:
+    """The storages of the tensors of one message.
+
+    Tensors sharing a storage within a message, e.g. tied weights or views of
+    the same tensor in a state_dict, are written as a reference to the storage
+    with their offset, shape and stride, so it is sent once and the tensors
+    still share it once deserialized. The first of them must span its whole
+    storage in order, so its contents, written as for any other tensor, are
+    the contents of the storage. It only adds the id of the storage, which
+    peers without shared storages ignore, so they still read every tensor
+    whose storage isn't shared in the message.
+    """
+
+    def __init__(self) -> None:
+        # serialize: the id of each storage, the storages are kept alive so
+        # their memory isn't reused by another storage of the message
+        self.ids: Dict[Tuple[str, str, int], int] = {}
+        self.storages: List[Any] = []
+        # deserialize: a flat tensor over each storage
+        self.flat: Dict[int, th.Tensor] = {}
+        self.filled: Set[int] = set()
+
+    def check_filled(self) -> None:
+        missing = set(self.flat) - self.filled
+        if missing:
+            traceback_and_raise(
+                ValueError(
+                    f"The message refers to tensor storages {sorted(missing)} "
+                    + "without their contents."
+                )
+            )
+
+
+def _deserialize_table(scope: Optional[SerdeScope]) -> StorageTable:
+    if scope is None:
+        # a tensor deserialized on its own must hold its storage
+        return StorageTable()
+
+    def new_table() -> StorageTable:
+        table = StorageTable()
+        scope.on_exit(table.check_filled)  # type: ignore
+        return table
+
+    return scope.table(STORAGE_TABLE, new_table)
+
+
+def _serialize_with_storage(
+    tensor: th.Tensor, dtype: str, scope: SerdeScope
+) -> Optional[TensorData]:
+    table: StorageTable = scope.table(STORAGE_TABLE, StorageTable)
+    storage = tensor.storage()
+    key = (str(tensor.device), dtype, storage.data_ptr())
+
+    storage_id = table.ids.get(key)
+    if storage_id is None and not (
+        tensor.is_contiguous()
+        and tensor.storage_offset() == 0
+        and storage.size() == tensor.numel()
+    ):
+        # only a tensor laid out as its whole storage can hold it, any other
+        # first tensor is written on its own, e.g. a slice or a transpose
+        return None
+
+    protobuf_tensor = TensorData()
+    protobuf_tensor.dtype = dtype
+    protobuf_tensor.shape.extend(tensor.size())
+    protobuf_tensor.stride.extend(tensor.stride())
+    protobuf_tensor.storage_offset = tensor.storage_offset()
+    protobuf_tensor.storage_size = storage.size()
+
+    if storage_id is None:
+        storage_id = len(table.storages) + 1
+        table.ids[key] = storage_id
+        table.storages.append(storage)
+        data = th.flatten(tensor).tolist()
+        getattr(protobuf_tensor, "contents_" + dtype).extend(data)
+    protobuf_tensor.storage_id = storage_id
+
+    return protobuf_tensor
+
+
+def _deserialize_with_storage(protobuf_tensor: TensorData) -> th.Tensor:
+    scope = current_scope(DESERIALIZE)
+    table = _deserialize_table(scope)
+    dtype = TORCH_STR_DTYPE[protobuf_tensor.dtype]
+    storage_id = protobuf_tensor.storage_id
+
+    flat = table.flat.get(storage_id)
+    if flat is None:
+        # the tensor holding the contents may come later in the message
+        flat = th.empty(protobuf_tensor.storage_size, dtype=dtype)
+        table.flat[storage_id] = flat
+    data = getattr(protobuf_tensor, "contents_" + protobuf_tensor.dtype)
+    if len(data):
+        flat.copy_(th.tensor(data, dtype=dtype))
+        table.filled.add(storage_id)
+    if scope is None:
+        table.check_filled()
+
+    return th.empty(0, dtype=dtype).set_(
+        flat.storage(),
+        protobuf_tensor.storage_offset,
+        tuple(protobuf_tensor.shape),
+        tuple(protobuf_tensor.stride),
+    )
+
+
 def protobuf_tensor_serializer(tensor: th.Tensor) -> TensorData:
     """Strategy to serialize a tensor using Protobuf"""
     dtype = TORCH_DTYPE_STR[tensor.dtype]
 
+    scope = current_scope(SERIALIZE)
+    if (
+        scope is not None
+        and not tensor.is_quantized
+        and tensor.layout == th.strided
+        and tensor.numel() > 0
+    ):
+        protobuf_tensor = _serialize_with_storage(
+            tensor=tensor, dtype=dtype, scope=scope
+        )
+        if protobuf_tensor is not None:
+            return protobuf_tensor
+
     protobuf_tensor = TensorData()
 
     if tensor.is_quantized:
@@ -49,6 +185,9 @@ def protobuf_tensor_serializer(tensor: th.Tensor) -> TensorData:
 
 def protobuf_tensor_deserializer(protobuf_tensor: TensorData) -> th.Tensor:
     """Strategy to deserialize a binary input using Protobuf"""
+    if protobuf_tensor.storage_id:
+        return _deserialize_with_storage(protobuf_tensor)
+
     size = tuple(protobuf_tensor.shape)
     data = getattr(protobuf_tensor, "contents_" + protobuf_tensor.dtype)
 
@@ -13,6 +13,7 @@ from typing import Tuple as TypeTuple
 import xgboost as xgb
 
 # syft relative
+from . import serializing_models  # noqa: 401
 from ...ast import add_classes
 from ...ast import add_methods
 from ...ast import add_modules
@@ -0,0 +1,13 @@
+"""Serde of xgboost Boosters and of the sklearn API models, see
+syft.lib.numpy.model. A Booster travels as its raw model."""
+
+# third party
+import xgboost as xgb
+
+# syft relative
+from ..numpy.model import register_models
+
+register_models(
+    (xgb.core.Booster, "xgboost.core.Booster"),
+    (xgb.sklearn.XGBModel, "xgboost.sklearn.XGBModel"),
+)
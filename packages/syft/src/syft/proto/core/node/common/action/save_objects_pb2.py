@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: proto/lib/sklearn/logistic_model.proto
+# source: proto/core/node/common/action/save_objects.proto
 """Generated protocol buffer code."""
 # third party
 from google.protobuf import descriptor as _descriptor
@@ -14,43 +14,43 @@ _sym_db = _symbol_database.Default()
 
 
 # syft absolute
-from syft.proto.core.common import (
-    common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
+from syft.proto.core.io import address_pb2 as proto_dot_core_dot_io_dot_address__pb2
+from syft.proto.core.store import (
+    store_object_pb2 as proto_dot_core_dot_store_dot_store__object__pb2,
 )
-from syft.proto.lib.python import dict_pb2 as proto_dot_lib_dot_python_dot_dict__pb2
 
 DESCRIPTOR = _descriptor.FileDescriptor(
-    name="proto/lib/sklearn/logistic_model.proto",
-    package="syft.lib.sklearn",
+    name="proto/core/node/common/action/save_objects.proto",
+    package="syft.core.node.common.action",
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n&proto/lib/sklearn/logistic_model.proto\x12\x10syft.lib.sklearn\x1a%proto/core/common/common_object.proto\x1a\x1bproto/lib/python/dict.proto"S\n\x08Logistic\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12$\n\x05model\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dictb\x06proto3',
+    serialized_pb=b'\n0proto/core/node/common/action/save_objects.proto\x12\x1csyft.core.node.common.action\x1a#proto/core/store/store_object.proto\x1a\x1bproto/core/io/address.proto"j\n\x11SaveObjectsAction\x12-\n\x04objs\x18\x01 \x03(\x0b\x32\x1f.syft.core.store.StorableObject\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Addressb\x06proto3',
     dependencies=[
-        proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
-        proto_dot_lib_dot_python_dot_dict__pb2.DESCRIPTOR,
+        proto_dot_core_dot_store_dot_store__object__pb2.DESCRIPTOR,
+        proto_dot_core_dot_io_dot_address__pb2.DESCRIPTOR,
     ],
 )
 
 
-_LOGISTIC = _descriptor.Descriptor(
-    name="Logistic",
-    full_name="syft.lib.sklearn.Logistic",
+_SAVEOBJECTSACTION = _descriptor.Descriptor(
+    name="SaveObjectsAction",
+    full_name="syft.core.node.common.action.SaveObjectsAction",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     create_key=_descriptor._internal_create_key,
     fields=[
         _descriptor.FieldDescriptor(
-            name="id",
-            full_name="syft.lib.sklearn.Logistic.id",
+            name="objs",
+            full_name="syft.core.node.common.action.SaveObjectsAction.objs",
             index=0,
             number=1,
             type=11,
             cpp_type=10,
-            label=1,
+            label=3,
             has_default_value=False,
-            default_value=None,
+            default_value=[],
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -61,8 +61,8 @@ _LOGISTIC = _descriptor.Descriptor(
             create_key=_descriptor._internal_create_key,
         ),
         _descriptor.FieldDescriptor(
-            name="model",
-            full_name="syft.lib.sklearn.Logistic.model",
+            name="address",
+            full_name="syft.core.node.common.action.SaveObjectsAction.address",
             index=1,
             number=2,
             type=11,
@@ -88,29 +88,29 @@ _LOGISTIC = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=128,
-    serialized_end=211,
+    serialized_start=148,
+    serialized_end=254,
 )
 
-_LOGISTIC.fields_by_name[
-    "id"
-].message_type = proto_dot_core_dot_common_dot_common__object__pb2._UID
-_LOGISTIC.fields_by_name[
-    "model"
-].message_type = proto_dot_lib_dot_python_dot_dict__pb2._DICT
-DESCRIPTOR.message_types_by_name["Logistic"] = _LOGISTIC
+_SAVEOBJECTSACTION.fields_by_name[
+    "objs"
+].message_type = proto_dot_core_dot_store_dot_store__object__pb2._STORABLEOBJECT
+_SAVEOBJECTSACTION.fields_by_name[
+    "address"
+].message_type = proto_dot_core_dot_io_dot_address__pb2._ADDRESS
+DESCRIPTOR.message_types_by_name["SaveObjectsAction"] = _SAVEOBJECTSACTION
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
-Logistic = _reflection.GeneratedProtocolMessageType(
-    "Logistic",
+SaveObjectsAction = _reflection.GeneratedProtocolMessageType(
+    "SaveObjectsAction",
     (_message.Message,),
     {
-        "DESCRIPTOR": _LOGISTIC,
-        "__module__": "proto.lib.sklearn.logistic_model_pb2"
-        # @@protoc_insertion_point(class_scope:syft.lib.sklearn.Logistic)
+        "DESCRIPTOR": _SAVEOBJECTSACTION,
+        "__module__": "proto.core.node.common.action.save_objects_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.node.common.action.SaveObjectsAction)
     },
 )
-_sym_db.RegisterMessage(Logistic)
+_sym_db.RegisterMessage(SaveObjectsAction)
 
 
 # @@protoc_insertion_point(module_scope)
@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n1proto/core/remote_dataloader/remote_dataset.proto\x12\'syft.core.node.common.remote_dataloader"0\n\rRemoteDataset\x12\x11\n\tdata_type\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t"v\n\x10RemoteDataLoader\x12N\n\x0eremote_dataset\x18\x01 \x01(\x0b\x32\x36.syft.core.node.common.remote_dataloader.RemoteDataset\x12\x12\n\nbatch_size\x18\x02 \x01(\x03\x62\x06proto3',
+    serialized_pb=b'\n1proto/core/remote_dataloader/remote_dataset.proto\x12\'syft.core.node.common.remote_dataloader"0\n\rRemoteDataset\x12\x11\n\tdata_type\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t"\xd9\x01\n\x10RemoteDataLoader\x12N\n\x0eremote_dataset\x18\x01 \x01(\x0b\x32\x36.syft.core.node.common.remote_dataloader.RemoteDataset\x12\x12\n\nbatch_size\x18\x02 \x01(\x03\x12\x0f\n\x07shuffle\x18\x03 \x01(\x08\x12\x13\n\x0bnum_workers\x18\x04 \x01(\x03\x12\x17\n\x0fprefetch_factor\x18\x05 \x01(\x03\x12\x11\n\tdrop_last\x18\x06 \x01(\x08\x12\x0f\n\x07sampler\x18\x07 \x03(\x03\x62\x06proto3',
 )
 
 
@@ -129,6 +129,101 @@ _REMOTEDATALOADER = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="shuffle",
+            full_name="syft.core.node.common.remote_dataloader.RemoteDataLoader.shuffle",
+            index=2,
+            number=3,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="num_workers",
+            full_name="syft.core.node.common.remote_dataloader.RemoteDataLoader.num_workers",
+            index=3,
+            number=4,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="prefetch_factor",
+            full_name="syft.core.node.common.remote_dataloader.RemoteDataLoader.prefetch_factor",
+            index=4,
+            number=5,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="drop_last",
+            full_name="syft.core.node.common.remote_dataloader.RemoteDataLoader.drop_last",
+            index=5,
+            number=6,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="sampler",
+            full_name="syft.core.node.common.remote_dataloader.RemoteDataLoader.sampler",
+            index=6,
+            number=7,
+            type=3,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -138,8 +233,8 @@ _REMOTEDATALOADER = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=144,
-    serialized_end=262,
+    serialized_start=145,
+    serialized_end=362,
 )
 
 _REMOTEDATALOADER.fields_by_name["remote_dataset"].message_type = _REMOTEDATASET
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/lib/numpy/model.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+# syft absolute
+from syft.proto.lib.numpy import array_pb2 as proto_dot_lib_dot_numpy_dot_array__pb2
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/lib/numpy/model.proto",
+    package="syft.lib.numpy",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n\x1bproto/lib/numpy/model.proto\x12\x0esyft.lib.numpy\x1a\x1bproto/lib/numpy/array.proto"Y\n\nModelProto\x12\x10\n\x08skeleton\x18\x01 \x01(\t\x12*\n\x06\x61rrays\x18\x02 \x03(\x0b\x32\x1a.syft.lib.numpy.NumpyProto\x12\r\n\x05\x62lobs\x18\x03 \x03(\x0c\x62\x06proto3',
+    dependencies=[
+        proto_dot_lib_dot_numpy_dot_array__pb2.DESCRIPTOR,
+    ],
+)
+
+
+_MODELPROTO = _descriptor.Descriptor(
+    name="ModelProto",
+    full_name="syft.lib.numpy.ModelProto",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="skeleton",
+            full_name="syft.lib.numpy.ModelProto.skeleton",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="arrays",
+            full_name="syft.lib.numpy.ModelProto.arrays",
+            index=1,
+            number=2,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="blobs",
+            full_name="syft.lib.numpy.ModelProto.blobs",
+            index=2,
+            number=3,
+            type=12,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=76,
+    serialized_end=165,
+)
+
+_MODELPROTO.fields_by_name[
+    "arrays"
+].message_type = proto_dot_lib_dot_numpy_dot_array__pb2._NUMPYPROTO
+DESCRIPTOR.message_types_by_name["ModelProto"] = _MODELPROTO
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ModelProto = _reflection.GeneratedProtocolMessageType(
+    "ModelProto",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _MODELPROTO,
+        "__module__": "proto.lib.numpy.model_pb2"
+        # @@protoc_insertion_point(class_scope:syft.lib.numpy.ModelProto)
+    },
+)
+_sym_db.RegisterMessage(ModelProto)
+
+
+# @@protoc_insertion_point(module_scope)
@@ -1,90 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: proto/lib/statsmodels/results.proto
-"""Generated protocol buffer code."""
-# third party
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
-from google.protobuf import symbol_database as _symbol_database
-
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-# syft absolute
-from syft.proto.lib.python import string_pb2 as proto_dot_lib_dot_python_dot_string__pb2
-
-DESCRIPTOR = _descriptor.FileDescriptor(
-    name="proto/lib/statsmodels/results.proto",
-    package="syft.lib.statsmodels",
-    syntax="proto3",
-    serialized_options=None,
-    create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n#proto/lib/statsmodels/results.proto\x12\x14syft.lib.statsmodels\x1a\x1dproto/lib/python/string.proto"8\n\x0cResultsProto\x12(\n\x07summary\x18\x01 \x01(\x0b\x32\x17.syft.lib.python.Stringb\x06proto3',
-    dependencies=[
-        proto_dot_lib_dot_python_dot_string__pb2.DESCRIPTOR,
-    ],
-)
-
-
-_RESULTSPROTO = _descriptor.Descriptor(
-    name="ResultsProto",
-    full_name="syft.lib.statsmodels.ResultsProto",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    create_key=_descriptor._internal_create_key,
-    fields=[
-        _descriptor.FieldDescriptor(
-            name="summary",
-            full_name="syft.lib.statsmodels.ResultsProto.summary",
-            index=0,
-            number=1,
-            type=11,
-            cpp_type=10,
-            label=1,
-            has_default_value=False,
-            default_value=None,
-            message_type=None,
-            enum_type=None,
-            containing_type=None,
-            is_extension=False,
-            extension_scope=None,
-            serialized_options=None,
-            file=DESCRIPTOR,
-            create_key=_descriptor._internal_create_key,
-        ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=92,
-    serialized_end=148,
-)
-
-_RESULTSPROTO.fields_by_name[
-    "summary"
-].message_type = proto_dot_lib_dot_python_dot_string__pb2._STRING
-DESCRIPTOR.message_types_by_name["ResultsProto"] = _RESULTSPROTO
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-ResultsProto = _reflection.GeneratedProtocolMessageType(
-    "ResultsProto",
-    (_message.Message,),
-    {
-        "DESCRIPTOR": _RESULTSPROTO,
-        "__module__": "proto.lib.statsmodels.results_pb2"
-        # @@protoc_insertion_point(class_scope:syft.lib.statsmodels.ResultsProto)
-    },
-)
-_sym_db.RegisterMessage(ResultsProto)
-
-
-# @@protoc_insertion_point(module_scope)
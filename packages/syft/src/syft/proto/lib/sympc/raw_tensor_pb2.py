@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/lib/sympc/raw_tensor.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+    name="proto/lib/sympc/raw_tensor.proto",
+    package="syft.lib.sympc",
+    syntax="proto3",
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+    serialized_pb=b'\n proto/lib/sympc/raw_tensor.proto\x12\x0esyft.lib.sympc"7\n\tRawTensor\x12\r\n\x05\x64type\x18\x01 \x01(\t\x12\r\n\x05shape\x18\x02 \x03(\x03\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x62\x06proto3',
+)
+
+
+_RAWTENSOR = _descriptor.Descriptor(
+    name="RawTensor",
+    full_name="syft.lib.sympc.RawTensor",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    create_key=_descriptor._internal_create_key,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="dtype",
+            full_name="syft.lib.sympc.RawTensor.dtype",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="shape",
+            full_name="syft.lib.sympc.RawTensor.shape",
+            index=1,
+            number=2,
+            type=3,
+            cpp_type=2,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="data",
+            full_name="syft.lib.sympc.RawTensor.data",
+            index=2,
+            number=3,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=52,
+    serialized_end=107,
+)
+
+DESCRIPTOR.message_types_by_name["RawTensor"] = _RAWTENSOR
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+RawTensor = _reflection.GeneratedProtocolMessageType(
+    "RawTensor",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _RAWTENSOR,
+        "__module__": "proto.lib.sympc.raw_tensor_pb2"
+        # @@protoc_insertion_point(class_scope:syft.lib.sympc.RawTensor)
+    },
+)
+_sym_db.RegisterMessage(RawTensor)
+
+
+# @@protoc_insertion_point(module_scope)
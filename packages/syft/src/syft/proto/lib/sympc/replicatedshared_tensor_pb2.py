@@ -15,6 +15,9 @@ _sym_db = _symbol_database.Default()
 
 # syft absolute
 from syft.proto.lib.python import dict_pb2 as proto_dot_lib_dot_python_dot_dict__pb2
+from syft.proto.lib.sympc import (
+    raw_tensor_pb2 as proto_dot_lib_dot_sympc_dot_raw__tensor__pb2,
+)
 from syft.proto.lib.torch import tensor_pb2 as proto_dot_lib_dot_torch_dot_tensor__pb2
 
 DESCRIPTOR = _descriptor.FileDescriptor(
@@ -23,10 +26,11 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n-proto/lib/sympc/replicatedshared_tensor.proto\x12\x0esyft.lib.sympc\x1a\x1cproto/lib/torch/tensor.proto\x1a\x1bproto/lib/python/dict.proto"\x81\x01\n\x16ReplicatedSharedTensor\x12*\n\x06tensor\x18\x01 \x03(\x0b\x32\x1a.syft.lib.torch.TensorData\x12%\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dict\x12\x14\n\x0csession_uuid\x18\x03 \x01(\tb\x06proto3',
+    serialized_pb=b"\n-proto/lib/sympc/replicatedshared_tensor.proto\x12\x0esyft.lib.sympc\x1a\x1cproto/lib/torch/tensor.proto\x1a\x1bproto/lib/python/dict.proto\x1a proto/lib/sympc/raw_tensor.proto\"\xaa\x01\n\x16ReplicatedSharedTensor\x12*\n\x06tensor\x18\x01 \x03(\x0b\x32\x1a.syft.lib.torch.TensorData\x12%\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dict\x12\x14\n\x0csession_uuid\x18\x03 \x01(\t\x12'\n\x04\x64\x61ta\x18\x04 \x03(\x0b\x32\x19.syft.lib.sympc.RawTensorb\x06proto3",
     dependencies=[
         proto_dot_lib_dot_torch_dot_tensor__pb2.DESCRIPTOR,
         proto_dot_lib_dot_python_dot_dict__pb2.DESCRIPTOR,
+        proto_dot_lib_dot_sympc_dot_raw__tensor__pb2.DESCRIPTOR,
     ],
 )
 
@@ -96,6 +100,25 @@ _REPLICATEDSHAREDTENSOR = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="data",
+            full_name="syft.lib.sympc.ReplicatedSharedTensor.data",
+            index=3,
+            number=4,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -105,8 +128,8 @@ _REPLICATEDSHAREDTENSOR = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=125,
-    serialized_end=254,
+    serialized_start=159,
+    serialized_end=329,
 )
 
 _REPLICATEDSHAREDTENSOR.fields_by_name[
@@ -115,6 +138,9 @@ _REPLICATEDSHAREDTENSOR.fields_by_name[
 _REPLICATEDSHAREDTENSOR.fields_by_name[
     "config"
 ].message_type = proto_dot_lib_dot_python_dot_dict__pb2._DICT
+_REPLICATEDSHAREDTENSOR.fields_by_name[
+    "data"
+].message_type = proto_dot_lib_dot_sympc_dot_raw__tensor__pb2._RAWTENSOR
 DESCRIPTOR.message_types_by_name["ReplicatedSharedTensor"] = _REPLICATEDSHAREDTENSOR
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -24,7 +24,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1eproto/lib/tenseal/vector.proto\x12\x10syft.lib.tenseal\x1a%proto/core/common/common_object.proto"T\n\rTenSEALVector\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12\x10\n\x08obj_type\x18\x02 \x01(\t\x12\x0e\n\x06vector\x18\x04 \x01(\x0c\x62\x06proto3',
+    serialized_pb=b'\n\x1eproto/lib/tenseal/vector.proto\x12\x10syft.lib.tenseal\x1a%proto/core/common/common_object.proto"y\n\rTenSEALVector\x12!\n\x02id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12\x10\n\x08obj_type\x18\x02 \x01(\t\x12\x0e\n\x06vector\x18\x04 \x01(\x0c\x12\x12\n\ncontext_id\x18\x05 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x06 \x01(\x0c\x62\x06proto3',
     dependencies=[
         proto_dot_core_dot_common_dot_common__object__pb2.DESCRIPTOR,
     ],
@@ -96,6 +96,44 @@ _TENSEALVECTOR = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="context_id",
+            full_name="syft.lib.tenseal.TenSEALVector.context_id",
+            index=3,
+            number=5,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"".decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
+        _descriptor.FieldDescriptor(
+            name="context",
+            full_name="syft.lib.tenseal.TenSEALVector.context",
+            index=4,
+            number=6,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=b"",
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -106,7 +144,7 @@ _TENSEALVECTOR = _descriptor.Descriptor(
     extension_ranges=[],
     oneofs=[],
     serialized_start=91,
-    serialized_end=175,
+    serialized_end=212,
 )
 
 _TENSEALVECTOR.fields_by_name[
@@ -25,7 +25,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
-    serialized_pb=b'\n\x1cproto/lib/torch/module.proto\x12\x0esyft.lib.torch\x1a/proto/lib/python/collections/ordered_dict.proto\x1a\x1aproto/core/plan/plan.proto"\xf5\x02\n\x06Module\x12\x13\n\x0bmodule_type\x18\x01 \x01(\t\x12\x13\n\x0bmodule_name\x18\x02 \x01(\t\x12\x13\n\x0bmodule_repr\x18\x03 \x01(\t\x12(\n\x08\x63hildren\x18\x04 \x03(\x0b\x32\x16.syft.lib.torch.Module\x12<\n\nstate_dict\x18\x05 \x01(\x0b\x32(.syft.lib.python.collections.OrderedDict\x12<\n\nparameters\x18\x06 \x01(\x0b\x32(.syft.lib.python.collections.OrderedDict\x12*\n\x07\x66orward\x18\x07 \x01(\x0b\x32\x14.syft.core.plan.PlanH\x00\x88\x01\x01\x12@\n\t_uid2attr\x18\x08 \x01(\x0b\x32(.syft.lib.python.collections.OrderedDictH\x01\x88\x01\x01\x42\n\n\x08_forwardB\x0c\n\nX_uid2attrb\x06proto3',
+    serialized_pb=b'\n\x1cproto/lib/torch/module.proto\x12\x0esyft.lib.torch\x1a/proto/lib/python/collections/ordered_dict.proto\x1a\x1aproto/core/plan/plan.proto"\xb0\x03\n\x06Module\x12\x13\n\x0bmodule_type\x18\x01 \x01(\t\x12\x13\n\x0bmodule_name\x18\x02 \x01(\t\x12\x13\n\x0bmodule_repr\x18\x03 \x01(\t\x12(\n\x08\x63hildren\x18\x04 \x03(\x0b\x32\x16.syft.lib.torch.Module\x12<\n\nstate_dict\x18\x05 \x01(\x0b\x32(.syft.lib.python.collections.OrderedDict\x12<\n\nparameters\x18\x06 \x01(\x0b\x32(.syft.lib.python.collections.OrderedDict\x12*\n\x07\x66orward\x18\x07 \x01(\x0b\x32\x14.syft.core.plan.PlanH\x00\x88\x01\x01\x12@\n\t_uid2attr\x18\x08 \x01(\x0b\x32(.syft.lib.python.collections.OrderedDictH\x01\x88\x01\x01\x12\x39\n\x07\x62uffers\x18\t \x01(\x0b\x32(.syft.lib.python.collections.OrderedDictB\n\n\x08_forwardB\x0c\n\nX_uid2attrb\x06proto3',
     dependencies=[
         proto_dot_lib_dot_python_dot_collections_dot_ordered__dict__pb2.DESCRIPTOR,
         proto_dot_core_dot_plan_dot_plan__pb2.DESCRIPTOR,
@@ -193,6 +193,25 @@ _MODULE = _descriptor.Descriptor(
             file=DESCRIPTOR,
             create_key=_descriptor._internal_create_key,
         ),
+        _descriptor.FieldDescriptor(
+            name="buffers",
+            full_name="syft.lib.torch.Module.buffers",
+            index=8,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+            create_key=_descriptor._internal_create_key,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -220,7 +239,7 @@ _MODULE = _descriptor.Descriptor(
         ),
     ],
     serialized_start=126,
-    serialized_end=499,
+    serialized_end=558,
 )
 
 _MODULE.fields_by_name["children"].message_type = _MODULE
@@ -242,6 +261,11 @@ _MODULE.fields_by_name[
 ].message_type = (
     proto_dot_lib_dot_python_dot_collections_dot_ordered__dict__pb2._ORDEREDDICT
 )
+_MODULE.fields_by_name[
+    "buffers"
+].message_type = (
+    proto_dot_lib_dot_python_dot_collections_dot_ordered__dict__pb2._ORDEREDDICT
+)
 _MODULE.oneofs_by_name["_forward"].fields.append(_MODULE.fields_by_name["forward"])
 _MODULE.fields_by_name["forward"].containing_oneof = _MODULE.oneofs_by_name["_forward"]
 _MODULE.oneofs_by_name["X_uid2attr"].fields.append(_MODULE.fields_by_name["_uid2attr"])
@@ -0,0 +1,77 @@
+"""
+Benchmarks for sending a ResNet-18 sized sy.Module to a VM and getting it back,
+as a single object and layer by layer
+"""
+
+# stdlib
+from typing import Any
+from typing import Dict
+
+# third party
+import pytest
+import torch
+
+# syft absolute
+import syft as sy
+
+# the 3x3 convolutions of a ResNet-18, about 11.5M parameters with the head
+RESNET18_CHANNELS = [64] * 5 + [128] * 4 + [256] * 4 + [512] * 4
+
+
+class ResNetSized(sy.Module):
+    def __init__(self, torch_ref: Any) -> None:
+        super(ResNetSized, self).__init__(torch_ref=torch_ref)
+        self.conv0 = torch_ref.nn.Conv2d(
+            3, 64, kernel_size=7, stride=2, padding=3, bias=False
+        )
+        self.bn0 = torch_ref.nn.BatchNorm2d(64)
+        for i, (n_in, n_out) in enumerate(
+            zip(RESNET18_CHANNELS, RESNET18_CHANNELS[1:]), start=1
+        ):
+            setattr(
+                self,
+                f"conv{i}",
+                torch_ref.nn.Conv2d(n_in, n_out, kernel_size=3, padding=1, bias=False),
+            )
+            setattr(self, f"bn{i}", torch_ref.nn.BatchNorm2d(n_out))
+        self.fc = torch_ref.nn.Linear(512, 1000)
+
+
+def count_messages(client: sy.VirtualMachineClient) -> Dict[str, int]:
+    counts = {"with_reply": 0, "without_reply": 0}
+    with_reply = client.send_immediate_msg_with_reply
+    without_reply = client.send_immediate_msg_without_reply
+
+    def counting_with_reply(*args: Any, **kwargs: Any) -> Any:
+        counts["with_reply"] += 1
+        return with_reply(*args, **kwargs)
+
+    def counting_without_reply(*args: Any, **kwargs: Any) -> Any:
+        counts["without_reply"] += 1
+        return without_reply(*args, **kwargs)
+
+    client.send_immediate_msg_with_reply = counting_with_reply  # type: ignore
+    client.send_immediate_msg_without_reply = counting_without_reply  # type: ignore
+    return counts
+
+
+def send_get(model: sy.Module, client: sy.VirtualMachineClient, bulk: bool) -> None:
+    model_ptr = model.send(client, bulk=bulk)
+    assert model_ptr.get(bulk=bulk) is not None
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("bulk", [True, False])
+def test_module_send_get(bulk: bool, benchmark: Any) -> None:
+    vm = sy.VirtualMachine(name="Bench VM")
+    client = vm.get_root_client()
+    model = ResNetSized(torch_ref=torch)
+
+    counts = count_messages(client)
+    send_get(model, client, bulk)
+    benchmark.extra_info["layers"] = len(model.modules)
+    benchmark.extra_info["parameters"] = sum(p.numel() for p in model.parameters())
+    benchmark.extra_info["messages with reply"] = counts["with_reply"]
+    benchmark.extra_info["messages without reply"] = counts["without_reply"]
+
+    benchmark.pedantic(send_get, args=(model, client, bulk), rounds=3, iterations=1)
@@ -0,0 +1,61 @@
+"""
+Benchmarks for the numpy serde, reporting the throughput of a round trip and
+how many copies of the array it allocates
+"""
+
+# stdlib
+import tracemalloc
+from typing import Any
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.experimental_flags import flags
+
+np = pytest.importorskip("numpy")
+sy.load("numpy")
+
+DTYPES = ["bool", "uint8", "int32", "uint64", "float16", "float32", "float64"]
+SIZES = [10 ** 3, 10 ** 5, 10 ** 7]
+
+
+def serde(array: Any) -> Any:
+    return sy.deserialize(blob=sy.serialize(array, to_bytes=True), from_bytes=True)
+
+
+def count_copies(array: Any) -> float:
+    # peak memory allocated by a round trip, in multiples of the array size
+    tracemalloc.start()
+    try:
+        serde(array)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / array.nbytes
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("arrow_backend", [False, True])
+@pytest.mark.parametrize("contiguous", [True, False])
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_numpy_serde(
+    dtype: str, size: int, contiguous: bool, arrow_backend: bool, benchmark: Any
+) -> None:
+    if arrow_backend and dtype == "bool":
+        pytest.skip("arrow tensors don't support bool")
+
+    flags.APACHE_ARROW_TENSOR_SERDE = arrow_backend
+    array = np.ones(size if contiguous else size * 2, dtype=dtype)
+    if not contiguous:
+        array = array[::2]
+
+    benchmark.extra_info["copies"] = round(count_copies(array), 2)
+    result = benchmark.pedantic(serde, args=(array,), rounds=5, iterations=1)
+    benchmark.extra_info["MB/s"] = round(
+        array.nbytes / benchmark.stats.stats.mean / 2 ** 20, 1
+    )
+
+    assert (result == array).all()
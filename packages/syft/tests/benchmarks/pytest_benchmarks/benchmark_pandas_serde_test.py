@@ -0,0 +1,61 @@
+"""
+Benchmarks for the pandas DataFrame serde across row counts, compression codecs
+and record batch sizes
+"""
+
+# stdlib
+from typing import Any
+from typing import Optional
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+sy.load("pandas")
+
+ROWS = [10 ** 3, 10 ** 5, 10 ** 6]
+CODECS = [("none", None), ("lz4", None), ("zstd", 1), ("zstd", 9)]
+
+
+def make_frame(rows: int) -> Any:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.random(rows),
+            "count": rng.integers(0, 100, rows, dtype="int32"),
+            "label": pd.Categorical(rng.choice(["a", "b", "c", "d"], rows)),
+            "name": [f"row {i}" for i in range(rows)],
+        }
+    )
+
+
+def serde(frame: Any, codec: str, level: Optional[int], chunk_rows: Any) -> Any:
+    with sy.lib.pandas.ipc.compression(codec, level=level, chunk_rows=chunk_rows):
+        blob = sy.serialize(frame, to_bytes=True)
+    return sy.deserialize(blob=blob, from_bytes=True), len(blob)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("chunk_rows", [None, 10 ** 4])
+@pytest.mark.parametrize("codec,level", CODECS)
+@pytest.mark.parametrize("rows", ROWS)
+def test_pandas_dataframe_serde(
+    rows: int, codec: str, level: Optional[int], chunk_rows: Any, benchmark: Any
+) -> None:
+    frame = make_frame(rows)
+
+    result, size = benchmark.pedantic(
+        serde, args=(frame, codec, level, chunk_rows), rounds=5, iterations=1
+    )
+
+    assert len(result) == rows
+    nbytes = frame.memory_usage(deep=True).sum()
+    benchmark.extra_info["ratio"] = round(size / nbytes, 3)
+    benchmark.extra_info["MB/s"] = round(
+        nbytes / benchmark.stats.stats.mean / 2 ** 20, 1
+    )
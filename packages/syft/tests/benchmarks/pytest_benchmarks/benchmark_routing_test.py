@@ -0,0 +1,66 @@
+"""
+Benchmarks for the per message routing overhead of in memory nodes: a message
+sent to a VM directly, through its Device, and through its Domain and Device
+"""
+
+# stdlib
+from typing import Any
+from typing import Tuple
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.io.address import Address
+from syft.core.node.common.client import Client
+from syft.core.node.common.router import ServiceRouter
+from syft.core.node.common.service.repr_service import ReprMessage
+
+
+def build_chain(hops: int) -> Tuple[Client, Address]:
+    # the client of the first node of the chain and the address of the VM
+    vm = sy.VirtualMachine(name="Bench VM")
+    vm_client = vm.get_client()
+    vm.root_verify_key = vm_client.verify_key
+    if hops == 1:
+        return vm_client, vm.address
+
+    device = sy.Device(name="Bench Device")
+    device_client = device.get_client()
+    device.root_verify_key = device_client.verify_key
+    device_client.register(client=vm_client)
+    vm.root_verify_key = device_client.verify_key
+    if hops == 2:
+        return device_client, vm.address
+
+    domain = sy.Domain(name="Bench Domain")
+    domain_client = domain.get_client()
+    domain.root_verify_key = domain_client.verify_key
+    domain_client.register(client=device_client)
+    vm.root_verify_key = domain_client.verify_key
+    return domain_client, vm.address
+
+
+def send_messages(client: Client, address: Address, count: int) -> None:
+    for _ in range(count):
+        client.send_immediate_msg_without_reply(msg=ReprMessage(address=address))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("hops", [1, 2, 3])
+def test_routing_overhead(hops: int, benchmark: Any) -> None:
+    client, address = build_chain(hops)
+    benchmark.pedantic(
+        send_messages, args=(client, address, 100), rounds=5, iterations=1
+    )
+    benchmark.extra_info["us/message"] = round(
+        benchmark.stats.stats.mean / 100 * 10 ** 6, 1
+    )
+
+
+@pytest.mark.benchmark
+def test_router_lookup(benchmark: Any) -> None:
+    node = sy.VirtualMachine(name="Bench VM")
+    router: ServiceRouter = node.immediate_msg_without_reply_router
+    benchmark(router.__getitem__, ReprMessage)
@@ -0,0 +1,101 @@
+"""
+Benchmarks for the sign / verify paths of SignedMessage
+"""
+
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+from nacl.signing import SigningKey
+import pytest
+
+# syft absolute
+import syft as sy
+from syft import serialize
+from syft.core.common.message import SignedMessage
+from syft.core.common.uid import UID
+from syft.core.node.common.action.get_object_action import GetObjectAction
+from syft.core.node.pki.key_cache import clear_key_caches
+from syft.core.node.pki.key_cache import get_signing_key
+from syft.core.node.pki.key_cache import get_verify_key
+from syft.experimental_flags import flags
+from syft.lib.python.string import String
+
+SIGNING_KEY = SigningKey.generate()
+HEX_KEY = SIGNING_KEY.encode().hex()
+
+
+def build_signed_blobs(count: int) -> List[bytes]:
+    vm = sy.VirtualMachine(name="Bench")
+    msg = GetObjectAction(id_at_location=UID(), address=vm.address, reply_to=vm.address)
+    return [serialize(msg.sign(signing_key=SIGNING_KEY), to_bytes=True)] * count
+
+
+def verify_one_by_one(blobs: List[bytes]) -> None:
+    msgs = [sy.deserialize(blob=blob, from_bytes=True) for blob in blobs]
+    assert all(msg.is_valid for msg in msgs)
+
+
+def verify_batched(blobs: List[bytes]) -> None:
+    msgs = [sy.deserialize(blob=blob, from_bytes=True) for blob in blobs]
+    assert all(SignedMessage.verify_batch(msgs))
+
+
+def parse_verify_key(cached: bool) -> None:
+    key = bytes(SIGNING_KEY.verify_key)
+    if not cached:
+        clear_key_caches()
+    get_verify_key(key)
+
+
+def parse_signing_key(cached: bool) -> None:
+    if not cached:
+        clear_key_caches()
+    get_signing_key(HEX_KEY)
+
+
+def send_get_string(client: Any, data: str) -> None:
+    ptr = String(data).send(client)
+    assert ptr.get() == data
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("cached", [False, True])
+def test_verify_key_parse(cached: bool, benchmark: Any) -> None:
+    benchmark(parse_verify_key, cached)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("cached", [False, True])
+def test_signing_key_parse(cached: bool, benchmark: Any) -> None:
+    benchmark(parse_signing_key, cached)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("burst", [10, 100, 1000])
+def test_verify_one_by_one(burst: int, benchmark: Any) -> None:
+    blobs = build_signed_blobs(burst)
+    benchmark.pedantic(verify_one_by_one, args=(blobs,), rounds=3, iterations=3)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("burst", [10, 100, 1000])
+def test_verify_batched(burst: int, benchmark: Any) -> None:
+    blobs = build_signed_blobs(burst)
+    benchmark.pedantic(verify_batched, args=(blobs,), rounds=3, iterations=3)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("trusted", [False, True])
+def test_loopback_send_get(trusted: bool, benchmark: Any) -> None:
+    vm = sy.VirtualMachine(name="Bench")
+    flags.TRUSTED_LOOPBACK = trusted
+    try:
+        client = vm.get_root_client()
+    finally:
+        flags.TRUSTED_LOOPBACK = False
+
+    benchmark.pedantic(
+        send_get_string, args=(client, "a" * 1024), rounds=10, iterations=10
+    )
@@ -0,0 +1,43 @@
+"""
+Benchmarks for the serde of fitted sklearn models, reporting the throughput of
+a round trip of a random forest and its size compared to pickle
+"""
+
+# stdlib
+import pickle
+from typing import Any
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+
+np = pytest.importorskip("numpy")
+sklearn = pytest.importorskip("sklearn")
+sy.load("numpy")
+sy.load("sklearn")
+
+
+def serde(model: Any) -> Any:
+    return sy.deserialize(blob=sy.serialize(model, to_bytes=True), from_bytes=True)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n_estimators", [10, 100])
+def test_random_forest_serde(n_estimators: int, benchmark: Any) -> None:
+    # third party
+    from sklearn.ensemble import RandomForestClassifier
+
+    X = np.random.RandomState(0).randn(10_000, 20)
+    y = (X[:, 0] + X[:, 1] > 0).astype(np.int64)
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=0)
+    model.fit(X, y)
+
+    size = len(sy.serialize(model, to_bytes=True))
+    benchmark.extra_info["bytes"] = size
+    benchmark.extra_info["bytes / pickle"] = round(size / len(pickle.dumps(model)), 2)
+    result = benchmark.pedantic(serde, args=(model,), rounds=5, iterations=1)
+    benchmark.extra_info["MB/s"] = round(size / benchmark.stats.stats.mean / 2 ** 20, 1)
+
+    assert (result.predict(X) == model.predict(X)).all()
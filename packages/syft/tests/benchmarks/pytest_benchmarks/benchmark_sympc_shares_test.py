@@ -0,0 +1,105 @@
+"""
+Benchmarks for sending the shares of a round of MPC to 3 in-memory VMs, one
+message per share and batched per party
+"""
+
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import List
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+
+sympc = pytest.importorskip("sympc")
+sy.load("sympc")
+
+# the shares sent to each party in a round, e.g. the blocks of a matmul
+SHARES_PER_PARTY = 1000
+SHARE_SHAPE = (16, 16)
+
+
+def count_messages(clients: List[Any]) -> Dict[str, int]:
+    counts = {"messages": 0}
+    for client in clients:
+        send = client.send_immediate_msg_without_reply
+
+        def counting_send(*args: Any, send: Any = send, **kwargs: Any) -> Any:
+            counts["messages"] += 1
+            return send(*args, **kwargs)
+
+        client.send_immediate_msg_without_reply = counting_send  # type: ignore
+    return counts
+
+
+def make_session() -> Any:
+    parties = [sy.VirtualMachine().get_root_client() for _ in range(3)]
+    session = sympc.session.Session(parties=parties)
+    sympc.session.SessionManager.setup_mpc(session)
+    return session
+
+
+def make_shares(session: Any) -> List[Any]:
+    shares = []
+    for _ in range(SHARES_PER_PARTY):
+        share = sympc.tensor.ShareTensor(data=None, config=session.config)
+        share.session_uuid = session.uuid
+        share.tensor = th.randint(-(2 ** 62), 2 ** 62, SHARE_SHAPE)
+        shares.append(share)
+    return shares
+
+
+def send_round(session: Any, shares: List[Any], batched: bool) -> None:
+    def send() -> None:
+        for party in session.parties:
+            for share in shares:
+                share.send(party)
+
+    if batched:
+        with sy.lib.sympc.batch.batched_shares(session):
+            send()
+    else:
+        send()
+
+
+@pytest.mark.benchmark
+@pytest.mark.vendor(lib="sympc")
+@pytest.mark.parametrize("batched", [False, True])
+def test_sympc_share_round(batched: bool, benchmark: Any) -> None:
+    session = make_session()
+    shares = make_shares(session)
+    counts = count_messages(session.parties)
+
+    benchmark.pedantic(send_round, args=(session, shares, batched), rounds=3)
+
+    benchmark.extra_info["messages_per_round"] = counts["messages"] // 3
+    benchmark.extra_info["shares_per_round"] = SHARES_PER_PARTY * len(session.parties)
+
+
+@pytest.mark.benchmark
+@pytest.mark.vendor(lib="sympc")
+@pytest.mark.parametrize("batched", [False, True])
+def test_sympc_mpc_add_reconstruct(batched: bool, benchmark: Any) -> None:
+    session = make_session()
+    secrets = [th.randn(SHARE_SHAPE) for _ in range(2)]
+
+    def add_reconstruct() -> None:
+        def run() -> Any:
+            x, y = (
+                sympc.tensor.MPCTensor(secret=s, shape=SHARE_SHAPE, session=session)
+                for s in secrets
+            )
+            return (x + y).reconstruct()
+
+        if batched:
+            with sy.lib.sympc.batch.batched_shares(session):
+                result = run()
+        else:
+            result = run()
+        assert th.allclose(result, secrets[0] + secrets[1], atol=1e-3)
+
+    benchmark.pedantic(add_reconstruct, rounds=5)
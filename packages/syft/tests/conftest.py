@@ -4,6 +4,7 @@ from multiprocessing import Process
 import socket
 from time import time
 from typing import Any as TypeAny
+from typing import Callable as TypeCallable
 from typing import Dict as TypeDict
 from typing import Generator
 from typing import List as TypeList
@@ -178,3 +179,23 @@ def client(node: sy.VirtualMachine) -> sy.VirtualMachineClient:
 @pytest.fixture(scope="session")
 def root_client(node: sy.VirtualMachine) -> sy.VirtualMachineClient:
     return node.get_root_client()
+
+
+@pytest.fixture
+def count_messages(monkeypatch: _pytest.monkeypatch.MonkeyPatch) -> TypeCallable:
+    """`count_messages(node, GetObjectAction)` returns the list of the messages
+    of that type `node` processes from then on, until the end of the test."""
+
+    def count(node: sy.VirtualMachine, message_type: type) -> TypeList:
+        messages: TypeList = []
+        process = node.process_message
+
+        def counting_process_message(msg: TypeAny, router: TypeAny) -> TypeAny:
+            if isinstance(msg.message, message_type):
+                messages.append(msg.message)
+            return process(msg=msg, router=router)
+
+        monkeypatch.setattr(node, "process_message", counting_process_message)
+        return messages
+
+    return count
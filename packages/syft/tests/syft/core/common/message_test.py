@@ -6,7 +6,10 @@ from nacl.signing import VerifyKey
 import syft as sy
 from syft import ReprMessage
 from syft import serialize
+from syft.core.common.message import SIGNED_MESSAGE_FRAME
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from syft.experimental_flags import flags
+from syft.proto.util.data_message_pb2 import DataMessage
 from syft.util import get_fully_qualified_name
 
 
@@ -110,11 +113,26 @@ def test_serde_matches() -> None:
     sig_msg = sy.deserialize(blob=sig_msg_blob, from_bytes=True)
     assert type(sig_msg) == SignedImmediateSyftMessageWithoutReply
 
-    # reserial should be same as original fixture
-    comp_blob = serialize(sig_msg, to_bytes=True)
-    assert type(comp_blob) == bytes
+    # reserial as a protobuf should be same as original fixture
+    comp_blob = DataMessage(
+        obj_type=get_fully_qualified_name(obj=sig_msg),
+        content=sig_msg._object2proto().SerializeToString(),
+    ).SerializeToString()
     assert comp_blob == sig_msg_blob
 
+    # reserial writes the DataMessage older peers read
+    assert serialize(sig_msg, to_bytes=True) == sig_msg_blob
+
+    # or the signed message frame which round trips
+    flags.SIGNED_MESSAGE_FRAMES = True
+    try:
+        frame_blob = serialize(sig_msg, to_bytes=True)
+    finally:
+        flags.SIGNED_MESSAGE_FRAMES = False
+    assert type(frame_blob) == bytes
+    assert frame_blob.startswith(SIGNED_MESSAGE_FRAME)
+    assert sy.deserialize(blob=frame_blob, from_bytes=True) == sig_msg
+
     # now try sub message
     msg = sig_msg.message
     assert type(msg) == ReprMessage
@@ -231,3 +249,69 @@ def test_get_message() -> None:
     obj = get_repr_message()
 
     assert nonveri_msg == obj
+
+
+def test_verify_batch() -> None:
+    """Tests that a burst of SignedMessages can be verified at once"""
+
+    signing_key = get_signing_key()
+    sig_msgs = [get_repr_message().sign(signing_key=signing_key) for _ in range(8)]
+    sig_msgs[3].signature = b"a" * 64
+
+    results = SignedImmediateSyftMessageWithoutReply.verify_batch(sig_msgs)
+
+    assert results == [True, True, True, False, True, True, True, True]
+    assert [msg.is_valid for msg in sig_msgs] == results
+
+
+def test_sign_trusted() -> None:
+    """Tests that a trusted SignedMessage skips signing and verification"""
+
+    msg = get_repr_message()
+    sig_msg = msg.sign(signing_key=get_signing_key(), trusted=True)
+
+    assert sig_msg.trusted is True
+    assert sig_msg.signature == b""
+    assert sig_msg.is_valid is True
+    assert sig_msg.message is msg
+
+    # once it leaves the process the message is no longer trusted
+    blob = serialize(sig_msg, to_bytes=True)
+    remote_msg = sy.deserialize(blob=blob, from_bytes=True)
+
+    assert remote_msg.trusted is False
+    assert remote_msg.is_valid is False
+    assert remote_msg.message == msg
+
+
+def test_verify_key_cache() -> None:
+    """Tests that deserialized SignedMessages share the parsed VerifyKey"""
+
+    blob = get_signed_message_bytes()
+    sig_msg_1 = sy.deserialize(blob=blob, from_bytes=True)
+    sig_msg_2 = sy.deserialize(blob=blob, from_bytes=True)
+
+    assert sig_msg_1.verify_key is sig_msg_2.verify_key
+    assert sig_msg_1.verify_key == get_verify_key()
+
+
+def test_signed_message_frame() -> None:
+    """Tests that a framed SignedMessage keeps its payload and signature"""
+    msg = get_repr_message()
+    sig_msg = msg.sign(signing_key=get_signing_key())
+
+    flags.SIGNED_MESSAGE_FRAMES = True
+    try:
+        blob = serialize(sig_msg, to_bytes=True)
+    finally:
+        flags.SIGNED_MESSAGE_FRAMES = False
+    assert blob.startswith(SIGNED_MESSAGE_FRAME)
+    sig_msg_comp = sy.deserialize(blob=blob, from_bytes=True)
+
+    assert type(sig_msg_comp) == SignedImmediateSyftMessageWithoutReply
+    assert sig_msg_comp.serialized_message == sig_msg.serialized_message
+    assert sig_msg_comp.message == msg
+    assert sig_msg_comp.is_valid
+
+    # the frame is also accepted as a memoryview, e.g. straight off a socket
+    assert sy.deserialize(blob=memoryview(blob), from_bytes=True).is_valid
@@ -1,10 +1,12 @@
 # syft absolute
+import syft as sy
 from syft.core.common.message import SignedEventualSyftMessageWithoutReply
 from syft.core.common.message import SignedImmediateSyftMessageWithReply
 from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
 from syft.core.io.virtual import VirtualClientConnection
 from syft.core.io.virtual import VirtualServerConnection
 from syft.core.io.virtual import create_virtual_connection
+from syft.experimental_flags import flags
 
 # syft relative
 from .utils_test import MockNode
@@ -118,3 +120,22 @@ def test_virtual_client_connection_send_eventual_msg_without_reply() -> None:
     msg = construct_dummy_message(SignedEventualSyftMessageWithoutReply)
 
     assert client.send_eventual_msg_without_reply(msg=msg) is None
+
+
+def test_create_trusted_virtual_connection() -> None:
+    """
+    Test that messages sent over a trusted virtual connection skip sign/verify.
+    """
+    node = sy.VirtualMachine(name="Trusted")
+
+    flags.TRUSTED_LOOPBACK = True
+    try:
+        client = node.get_root_client()
+    finally:
+        flags.TRUSTED_LOOPBACK = False
+
+    assert client.routes[0].trusted is True
+    assert node.get_root_client().routes[0].trusted is False
+
+    ptr = sy.lib.python.List([1, 2, 3]).send(client)
+    assert ptr.get() == [1, 2, 3]
@@ -8,6 +8,7 @@ from syft.core.common.uid import UID
 from syft.core.io.address import Address
 from syft.core.io.location import SpecificLocation
 from syft.core.node.common.action.save_object_action import SaveObjectAction
+from syft.core.node.common.action.save_objects_action import SaveObjectsAction
 from syft.core.store.storeable_object import StorableObject
 
 
@@ -27,3 +28,29 @@ def test_save_object_action_serde() -> None:
     # Tensors do not automatically get IDs anymore
     # assert msg2.obj.id == msg.obj.id
     assert msg2.address == msg.address
+
+
+def test_save_objects_action_serde() -> None:
+    shared = th.tensor([1, 2, 3, 4])
+    addr = Address(network=SpecificLocation(), device=SpecificLocation())
+
+    storables = [StorableObject(id=UID(), data=t) for t in (shared, shared[:2])]
+    msg = SaveObjectsAction(objs=storables, address=addr)
+
+    msg2 = sy.deserialize(blob=serialize(msg, to_bytes=True), from_bytes=True)
+
+    assert [obj.id for obj in msg2.objs] == [obj.id for obj in storables]
+    assert (msg2.objs[0].data == shared).all()
+    assert (msg2.objs[1].data == shared[:2]).all()
+    assert msg2.address == msg.address
+
+
+def test_save_objects_action_stores_each_object(
+    node: sy.VirtualMachine, root_client: sy.VirtualMachineClient
+) -> None:
+    storables = [StorableObject(id=UID(), data=th.tensor([i])) for i in range(3)]
+    msg = SaveObjectsAction(objs=storables, address=root_client.address)
+    root_client.send_immediate_msg_without_reply(msg=msg)
+
+    for i, storable in enumerate(storables):
+        assert (node.store[storable.id].data == th.tensor([i])).all()
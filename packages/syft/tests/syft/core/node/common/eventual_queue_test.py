@@ -0,0 +1,93 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.message import SignedMessage
+from syft.core.node.common.action.garbage_collect_object_action import (
+    GarbageCollectObjectAction,
+)
+from syft.core.node.common.eventual_queue import EVENTUAL_WITHOUT_REPLY
+from syft.core.node.common.eventual_queue import EventualMessageQueue
+from syft.core.node.common.eventual_queue import IMMEDIATE_WITH_REPLY
+
+
+def test_eventual_messages_wait_for_immediate() -> None:
+    node = sy.VirtualMachine(name="eventual")
+    client = node.get_root_client()
+    node.eventual_queue = EventualMessageQueue(node, max_delay=10)
+
+    x = th.tensor([1, 2, 3]).send(client)
+    id_at_location = x.id_at_location
+    msg = GarbageCollectObjectAction(
+        id_at_location=id_at_location, address=client.address
+    )
+
+    # while an immediate message is in flight the eventual one stays queued
+    with node.message_stats.track(IMMEDIATE_WITH_REPLY):
+        client.send_eventual_msg_without_reply(msg=msg)
+        assert not node.eventual_queue.flush(timeout=0.2)
+        assert len(node.eventual_queue) == 1
+        assert id_at_location in node.store
+
+    assert node.eventual_queue.flush(timeout=5)
+    assert id_at_location not in node.store
+
+    metrics = node.message_stats.metrics()
+    assert metrics[EVENTUAL_WITHOUT_REPLY]["count"] == 1
+    assert metrics[EVENTUAL_WITHOUT_REPLY]["max_latency"] >= 0.2
+    assert node.eventual_queue.metrics()["depth"] == 0
+    node.eventual_queue.close()
+
+
+def test_full_queue_runs_inline() -> None:
+    node = sy.VirtualMachine(name="eventual")
+    client = node.get_root_client()
+    node.eventual_queue = EventualMessageQueue(node, maxsize=0)
+
+    x = th.tensor([1, 2, 3]).send(client)
+    id_at_location = x.id_at_location
+    client.send_eventual_msg_without_reply(
+        msg=GarbageCollectObjectAction(
+            id_at_location=id_at_location, address=client.address
+        )
+    )
+    assert id_at_location not in node.store
+    node.eventual_queue.close()
+
+
+def test_queued_messages_are_verified_together(monkeypatch: Any) -> None:
+    batches: List[int] = []
+    verify_batch = SignedMessage.verify_batch
+
+    def record(messages: List[SignedMessage], **kwargs: Any) -> List[bool]:
+        batches.append(len(messages))
+        return verify_batch(messages, **kwargs)
+
+    monkeypatch.setattr(SignedMessage, "verify_batch", staticmethod(record))
+
+    node = sy.VirtualMachine(name="eventual")
+    client = node.get_root_client()
+    node.eventual_queue = EventualMessageQueue(node, max_delay=10)
+
+    ptrs = [th.tensor([i]).send(client) for i in range(4)]
+    msgs = [
+        GarbageCollectObjectAction(
+            id_at_location=ptr.id_at_location, address=client.address
+        ).sign(signing_key=client.signing_key)
+        for ptr in ptrs
+    ]
+
+    with node.message_stats.track(IMMEDIATE_WITH_REPLY):
+        for msg in msgs:
+            node.recv_eventual_msg_without_reply(msg=msg)
+
+    assert node.eventual_queue.flush(timeout=5)
+    assert sum(batches) == len(msgs) and max(batches) > 1
+    assert all(msg.is_valid for msg in msgs)
+    assert all(ptr.id_at_location not in node.store for ptr in ptrs)
+    node.eventual_queue.close()
@@ -0,0 +1,84 @@
+# stdlib
+import threading
+import time
+from typing import Any
+from typing import List
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.executor import NodeExecutor
+from syft.core.node.common.executor import ServicePool
+from syft.core.node.common.executor import object_keys
+
+
+class SlowService:
+    def __init__(self) -> None:
+        self.log: List[Any] = []
+        self.lock = threading.Lock()
+
+    def process(self, node: Any, msg: Any, verify_key: Any) -> Any:
+        with self.lock:
+            self.log.append(("start", msg.name))
+        time.sleep(msg.duration)
+        with self.lock:
+            self.log.append(("end", msg.name))
+        return msg.name
+
+
+class FakeMessage:
+    def __init__(self, name: str, duration: float, *uids: UID) -> None:
+        self.name = name
+        self.duration = duration
+        self.ids_at_location = list(uids)
+
+
+def test_object_keys() -> None:
+    a, b = UID(), UID()
+    assert object_keys(FakeMessage("x", 0, a, b)) == {a, b}
+    assert object_keys(FakeMessage("x", 0)) == set()
+
+
+def test_ordering_per_object() -> None:
+    service = SlowService()
+    executor = NodeExecutor(pools={SlowService: ServicePool(max_workers=4)})
+    a, b = UID(), UID()
+
+    first = executor.submit(service, None, FakeMessage("a1", 0.2, a), None)
+    second = executor.submit(service, None, FakeMessage("a2", 0, a), None)
+    other = executor.submit(service, None, FakeMessage("b", 0, b), None)
+    assert executor.metrics()["SlowService"]["queued"] >= 1
+
+    assert second.result(timeout=5) == "a2"
+    assert first.result() == "a1" and other.result() == "b"
+
+    # a2 waited for a1, b ran in parallel with a1
+    log = service.log
+    assert log.index(("end", "a1")) < log.index(("start", "a2"))
+    assert log.index(("end", "b")) < log.index(("end", "a1"))
+
+    metrics = executor.metrics()["SlowService"]
+    assert metrics["completed"] == 3
+    assert metrics["queued"] == 0 and metrics["busy"] == 0
+    executor.shutdown()
+
+
+def test_node_executor() -> None:
+    node = sy.VirtualMachine(name="executor")
+    node.executor = NodeExecutor(max_workers=2)
+    client = node.get_root_client()
+
+    x = th.tensor([1, 2, 3]).send(client)
+    y = x + x
+    z = y * 2
+
+    # the GetObjectAction runs after the actions producing z
+    assert (z.get() == th.tensor([4, 8, 12])).all()
+    assert (
+        node.executor.metrics()["ImmediateObjectActionServiceWithoutReply"]["completed"]
+        >= 2
+    )
+    node.executor.shutdown()
@@ -0,0 +1,43 @@
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.router import ServiceRouter
+from syft.core.node.common.service.repr_service import ReprMessage
+from syft.core.node.common.service.repr_service import ReprService
+
+
+class Base:
+    pass
+
+
+class Known(Base):
+    pass
+
+
+def test_service_router() -> None:
+    router = ServiceRouter()
+    router.register(Base, "service")
+    assert router[Base] == router[Known] == "service"
+
+    # message types defined after the registration resolve through their bases
+    class Late(Known):
+        pass
+
+    assert Late not in router
+    assert router[Late] == "service"
+    assert Late in router
+
+    with pytest.raises(KeyError):
+        router[int]
+
+
+def test_node_routes_late_subclasses() -> None:
+    node = sy.VirtualMachine(name="router")
+
+    class LateReprMessage(ReprMessage):
+        pass
+
+    service = node.immediate_msg_without_reply_router[LateReprMessage]
+    assert isinstance(service, ReprService)
@@ -209,3 +209,21 @@ def test_send_message_from_network_client_to_vm() -> None:
     bob_network_client.send_immediate_msg_without_reply(
         msg=sy.ReprMessage(address=bob_vm.address)
     )
+
+
+def test_dispatch(node: sy.VirtualMachine) -> None:
+    msg = sy.ReprMessage(address=node.address)
+
+    # the verify key is trusted as is, so the service checks it
+    with pytest.raises(AuthorizationException):
+        node.dispatch(msg=msg, verify_key=get_verify_key())
+
+    assert node.dispatch(msg=msg, verify_key=node.root_verify_key) is None
+
+    # only messages addressed to the node are dispatched
+    other = sy.VirtualMachine(name="other")
+    with pytest.raises(ValueError):
+        node.dispatch(
+            msg=sy.ReprMessage(address=other.address),
+            verify_key=node.root_verify_key,
+        )
@@ -0,0 +1,68 @@
+# stdlib
+from typing import Callable
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.action.get_object_action import GetObjectAction
+from syft.core.pointer.prefetch import PrefetchIterator
+
+
+@pytest.mark.parametrize("read_ahead", [True, False])
+def test_prefetch_list(
+    read_ahead: bool,
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    count_messages: Callable,
+) -> None:
+    data = list(range(10))
+    ptr = sy.lib.python.List(data).send(root_client)
+    gets = count_messages(node, GetObjectAction)
+
+    assert list(ptr.iter(prefetch=4, read_ahead=read_ahead)) == data
+    # 3 chunks of 4, 4 and 2 items
+    assert len(gets) == 3
+
+
+def test_prefetch_tensor_rows(root_client: sy.VirtualMachineClient) -> None:
+    data = th.arange(12).reshape(6, 2)
+    ptr = data.send(root_client)
+
+    rows = list(ptr.iter(prefetch=4))
+    assert len(rows) == 6
+    assert all((row == expected).all() for row, expected in zip(rows, data))
+
+
+def test_prefetch_max_bytes(root_client: sy.VirtualMachineClient) -> None:
+    data = th.zeros(8, 256)
+    ptr = data.send(root_client)
+
+    iterator = ptr.iter(prefetch=8, max_bytes=2048, read_ahead=False)
+    assert isinstance(iterator, PrefetchIterator)
+    assert len(list(iterator)) == 8
+    # a row is 1 KB, so the chunks after the first hold 2 rows
+    assert iterator._chunk_size() == 2
+
+
+def test_prefetch_permissions(
+    root_client: sy.VirtualMachineClient, client: sy.VirtualMachineClient
+) -> None:
+    ptr = sy.lib.python.List([1, 2, 3]).send(root_client, pointable=True)
+    guest_ptr = client.store[ptr.id_at_location.value.hex]
+
+    # like ptr[i].get(), the guest can't read the items
+    with pytest.raises(Exception):
+        list(guest_ptr.iter(prefetch=2, read_ahead=False))
+
+
+def test_prefetch_close(root_client: sy.VirtualMachineClient) -> None:
+    ptr = sy.lib.python.List(list(range(100))).send(root_client)
+
+    iterator = ptr.iter(prefetch=2, read_ahead=True)
+    assert next(iterator) == 0
+    # leaving the loop early stops the thread reading ahead
+    iterator.close()
+    assert not iterator._thread.is_alive()
@@ -1,7 +1,9 @@
 # stdlib
 import os
+from typing import Any
 
 # third party
+import numpy as np
 import pytest
 import torch as th
 from torch.utils.data import Dataset
@@ -10,6 +12,8 @@ from torch.utils.data import Dataset
 import syft as sy
 from syft.core.remote_dataloader import RemoteDataLoader
 from syft.core.remote_dataloader import RemoteDataset
+from syft.core.remote_dataloader.remote_dataloader import BackgroundIterator
+from syft.core.remote_dataloader.remote_dataloader import DATA_TYPE_NUMPY_MEMMAP
 
 
 class ExampleDataset(Dataset):
@@ -58,3 +62,82 @@ def test_remote_dataloader(root_client: sy.VirtualMachineClient) -> None:
     for tp in rdl_ptr:
         assert isinstance(tp.get(), th.Tensor)
     os.unlink(filename)
+
+
+def test_remote_dataloader_options() -> None:
+    rds = RemoteDataset(path="ds.pt", data_type="torch_tensor")
+    rdl = RemoteDataLoader(
+        remote_dataset=rds,
+        batch_size=3,
+        shuffle=True,
+        sampler=[5, 1, 3],
+        num_workers=2,
+        prefetch_factor=4,
+        drop_last=True,
+    )
+    rdl2 = sy.deserialize(sy.serialize(rdl))
+
+    for attr in [
+        "batch_size",
+        "shuffle",
+        "sampler",
+        "num_workers",
+        "prefetch_factor",
+        "drop_last",
+    ]:
+        assert getattr(rdl2, attr) == getattr(rdl, attr)
+    assert rdl2.remote_dataset.path == "ds.pt"
+
+
+@pytest.mark.slow
+def test_remote_dataloader_memmap(
+    root_client: sy.VirtualMachineClient, tmp_path: Any
+) -> None:
+    features = np.arange(40, dtype=np.float32).reshape(10, 4)
+    labels = np.arange(10)
+    np.save(tmp_path / "features.npy", features)
+    np.save(tmp_path / "labels.npy", labels)
+    path = os.pathsep.join(
+        [str(tmp_path / "features.npy"), str(tmp_path / "labels.npy")]
+    )
+
+    rds = RemoteDataset(path=path, data_type=DATA_TYPE_NUMPY_MEMMAP)
+    rdl = RemoteDataLoader(
+        remote_dataset=rds,
+        batch_size=4,
+        shuffle=True,
+        sampler=list(range(9)),
+        drop_last=True,
+    )
+    rdl_ptr = rdl.send(root_client)
+    rdl_ptr.load_dataset()
+    rdl_ptr.create_dataloader()
+
+    # 9 samples in batches of 4, the last one dropped
+    assert rdl_ptr.len().get() == 2
+    seen = []
+    for batch_ptr in rdl_ptr:
+        x, y = batch_ptr.get()
+        assert x.shape == (4, 4)
+        assert (x[:, 0] == y * 4).all()
+        seen.extend(y.tolist())
+    assert len(set(seen)) == 8 and 9 not in seen
+
+
+def test_background_iterator_close() -> None:
+    # an epoch abandoned with batches still to build
+    it = BackgroundIterator(iter(range(100)), prefetch=2)
+    assert next(it) == 0
+    it.close()
+    assert not it._thread.is_alive()
+    assert it._queue.empty()
+    with pytest.raises(StopIteration):
+        next(it)
+
+    rdl = RemoteDataLoader(remote_dataset=RemoteDataset(path="ds.pt"), batch_size=4)
+    rdl.dataloader = list(range(100))
+    first = iter(rdl)
+    assert next(first) == 0
+    second = iter(rdl)
+    assert not first._thread.is_alive()
+    assert list(second) == list(range(100))
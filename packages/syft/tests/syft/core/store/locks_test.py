@@ -0,0 +1,147 @@
+# stdlib
+import threading
+import time
+from typing import List
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.common import UID
+from syft.core.node.common.action.run_class_method_action import mutates_self
+from syft.core.store.locks import LockTable
+from syft.core.store.store_memory import MemoryStore
+
+
+def test_readers_share_writers_exclude() -> None:
+    table = LockTable()
+    key = UID()
+    log: List[str] = []
+
+    def reader(name: str) -> None:
+        with table.hold(read=[key]):
+            log.append(f"{name} start")
+            time.sleep(0.1)
+            log.append(f"{name} end")
+
+    def writer() -> None:
+        with table.hold(write=[key]):
+            log.append("w start")
+            log.append("w end")
+
+    readers = [threading.Thread(target=reader, args=(n,)) for n in ("r1", "r2")]
+    for thread in readers:
+        thread.start()
+    time.sleep(0.02)
+    w = threading.Thread(target=writer)
+    w.start()
+    for thread in readers + [w]:
+        thread.join(timeout=5)
+
+    # both readers ran together, the writer waited for them
+    assert log[:2] == ["r1 start", "r2 start"] or log[:2] == ["r2 start", "r1 start"]
+    assert log[-2:] == ["w start", "w end"]
+    # locks are dropped once released
+    assert len(table) == 0
+
+
+def test_reentrant_and_ordered() -> None:
+    table = LockTable()
+    a, b = UID(), UID()
+
+    with table.hold(write=[a], read=[b]):
+        # keys the thread already holds aren't locked again
+        with table.hold(read=[a, b]):
+            assert len(table) == 2
+
+    done = []
+
+    def lock_both(read: List[UID], write: List[UID]) -> None:
+        for _ in range(100):
+            with table.hold(read=read, write=write):
+                pass
+        done.append(True)
+
+    # opposite orders can't deadlock, the locks are taken sorted
+    threads = [
+        threading.Thread(target=lock_both, args=([], [a, b])),
+        threading.Thread(target=lock_both, args=([], [b, a])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert len(done) == 2
+
+
+def test_read_to_write_upgrade() -> None:
+    table = LockTable()
+    a = UID()
+
+    with table.hold(read=[a]):
+        # the only reader can write
+        with table.hold(write=[a]):
+            acquired = threading.Event()
+
+            def read() -> None:
+                with table.hold(read=[a]):
+                    acquired.set()
+
+            thread = threading.Thread(target=read)
+            thread.start()
+            assert not acquired.wait(timeout=0.1)
+        thread.join()
+        assert acquired.is_set()
+
+        # but not while another thread reads too
+        reading = threading.Event()
+        done = threading.Event()
+
+        def keep_reading() -> None:
+            with table.hold(read=[a]):
+                reading.set()
+                done.wait()
+
+        thread = threading.Thread(target=keep_reading)
+        thread.start()
+        reading.wait()
+        with pytest.raises(RuntimeError):
+            with table.hold(write=[a]):
+                pass
+        done.set()
+        thread.join()
+        # the read lock is still held, and only once
+        assert len(table) == 1
+
+    # a write lock covers reads and writes of the same thread
+    with table.hold(write=[a]):
+        with table.hold(read=[a]):
+            with table.hold(write=[a]):
+                pass
+    assert len(table) == 0
+
+
+def test_store_lock() -> None:
+    store = MemoryStore()
+    key = UID()
+    with store.lock(write=[key]):
+        acquired = threading.Event()
+
+        def read() -> None:
+            with store.lock(read=[key]):
+                acquired.set()
+
+        thread = threading.Thread(target=read)
+        thread.start()
+        assert not acquired.wait(timeout=0.1)
+    thread.join(timeout=5)
+    assert acquired.is_set()
+
+
+def test_mutates_self() -> None:
+    assert mutates_self("torch.Tensor.add_")
+    assert mutates_self("torch.Tensor.__iadd__")
+    assert mutates_self("torch.Tensor.__setitem__")
+    assert not mutates_self("torch.Tensor.add")
+    assert not mutates_self("torch.Tensor.__add__")
+    assert mutates_self("syft.lib.python.List.append")
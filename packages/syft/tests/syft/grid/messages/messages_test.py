@@ -1,3 +1,6 @@
+# stdlib
+import json
+
 # third party
 import pytest
 
@@ -13,6 +16,9 @@ from syft.grid.messages import request_messages
 from syft.grid.messages import role_messages
 from syft.grid.messages import setup_messages
 from syft.grid.messages import tensor_messages
+from syft.grid.messages.content_encoding import ContentEncoding
+from syft.grid.messages.content_encoding import content_encodings
+from syft.grid.messages.content_encoding import set_content_encoding
 
 messages = {
     # association_messages
@@ -521,3 +527,37 @@ def message_integrity_test(msg: AbstractMessage, target: Address) -> None:
     assert msg.address == target
     assert msg.content == msg2.content
     assert msg == msg2
+
+
+@pytest.mark.parametrize("encoding", list(ContentEncoding))
+def test_content_encoding(encoding: ContentEncoding) -> None:
+    target = Address(name="Alice")
+    content = {"tensor": b"\x00\xff", "shape": [2], "scale": 0.5, "key": None}
+    msg_type = tensor_messages.CreateTensorMessage
+
+    set_content_encoding(msg_type, encoding)
+    try:
+        if encoding == ContentEncoding.JSON:
+            content["tensor"] = content["tensor"].hex()
+        msg = msg_type(content=content, address=target, reply_to=target.address)
+        proto = msg._object2proto()
+        message_integrity_test(msg, target)
+    finally:
+        del content_encodings[msg_type]
+
+    if encoding == ContentEncoding.JSON:
+        assert json.loads(proto.content) == content
+    else:
+        assert b"\x00\xff" in proto.content
+
+
+def test_json_content_from_older_peers() -> None:
+    target = Address(name="Alice")
+    msg = tensor_messages.GetTensorsMessage(
+        content={}, address=target, reply_to=target.address
+    )
+    proto = msg._object2proto()
+    proto.content = json.dumps({"tensor_id": "1234"}).encode("utf-8")
+
+    msg2 = tensor_messages.GetTensorsMessage._proto2object(proto)
+    assert msg2.content == {"tensor_id": "1234"}
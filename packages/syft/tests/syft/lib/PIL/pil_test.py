@@ -27,9 +27,92 @@ def test_remote_create(root_client: sy.VirtualMachineClient) -> None:
 
     im = PIL.Image.open(LOGO_URL)
     im_array = np.array(im)
-    im_tensor = torch.Tensor(im_array).permute(2, 0, 1)
+    # to_pil_image only leaves uint8 values as they are, floats are scaled by 255
+    im_tensor = torch.tensor(im_array).permute(2, 0, 1)
     remote_tensor = im_tensor.send(root_client)
     remote_im = remote_torchvision.transforms.functional.to_pil_image(remote_tensor)
     received_im = remote_im.get()
 
     assert PIL.ImageChops.difference(im, received_im).getbbox() is None
+
+
+@pytest.mark.vendor(lib="PIL")
+@pytest.mark.parametrize("mode", ["L", "RGB", "RGBA", "I;16", "F", "P"])
+def test_raw_serde_keeps_mode(mode: str) -> None:
+    # syft absolute
+    from syft.lib.PIL.image import object2proto
+    from syft.lib.PIL.image import proto2object
+
+    im = PIL.Image.open(LOGO_URL).convert("RGB").convert(mode)
+    proto = object2proto(im)
+    assert len(proto.data) == len(im.tobytes())
+
+    received_im = proto2object(proto)
+    assert received_im.mode == mode
+    assert received_im.size == im.size
+    assert received_im.tobytes() == im.tobytes()
+    if mode == "P":
+        assert received_im.getpalette() == im.getpalette()
+
+
+@pytest.mark.vendor(lib="PIL")
+@pytest.mark.parametrize("format, params", [("PNG", {}), ("WEBP", {"lossless": True})])
+def test_lossless_encoding(
+    format: str, params: dict, root_client: sy.VirtualMachineClient
+) -> None:
+    im = PIL.Image.open(LOGO_URL).convert("RGB")
+    with sy.lib.PIL.image.encoding(format, **params):
+        remote_im = im.send(root_client)
+    received_im = remote_im.get()
+
+    assert received_im.mode == im.mode
+    assert PIL.ImageChops.difference(im, received_im).getbbox() is None
+
+
+@pytest.mark.vendor(lib="PIL")
+def test_lossy_encoding_batch(root_client: sy.VirtualMachineClient) -> None:
+    # syft absolute
+    from syft.lib.PIL.image import object2proto
+
+    ims = [PIL.Image.open(LOGO_URL).convert("RGB").rotate(i * 90) for i in range(4)]
+    with sy.lib.PIL.image.encoding("JPEG", quality=75, batch=ims) as encoding:
+        assert len(encoding._encoded) == len(ims)
+        assert len(object2proto(ims[0]).data) < len(ims[0].tobytes())
+        remote_ims = sy.lib.python.List(ims).send(root_client)
+    received_ims = remote_ims.get()
+
+    assert len(received_ims) == len(ims)
+    for im, received_im in zip(ims, received_ims):
+        assert received_im.mode == "RGB"
+        assert received_im.size == im.size
+
+
+@pytest.mark.vendor(lib="PIL")
+def test_decoding_is_restricted(monkeypatch: pytest.MonkeyPatch) -> None:
+    # syft absolute
+    from syft.lib.PIL.image import object2proto
+    from syft.lib.PIL.image import proto2object
+
+    im = PIL.Image.open(LOGO_URL).convert("RGB")
+    with sy.lib.PIL.image.encoding("PNG"):
+        proto = object2proto(im)
+
+    # only the formats images are sent in are decoded
+    with pytest.raises(ValueError):
+        sy.lib.PIL.image.Encoding("BMP")
+    proto.format = "BMP"
+    with pytest.raises(ValueError):
+        proto2object(proto)
+
+    # the data must be in the format it claims to be
+    proto.format = "JPEG"
+    with pytest.raises(PIL.UnidentifiedImageError):
+        proto2object(proto)
+
+    # and no larger than PIL allows, before anything is decoded
+    proto.format = "PNG"
+    monkeypatch.setattr(PIL.Image, "MAX_IMAGE_PIXELS", im.width * im.height - 1)
+    with pytest.raises(ValueError):
+        proto2object(proto)
+    with pytest.raises(ValueError):
+        proto2object(object2proto(im))
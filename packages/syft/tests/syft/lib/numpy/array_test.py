@@ -57,6 +57,35 @@ def test_remote_numpy_array(
         assert test_array.dtype == received_array.dtype
 
 
+@pytest.mark.vendor(lib="numpy")
+@pytest.mark.parametrize("arrow_backend", [False, True])
+def test_serde_layouts(arrow_backend: bool) -> None:
+    flags.APACHE_ARROW_TENSOR_SERDE = arrow_backend
+
+    x = np.arange(24, dtype=np.uint32).reshape(4, 6)
+    test_arrays = [
+        x[:, ::2],  # non contiguous
+        x.T,  # fortran order
+        x.astype(">u4"),  # big endian
+        np.array([0, np.iinfo(np.uint64).max], dtype=np.uint64),
+    ]
+    if not arrow_backend:
+        test_arrays += [
+            np.array([], dtype=np.float32),
+            np.array(np.iinfo(np.int64).min, dtype=np.int64),  # 0-d
+        ]
+
+    for test_array in test_arrays:
+        received_array = sy.deserialize(
+            blob=sy.serialize(test_array, to_bytes=True), from_bytes=True
+        )
+
+        assert received_array.shape == test_array.shape
+        assert received_array.dtype.name == test_array.dtype.name
+        assert (received_array == test_array).all()
+        assert received_array.flags.writeable
+
+
 # Attributes test
 @pytest.mark.vendor(lib="numpy")
 @pytest.mark.parametrize("arrow_backend", [False, True])
@@ -107,3 +107,44 @@ def test_pandas_json_normalize(root_client: sy.VirtualMachineClient) -> None:
     res_df.iloc[0][0] = list(res_df.iloc[0][0])
 
     assert df.equals(res_df)
+
+
+@pytest.mark.parametrize(
+    "codec,level,chunk_rows",
+    [("none", None, None), ("lz4", None, None), ("zstd", 9, 3), ("none", None, 1)],
+)
+@pytest.mark.vendor(lib="pandas")
+def test_dataframe_compression(
+    codec: str, level: Any, chunk_rows: Any, root_client: sy.VirtualMachineClient
+) -> None:
+    df = pd.DataFrame(
+        {
+            "num": np.arange(10, dtype="float32"),
+            "cat": pd.Categorical(list("abcabcabca")),
+            "text": [None] * 5 + list("vwxyz"),
+        },
+        index=pd.RangeIndex(5, 15),
+    )
+
+    with sy.lib.pandas.ipc.compression(codec, level=level, chunk_rows=chunk_rows):
+        df_ptr = df.send(root_client)
+        series_ptr = df["text"].send(root_client)
+
+    pd.testing.assert_frame_equal(df_ptr.get(), df)
+    pd.testing.assert_series_equal(series_ptr.get(), df["text"])
+
+
+@pytest.mark.vendor(lib="pandas")
+def test_empty_dataframe_keeps_categories() -> None:
+    df = pd.DataFrame({"cat": pd.Categorical(["a", "b"])}).iloc[:0]
+
+    result = sy.deserialize(sy.serialize(df))
+
+    assert list(result["cat"].cat.categories) == ["a", "b"]
+
+
+@pytest.mark.vendor(lib="pandas")
+def test_dataframe_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        with sy.lib.pandas.ipc.compression("brotli"):
+            pass
@@ -38,3 +38,83 @@ def test_logistic_model_serde(
             assert dict_1[key].all() == dict_2[key].all()
         else:
             assert dict_1[key] == dict_2[key]
+
+
+@pytest.mark.vendor(lib="sklearn")
+def test_random_forest_serde(root_client: sy.VirtualMachineClient) -> None:
+    # third party
+    from sklearn.ensemble import RandomForestClassifier
+
+    X = np.random.RandomState(0).randn(200, 4)
+    y = (X[:, 0] + X[:, 1] > 0).astype(np.int64)
+    clf = RandomForestClassifier(
+        n_estimators=10, random_state=np.random.RandomState(0)
+    ).fit(X, y)
+
+    clf_2 = clf.send(root_client).get()
+
+    assert type(clf_2) is RandomForestClassifier
+    assert clf_2.get_params()["n_estimators"] == 10
+    assert len(clf_2.estimators_) == len(clf.estimators_)
+    assert np.array_equal(clf_2.classes_, clf.classes_)
+    assert np.array_equal(clf_2.predict_proba(X), clf.predict_proba(X))
+
+
+@pytest.mark.vendor(lib="sklearn")
+def test_estimator_serde_stores_raw_arrays() -> None:
+    # third party
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    # syft absolute
+    from syft.lib.numpy.model import object2proto
+    from syft.lib.numpy.model import proto2object
+
+    X = np.arange(24, dtype=np.float64).reshape(6, 4)
+    pipeline = make_pipeline(StandardScaler()).fit(X)
+
+    proto = object2proto(pipeline)
+    # the fitted arrays as raw buffers
+    scaler = pipeline[0]
+    buffers = [array.data for array in proto.arrays]
+    for fitted in (scaler.mean_, scaler.var_, scaler.scale_):
+        assert fitted.tobytes() in buffers
+
+    pipeline_2 = proto2object(proto)
+    assert np.array_equal(pipeline_2.transform(X), pipeline.transform(X))
+
+
+@pytest.mark.vendor(lib="sklearn")
+def test_estimator_serde_rejects_foreign_objects() -> None:
+    # third party
+    from sklearn.preprocessing import FunctionTransformer
+
+    # syft absolute
+    from syft.lib.numpy.model import object2proto
+
+    with pytest.raises(TypeError):
+        object2proto(FunctionTransformer(func=lambda x: x))
+
+
+@pytest.mark.vendor(lib="sklearn")
+@pytest.mark.parametrize(
+    "forged",
+    [
+        # the constructor of a class outside of the allowlist
+        {"t": "object", "cls": "scipy.io.netcdf_file", "args": ["x", "w"]},
+        {"t": "object", "new": "scipy.io._netcdf.netcdf_file"},
+        # the only function which used to create objects
+        {"t": "object", "func": "pandas.core.indexes.base._new_Index", "args": []},
+    ],
+)
+def test_estimator_serde_rejects_forged_objects(forged: dict) -> None:
+    # stdlib
+    import json
+
+    # syft absolute
+    from syft.lib.numpy.model import proto2object
+    from syft.proto.lib.numpy.model_pb2 import ModelProto
+
+    forged["memo"] = 0
+    with pytest.raises(TypeError):
+        proto2object(ModelProto(skeleton=json.dumps(forged)))
@@ -66,8 +66,8 @@ def test_glm(root_client: sy.VirtualMachineClient) -> None:
                 _y_ptr, _x_ptr, family=family(link=link())
             )
             remote_result = remote_model.fit()
-            # `get` corresponds to `summary().as_csv()`
-            remote_summary = remote_result.get()
+            # `get` returns the fitted results along with their model
+            remote_summary = remote_result.get().summary().as_csv()
 
             # remove unnnecessary strings such as proccesing time and date
             summary = re.sub(UNNECESSARY_STR, "", summary)
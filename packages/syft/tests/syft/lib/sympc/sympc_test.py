@@ -1,9 +1,14 @@
+# stdlib
+from typing import Any
+from typing import Callable
+
 # third party
 import pytest
 import torch as th
 
 # syft absolute
 import syft as sy
+from syft.core.node.common.action.save_objects_action import SaveObjectsAction
 
 sympc = pytest.importorskip("sympc")
 Session = sympc.session.Session
@@ -29,3 +34,50 @@ def test_load_sympc() -> None:
     x = MPCTensor(secret=x_secret, shape=(1,), session=session)
 
     assert ((x + y).reconstruct() == th.Tensor([25.0, 30.0, 31.0, 32.0, 33.0])).all()
+
+
+@pytest.mark.vendor(lib="sympc")
+def test_share_tensor_raw_serde() -> None:
+    share = sympc.tensor.ShareTensor(data=None, config=sympc.config.Config())
+    share.tensor = th.tensor([[-3, 0], [2 ** 40, 7]], dtype=th.int64)
+
+    result = sy.deserialize(sy.serialize(share))
+
+    assert result.config == share.config
+    assert result.tensor.dtype == th.int64
+    assert (result.tensor == share.tensor).all()
+
+
+@pytest.mark.vendor(lib="sympc")
+def test_batched_shares(count_messages: Callable) -> None:
+    nodes = [sy.VirtualMachine() for _ in range(3)]
+    parties = [node.get_root_client() for node in nodes]
+    session = Session(parties=parties)
+    SessionManager.setup_mpc(session)
+
+    batches = [count_messages(node, SaveObjectsAction) for node in nodes]
+
+    # a method set on the client itself, e.g. by an outer batcher
+    outer = parties[0]
+    outer_send = outer.send_immediate_msg_without_reply
+
+    def own_send(msg: Any, *args: Any, **kwargs: Any) -> Any:
+        return outer_send(msg, *args, **kwargs)
+
+    outer.send_immediate_msg_without_reply = own_send  # type: ignore
+
+    with sy.lib.sympc.batch.batched_shares(session):
+        assert all(
+            vars(party)["send_immediate_msg_without_reply"] is not own_send
+            for party in parties
+        )
+        x = MPCTensor(secret=th.Tensor([1, 2, 3]), shape=(3,), session=session)
+        y = MPCTensor(secret=th.Tensor([4, 5, 6]), shape=(3,), session=session)
+        assert ((x + y).reconstruct() == th.Tensor([5.0, 7.0, 9.0])).all()
+
+    assert any(batches)
+    # the clients are restored
+    assert outer.send_immediate_msg_without_reply is own_send
+    assert all(
+        "send_immediate_msg_without_reply" not in vars(party) for party in parties[1:]
+    )
@@ -7,6 +7,8 @@ import pytest
 
 # syft absolute
 import syft as sy
+from syft.core.common.serde.scope import SERIALIZE
+from syft.core.common.serde.scope import serde_scope
 
 # syft relative
 from .utils_test import decrypt
@@ -382,3 +384,88 @@ def test_tenseal_ckksvector_matmul(
 
     result = decrypt(context, enc_v1_ptr)
     _almost_equal(result, [157, -90, 153])
+
+
+@pytest.mark.vendor(lib="tenseal")
+def test_tenseal_ckksvector_context_by_id(
+    context: Any, root_client: sy.VirtualMachineClient
+) -> None:
+    v1 = [0, 1, 2, 3, 4]
+    v2 = [4, 3, 2, 1, 0]
+
+    context.send(root_client, pointable=True)
+    enc_v1 = ts.ckks_vector(context, v1)
+    enc_v2 = ts.ckks_vector(context, v2)
+
+    # the vectors refer to the context sent before instead of carrying it
+    with serde_scope(SERIALIZE, address=root_client.address):
+        proto = sy.serialize(enc_v1)
+    assert proto.context_id and not proto.context
+
+    enc_v1_ptr = enc_v1.send(root_client, pointable=True)
+    enc_v2_ptr = enc_v2.send(root_client, pointable=True)
+
+    result = decrypt(context, enc_v1_ptr + enc_v2_ptr)
+    _almost_equal(result, [4, 4, 4, 4, 4])
+
+
+@pytest.mark.vendor(lib="tenseal")
+def test_tenseal_ckksvector_embedded_context(
+    context: Any, root_client: sy.VirtualMachineClient
+) -> None:
+    enc_v1 = ts.ckks_vector(context, [0, 1, 2, 3, 4])
+
+    # a context never sent goes along with the first vector, and only the first
+    enc_v1_ptr = enc_v1.send(root_client, pointable=True)
+    with serde_scope(SERIALIZE, address=root_client.address):
+        assert not sy.serialize(enc_v1).context
+
+    other = ts.context(
+        ts.SCHEME_TYPE.CKKS, 8192, coeff_mod_bit_sizes=[60, 40, 40, 60], n_threads=1
+    )
+    other.global_scale = pow(2, 40)
+    proto = sy.serialize(ts.ckks_vector(other, [1]))
+    assert not ts.context_from(proto.context).has_secret_key()
+
+    result = decrypt(context, enc_v1_ptr * [2, 2, 2, 2, 2])
+    _almost_equal(result, [0, 2, 4, 6, 8])
+
+
+@pytest.mark.vendor(lib="tenseal")
+def test_tenseal_ckksvector_context_per_node(
+    context: Any, root_client: sy.VirtualMachineClient
+) -> None:
+    bob = sy.VirtualMachine(name="bob").get_root_client()
+    context.send(root_client, pointable=True)
+    enc_v1 = ts.ckks_vector(context, [0, 1, 2, 3, 4])
+
+    # a node the context was never sent to gets it with the first vector
+    with serde_scope(SERIALIZE, address=bob.address):
+        proto = sy.serialize(enc_v1)
+    assert proto.context_id and proto.context
+    assert not ts.context_from(proto.context).has_secret_key()
+
+    with serde_scope(SERIALIZE, address=bob.address):
+        assert not sy.serialize(enc_v1).context
+
+    # outside of a message there is no telling who has it
+    assert sy.serialize(enc_v1).context
+
+    result = decrypt(context, enc_v1.send(bob, pointable=True) * 2)
+    _almost_equal(result, [0, 2, 4, 6, 8])
+
+
+@pytest.mark.vendor(lib="tenseal")
+def test_tenseal_ckksvector_send_stream(
+    context: Any, root_client: sy.VirtualMachineClient
+) -> None:
+    context.send(root_client, pointable=True)
+    rows = [[i, i + 1, i + 2] for i in range(10)]
+
+    ptrs = sy.lib.tenseal.stream.send_stream(
+        (ts.ckks_vector(context, row) for row in rows), root_client, chunk_size=4
+    )
+
+    assert len(ptrs) == len(rows)
+    for ptr, row in zip(ptrs, rows):
+        _almost_equal(decrypt(context, ptr + 1), [x + 1 for x in row])
@@ -54,3 +54,13 @@ def test_relu_module() -> None:
     assert type(relu) == type(relu2)
     rand_output2 = relu2(rand_data)
     assert (rand_output2 == rand_output).all()
+
+
+def test_module_buffers_serde() -> None:
+    bn = th.nn.BatchNorm1d(3)
+    bn(th.randn(4, 3))
+
+    bn2 = sy.deserialize(sy.serialize(bn))
+    assert th.equal(bn2.running_mean, bn.running_mean)
+    assert th.equal(bn2.running_var, bn.running_var)
+    assert th.equal(bn2.num_batches_tracked, bn.num_batches_tracked)
@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 import time
 from typing import Any
+from typing import Callable
 from typing import Tuple
 
 # third party
@@ -15,6 +16,7 @@ import torch as th
 import syft as sy
 from syft import SyModule
 from syft import SySequential
+from syft.core.node.common.action.get_object_action import GetObjectAction
 from syft.core.plan.plan import Plan
 from syft.core.plan.plan_builder import ROOT_CLIENT
 from syft.core.plan.plan_builder import make_plan
@@ -267,14 +269,16 @@ def test_module_gradient_sanity(
 
 
 @pytest.mark.slow
+@pytest.mark.parametrize("bulk", [True, False])
 def test_module_send_get(
+    bulk: bool,
     root_client: sy.VirtualMachineClient,
     model: SyNet,
     dataloader: Tuple[torch.Tensor, torch.Tensor],
 ) -> None:
     data, labels = dataloader
 
-    model_ptr = model.send(root_client)
+    model_ptr = model.send(root_client, bulk=bulk)
     data_ptr = data.send(root_client)
     labels_ptr = labels.send(root_client)
 
@@ -287,12 +291,16 @@ def test_module_send_get(
     for param in direct_param:
         assert param.grad is not None
 
-    # get() uses state_dict/load_state_dict
-    # load_state_dict breaks the computational graph, and we won't have the gradients here.
-    # ref: https://discuss.pytorch.org/t/loading-a-state-dict-seems-to-erase-grad/56676
-    model_parameter = model_ptr.get().parameters()
+    model_parameter = model_ptr.get(bulk=bulk).parameters()
     for param in model_parameter:
-        assert param.grad is None
+        if bulk:
+            # the parameters are serialized with their gradients
+            assert param.grad is not None
+        else:
+            # get() uses state_dict/load_state_dict
+            # load_state_dict breaks the computational graph, and we won't have the gradients here.
+            # ref: https://discuss.pytorch.org/t/loading-a-state-dict-seems-to-erase-grad/56676
+            assert param.grad is None
 
     for idx, param in enumerate(direct_param):
         assert param.tolist() == model_parameter[idx].tolist()
@@ -303,6 +311,97 @@ def test_module_send_get(
     assert model.send(root_client) is None
 
 
+class SyConvNet(sy.Module):
+    def __init__(self, torch_ref: Any) -> None:
+        super(SyConvNet, self).__init__(torch_ref=torch_ref)
+        self.conv1 = torch_ref.nn.Conv2d(1, 4, kernel_size=3, bias=False)
+        self.bn1 = torch_ref.nn.BatchNorm2d(4)
+        self.fc1 = torch_ref.nn.Linear(64, 2)
+
+    def forward(self, x: Any) -> Any:
+        x = self.bn1(self.conv1(x))
+        return self.fc1(x.flatten(1))
+
+
+@pytest.mark.slow
+def test_module_bulk_send_get(
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    count_messages: Callable,
+) -> None:
+    model = SyConvNet(torch_ref=torch)
+    # give the BatchNorm running stats which aren't parameters
+    model.train()
+    model(torch.randn(8, 1, 6, 6))
+    model.eval()
+    data = torch.randn(2, 1, 6, 6)
+
+    model_ptr = model.send(root_client)
+    assert type(model_ptr.conv1).__name__ == "Conv2dPointer"
+    # like constructing them, deserializing the layers sets them to training
+    model_ptr.eval()
+    assert torch.allclose(model_ptr(data).get(), model(data))
+
+    gets = count_messages(node, GetObjectAction)
+
+    local_model = model_ptr.get()
+    # the whole model is downloaded with a single request
+    assert len(gets) == 1
+    assert local_model.is_local
+    assert list(local_model.modules.keys()) == ["conv1", "bn1", "fc1"]
+    for name, value in model.state_dict().items():
+        assert torch.equal(local_model.state_dict()[name], value)
+    local_model.eval()
+    assert torch.allclose(local_model(data), model(data))
+
+
+@pytest.mark.slow
+def test_module_push_pull(
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    count_messages: Callable,
+) -> None:
+    model = SyConvNet(torch_ref=torch)
+    remote_model = model.send(root_client)
+    assert remote_model.local_model is model
+
+    # the first pull brings everything, the next syncs only the changes
+    remote_model.pull()
+    with torch.no_grad():
+        model.fc1.bias.add_(1)
+    assert model.push() is remote_model
+    assert torch.equal(remote_model.fc1.bias.get(delete_obj=False), model.fc1.bias)
+    assert len(model._tracker().changes()) == 0
+
+    # train the last layer remotely
+    optim = root_client.torch.optim.SGD(params=remote_model.fc1.parameters(), lr=0.1)
+    out = remote_model(torch.randn(2, 1, 6, 6))
+    out.sum().backward()
+    optim.step()
+    remote_fc1 = remote_model.fc1.get(delete_obj=False)
+
+    gets = count_messages(node, GetObjectAction)
+
+    assert remote_model.pull() is model
+    assert len(gets) == 1
+    assert torch.equal(model.fc1.weight, remote_fc1.weight)
+    assert torch.equal(model.fc1.bias, remote_fc1.bias)
+
+
+@pytest.mark.slow
+def test_module_pull_compressed(root_client: sy.VirtualMachineClient) -> None:
+    remote_model = SyConvNet(torch_ref=root_client.torch)
+
+    local_model = remote_model.pull(compression="int8")
+    assert local_model is remote_model.local_model
+    with torch.no_grad():
+        local_model.fc1.weight.add_(0.01)
+    local_model.push(compression="int8")
+
+    remote_weight = remote_model.fc1.weight.get(delete_obj=False)
+    assert torch.allclose(remote_weight, local_model.fc1.weight, atol=1e-4)
+
+
 @pytest.mark.slow
 def test_debug_sum_layers(root_client: sy.VirtualMachineClient, model: SyNet) -> None:
     assert model.debug_sum_layers() is None
@@ -0,0 +1,69 @@
+# third party
+import pytest
+import torch
+
+# syft absolute
+from syft.lib.torch.state_sync import StateTracker
+
+
+def make_pair() -> tuple:
+    sender = torch.nn.Sequential(torch.nn.Linear(4, 3), torch.nn.BatchNorm1d(3))
+    receiver = torch.nn.Sequential(torch.nn.Linear(4, 3), torch.nn.BatchNorm1d(3))
+    return sender, StateTracker(sender), receiver, StateTracker(receiver)
+
+
+def test_changes_only_changed_tensors() -> None:
+    sender, sender_tracker, receiver, receiver_tracker = make_pair()
+
+    # the first sync sends everything
+    changes = sender_tracker.changes()
+    assert set(changes.keys()) == set(sender.state_dict().keys())
+    receiver_tracker.apply(changes)
+    for name, value in sender.state_dict().items():
+        assert torch.equal(receiver.state_dict()[name], value)
+
+    assert len(sender_tracker.changes()) == 0
+
+    with torch.no_grad():
+        sender[0].bias.add_(1)
+    changes = sender_tracker.changes()
+    assert list(changes.keys()) == ["0.bias"]
+    receiver_tracker.apply(changes)
+    assert torch.equal(receiver[0].bias, sender[0].bias)
+
+    # the receiver doesn't send back what it received
+    assert len(receiver_tracker.changes()) == 0
+
+
+@pytest.mark.parametrize("compression", ["fp16", "int8"])
+def test_compressed_changes(compression: str) -> None:
+    sender, sender_tracker, receiver, receiver_tracker = make_pair()
+    receiver_tracker.apply(sender_tracker.changes(compression=compression))
+
+    for _ in range(3):
+        with torch.no_grad():
+            sender[0].weight.add_(torch.randn(3, 4) * 0.01)
+        changes = sender_tracker.changes(compression=compression)
+        assert str(changes["0.weight"][0]) == compression
+        receiver_tracker.apply(changes)
+
+        # both ends agree on the value the receiver has
+        assert torch.equal(receiver[0].weight, sender_tracker._synced["0.weight"])
+        assert torch.allclose(receiver[0].weight, sender[0].weight, atol=1e-3)
+
+    # integer buffers are always sent as they are
+    sender[1].num_batches_tracked.add_(1)
+    changes = sender_tracker.changes(compression=compression)
+    assert str(changes["1.num_batches_tracked"][0]) == "full"
+
+
+def test_mark_synced() -> None:
+    sender, sender_tracker, _, _ = make_pair()
+    sender_tracker.mark_synced()
+    assert len(sender_tracker.changes()) == 0
+
+
+def test_unknown_compression() -> None:
+    _, sender_tracker, _, _ = make_pair()
+    with pytest.raises(ValueError):
+        sender_tracker.changes(compression="zip")
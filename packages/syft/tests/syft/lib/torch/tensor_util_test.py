@@ -22,3 +22,55 @@ def test_protobuf_tensor_serializer_deserializer(tensor: th.Tensor) -> None:
     tensor2_serial = sy.lib.torch.tensor_util.protobuf_tensor_deserializer(tensor2)
     assert tensor2_serial.is_quantized is True
     assert tuple(tensor2_serial.shape) == tuple(tensor.shape)
+
+
+def test_shared_storage_serde() -> None:
+    # large enough for the storage to outweigh the metadata of each tensor
+    weight = th.randn(1000, 100)
+    data = sy.lib.python.List([weight, weight, weight.t(), weight[1:3]])
+
+    blob = sy.serialize(data, to_bytes=True)
+    alone = sy.serialize(sy.lib.python.List([weight]), to_bytes=True)
+    # the storage is written once
+    assert len(blob) < 2 * len(alone)
+
+    tensors = sy.deserialize(blob, from_bytes=True)
+    for result, expected in zip(tensors, data):
+        assert th.equal(result, expected)
+    # and shared again
+    storages = {t.storage().data_ptr() for t in tensors}
+    assert len(storages) == 1
+    tensors[0].add_(1)
+    assert th.equal(tensors[2], tensors[0].t())
+
+
+def test_slice_before_storage_serde() -> None:
+    weight = th.randn(10)
+    data = sy.lib.python.List([weight[:2], weight])
+
+    tensors = sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+    assert th.equal(tensors[0], weight[:2])
+    assert th.equal(tensors[1], weight)
+
+
+@pytest.mark.parametrize(
+    "tensor", [th.randn(3, 4), th.randn(4, 3).t(), th.randn(10)[2:5]]
+)
+def test_unshared_storage_keeps_contents(tensor: th.Tensor) -> None:
+    proto = sy.serialize(tensor)
+    # read the way peers without shared storages read it
+    contents = th.tensor(proto.tensor.contents_float32).reshape(
+        tuple(proto.tensor.shape)
+    )
+    assert th.equal(contents, tensor)
+    assert th.equal(sy.deserialize(proto), tensor)
+
+
+def test_storage_reference_without_contents() -> None:
+    weight = th.randn(3)
+    data = sy.lib.python.List([weight, weight])
+    proto = sy.serialize(data)
+
+    # the second element only refers to the storage of the first one
+    with pytest.raises(ValueError):
+        sy.deserialize(proto.data[1], from_bytes=True)
@@ -94,3 +94,21 @@ def test_xgb_base_module(root_client: sy.VirtualMachineClient) -> None:
     assert np.array_equal(y_pred_regressor, y_pred_regressor_remote)
     assert np.array_equal(y_pred_classifier, y_pred_classifier_remote)
     assert np.array_equal(preds_remote, preds)
+
+
+@pytest.mark.skipif(_SKIP_XGB, reason="xgboost couldn't properly load")
+@pytest.mark.vendor(lib="xgboost")
+def test_xgb_booster_serde(root_client: sy.VirtualMachineClient) -> None:
+    X = np.array([[-1, -1], [-2, -1], [1, 1], [2, 1]])
+    y = np.array([0, 0, 1, 1])
+    D_train = xgb.DMatrix(X, label=y)
+    model = xgb.train({"eta": 0.3, "max_depth": 3}, D_train, 10)
+
+    model_2 = model.send(root_client).get()
+
+    assert type(model_2) is xgb.core.Booster
+    assert np.array_equal(model_2.predict(D_train), model.predict(D_train))
+
+    regressor = xgb.XGBRegressor(n_estimators=10, max_depth=3).fit(X, y)
+    regressor_2 = regressor.send(root_client).get()
+    assert np.array_equal(regressor_2.predict(X), regressor.predict(X))